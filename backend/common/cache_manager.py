@@ -1,22 +1,34 @@
 #!/usr/bin/env python3
 """
 캐시 관리 모듈
-Redis를 이용한 캐시 시스템을 제공합니다.
+프로세스 내 L1 캐시와 Redis(L2)를 이용한 2단계 캐시 시스템을 제공합니다.
+Redis는 redis.asyncio 클라이언트와 하나의 공유 커넥션 풀로 접근합니다.
 """
 
+import asyncio
+import inspect
 import json
 import hashlib
 import logging
-import os
-from typing import Any, Dict, List, Optional, Union
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from functools import wraps
 
+from config import config
+from local_cache import LocalCache
+from serialization import Serializer
+from spatial import geohash_encode
+from metrics import CACHE_REQUESTS, REDIS_DURATION
+
 logger = logging.getLogger(__name__)
 
 # Redis 의존성 체크
 try:
-    import redis
+    from redis import asyncio as aioredis
+    from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
@@ -24,46 +36,223 @@ except ImportError:
 
 
 class CacheManager:
-    """Redis 기반 캐시 관리자"""
-    
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0, 
-                 password: Optional[str] = None, decode_responses: bool = True,
-                 enabled: bool = True):
+    """L1(프로세스 내) + L2(Redis) 캐시 관리자"""
+
+    INVALIDATION_CHANNEL = "cache:invalidate"
+    RECONNECT_INTERVAL = 30.0
+    SCAN_BATCH = 500
+    TAG_PREFIX = "tag:"
+
+    # 토큰이 일치할 때만 락 삭제 (다른 워커가 재획득한 락을 지우지 않도록)
+    _RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+    # 태그 집합에 키를 추가하고, 태그 TTL을 가장 오래 사는 항목 이상으로 유지
+    _TAG_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+for i = 1, #KEYS do
+    redis.call("sadd", KEYS[i], unpack(ARGV, 2))
+    if redis.call("ttl", KEYS[i]) < ttl then
+        redis.call("expire", KEYS[i], ttl)
+    end
+end
+return #KEYS
+"""
+
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                 password: Optional[str] = None, decode_responses: bool = False,
+                 enabled: bool = True, max_connections: int = 50,
+                 l1_enabled: bool = True, l1_max_entries: int = 10000,
+                 l1_max_bytes: int = 64 * 1024 * 1024, l1_ttl: int = 60,
+                 serializer: str = "msgpack", compression: str = "zlib",
+                 compress_threshold: int = 1024):
         """함수명: CacheManager.__init__
-        기능: Redis 연결을 초기화합니다.
+        기능: Redis 커넥션 풀과 L1 캐시를 준비합니다. (실제 연결은 connect() 또는 최초 사용 시)
         요청 파라미터(예시):
-          host="localhost", port=6379, db=0, password=None, enabled=True
+          host="localhost", port=6379, db=0, password=None, enabled=True, max_connections=50,
+          l1_enabled=True, l1_max_entries=10000, l1_max_bytes=67108864, l1_ttl=60,
+          serializer="msgpack", compression="zlib", compress_threshold=1024
         응답 파라미터(예시):
           - 없음 (인스턴스 내부 상태 설정)
         """
         self.enabled = enabled and REDIS_AVAILABLE
-        
+        self.l1 = LocalCache(l1_max_entries, l1_max_bytes) if enabled and l1_enabled else None
+        self.l1_ttl = l1_ttl
+        self.serializer = Serializer(serializer, compression, compress_threshold)
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self.freshness = {"fresh": 0, "miss": 0, "stale": 0, "stale_error": 0, "error": 0}
+        self.single_flight = {"leaders": 0, "coalesced": 0, "lock_acquired": 0,
+                              "lock_waited": 0, "lock_wait_hits": 0}
+        self.connected = False
+        self.redis_client = None
+        self._instance_id = uuid.uuid4().hex
+        self._subscriber_task: Optional[asyncio.Task] = None
+        self._last_connect_attempt = 0.0
+
         if not self.enabled:
             logger.info("캐시가 비활성화되었습니다.")
-            self.redis_client = None
-            self.connected = False
             return
-            
+
+        self._pool = aioredis.ConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            decode_responses=decode_responses,
+            max_connections=max_connections,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+            retry_on_timeout=True
+        )
+        self.redis_client = aioredis.Redis(connection_pool=self._pool)
+
+    async def connect(self) -> bool:
+        """함수명: connect
+        기능: Redis 연결을 확인하고 워커 간 L1 무효화 구독을 시작합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          True (연결 성공) 또는 False (실패/비활성화)
+        """
+        if not self.enabled:
+            return False
+        self._last_connect_attempt = time.monotonic()
         try:
-            self.redis_client = redis.Redis(
-                host=host,
-                port=port,
-                db=db,
-                password=password,
-                decode_responses=decode_responses,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=True
-            )
-            # 연결 테스트
-            self.redis_client.ping()
+            await self.redis_client.ping()
             self.connected = True
             logger.info("✅ Redis 캐시 연결 성공")
         except Exception as e:
             logger.warning(f"⚠️ Redis 연결 실패: {e}")
-            self.redis_client = None
             self.connected = False
-    
+            return False
+
+        if self.l1 is not None and (self._subscriber_task is None or self._subscriber_task.done()):
+            self._subscriber_task = asyncio.create_task(self._listen_invalidation())
+        return True
+
+    async def close(self) -> None:
+        """함수명: close
+        기능: 무효화 구독을 중단하고 커넥션 풀을 닫습니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          - 없음
+        """
+        if self._subscriber_task is not None:
+            self._subscriber_task.cancel()
+            try:
+                await self._subscriber_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._subscriber_task = None
+        if self.enabled:
+            await self._pool.disconnect()
+        self.connected = False
+
+    async def _ready(self) -> bool:
+        """연결 상태를 확인하고, 끊긴 경우 RECONNECT_INTERVAL마다 재연결을 시도"""
+        if self.connected:
+            return True
+        if not self.enabled:
+            return False
+        if time.monotonic() - self._last_connect_attempt < self.RECONNECT_INTERVAL:
+            return False
+        return await self.connect()
+
+    def _handle_error(self, message: str, error: Exception) -> None:
+        """오류를 기록하고, 연결 오류면 재연결 주기까지 Redis 호출을 건너뛰도록 표시"""
+        logger.error(f"{message}: {error}")
+        if isinstance(error, (RedisConnectionError, RedisTimeoutError)):
+            self.connected = False
+
+    async def _listen_invalidation(self) -> None:
+        """함수명: _listen_invalidation
+        기능: 다른 워커의 delete/delete_pattern 메시지를 받아 L1에서 같은 키를 제거합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          - 없음 (백그라운드 태스크로 구독)
+        """
+        while True:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    try:
+                        payload = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        continue
+                    if payload.get("origin") == self._instance_id:
+                        continue
+                    for key in payload.get("keys", []):
+                        self.l1.delete(key)
+                    if payload.get("pattern"):
+                        self.l1.delete_pattern(payload["pattern"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ 캐시 무효화 구독 오류, 재시도합니다: {e}")
+                await asyncio.sleep(self.RECONNECT_INTERVAL)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def _publish_invalidation(self, keys: Optional[List[str]] = None, pattern: Optional[str] = None) -> None:
+        """함수명: _publish_invalidation
+        기능: 다른 워커의 L1 캐시 무효화를 위해 삭제된 키/패턴을 발행합니다.
+        요청 파라미터(예시):
+          keys=["kakao_search:..."] 또는 pattern="kakao_search:*"
+        응답 파라미터(예시):
+          - 없음
+        """
+        if self.l1 is None:
+            return
+        try:
+            payload = {"origin": self._instance_id, "keys": keys or [], "pattern": pattern}
+            await self.redis_client.publish(self.INVALIDATION_CHANNEL, json.dumps(payload, ensure_ascii=False))
+        except Exception as e:
+            logger.warning(f"캐시 무효화 발행 오류: {e}")
+
+    async def acquire_lock(self, key: str, ttl_ms: int) -> Optional[str]:
+        """함수명: acquire_lock
+        기능: 캐시 재계산용 단기 분산 락을 획득합니다. (SET NX PX)
+        요청 파라미터(예시):
+          key="meetup_search:6f1c...", ttl_ms=5000
+        응답 파라미터(예시):
+          "9b2e..." (락 토큰) 또는 None (다른 워커가 보유 중/Redis 미연결)
+        """
+        if not await self._ready():
+            return None
+        token = uuid.uuid4().hex
+        try:
+            if await self.redis_client.set(f"lock:{key}", token, nx=True, px=ttl_ms):
+                return token
+        except Exception as e:
+            self._handle_error("캐시 락 획득 오류", e)
+        return None
+
+    async def release_lock(self, key: str, token: str) -> None:
+        """함수명: release_lock
+        기능: 자신이 획득한 락(토큰 일치)만 해제합니다.
+        요청 파라미터(예시):
+          key="meetup_search:6f1c...", token="9b2e..."
+        응답 파라미터(예시):
+          - 없음
+        """
+        if not self.connected:
+            return
+        try:
+            await self.redis_client.eval(self._RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+        except Exception as e:
+            self._handle_error("캐시 락 해제 오류", e)
+
     def _generate_key(self, prefix: str, *args) -> str:
         """함수명: _generate_key
         기능: 캐시 키를 생성합니다.
@@ -74,7 +263,7 @@ class CacheManager:
         """
         key_parts = [prefix] + [str(arg) for arg in args]
         return ":".join(key_parts)
-    
+
     def _generate_hash_key(self, prefix: str, data: Dict[str, Any]) -> str:
         """함수명: _generate_hash_key
         기능: 복잡한 데이터를 해시하여 캐시 키를 생성합니다.
@@ -86,46 +275,117 @@ class CacheManager:
         data_str = json.dumps(data, sort_keys=True, ensure_ascii=False)
         hash_obj = hashlib.md5(data_str.encode())
         return f"{prefix}:{hash_obj.hexdigest()}"
-    
-    def get(self, key: str) -> Optional[Any]:
+
+    async def get(self, key: str) -> Optional[Any]:
         """함수명: get
-        기능: 캐시에서 데이터를 조회합니다.
+        기능: 캐시에서 데이터를 조회합니다. (L1 → Redis)
         요청 파라미터(예시):
           key="restaurant:37.5665:126.9780:1500"
         응답 파라미터(예시):
           {"restaurants": [...], "timestamp": "2024-01-01T12:00:00"}
         """
-        if not self.enabled or not self.connected:
-            return None
-        
+        return (await self.mget([key]))[0]
+
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """함수명: mget
+        기능: 여러 키를 한 번에 조회합니다. L1 미스 키만 하나의 파이프라인(GET+PTTL)으로 Redis에서 읽습니다.
+        요청 파라미터(예시):
+          keys=["naver_image:설마중", "naver_image:봉피양"]
+        응답 파라미터(예시):
+          ["https://...jpg", None]
+        """
+        results: List[Optional[Any]] = [None] * len(keys)
+        missing: List[int] = []
+        for i, key in enumerate(keys):
+            value = self.l1.get(key) if self.l1 is not None else None
+            if value is not None:
+                results[i] = value
+            else:
+                missing.append(i)
+
+        if not missing or not await self._ready():
+            return results
+
         try:
-            data = self.redis_client.get(key)
-            if data:
-                return json.loads(data)
-            return None
+            # 값과 남은 TTL을 한 번의 왕복으로 조회 (L1 TTL이 Redis TTL을 넘지 않도록)
+            pipe = self.redis_client.pipeline(transaction=False)
+            for i in missing:
+                pipe.get(keys[i])
+                pipe.pttl(keys[i])
+            with REDIS_DURATION.time("mget"):
+                replies = await pipe.execute()
         except Exception as e:
-            logger.error(f"캐시 조회 오류: {e}")
-            return None
-    
-    def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
+            self._handle_error("캐시 조회 오류", e)
+            return results
+
+        for n, i in enumerate(missing):
+            data, pttl = replies[2 * n], replies[2 * n + 1]
+            if not data:
+                self.l2_misses += 1
+                continue
+            try:
+                value = self.serializer.loads(data)
+            except Exception as e:
+                logger.error(f"캐시 역직렬화 오류: {keys[i]} ({e})")
+                continue
+            self.l2_hits += 1
+            results[i] = value
+            if self.l1 is not None and pttl and pttl > 0:
+                self.l1.set(keys[i], value, min(self.l1_ttl, pttl / 1000), len(data))
+        return results
+
+    async def set(self, key: str, value: Any, ttl: int = 3600, tags: Optional[List[str]] = None) -> bool:
         """함수명: set
         기능: 캐시에 데이터를 저장합니다.
         요청 파라미터(예시):
-          key="restaurant:37.5665:126.9780:1500", value={...}, ttl=3600
+          key="restaurant:37.5665:126.9780:1500", value={...}, ttl=3600, tags=["provider:kakao"]
+        응답 파라미터(예시):
+          True (성공) 또는 False (실패)
+        """
+        return await self.mset({key: value}, ttl, tags)
+
+    async def mset(self, items: Dict[str, Any], ttl: int = 3600, tags: Optional[List[str]] = None) -> bool:
+        """함수명: mset
+        기능: 여러 키를 같은 TTL로 하나의 파이프라인에서 저장합니다. tags를 주면 각 태그 집합(tag:<이름>)에
+          키를 함께 등록해 purge_tag로 일괄 삭제할 수 있습니다.
+          L1에는 Redis 연결 전에 먼저 저장하므로 Redis가 내려가 있어도 L1 TTL 동안은 프로세스 내에서 적중합니다.
+          (반환값은 Redis 저장 성공 여부)
+        요청 파라미터(예시):
+          items={"naver_image:설마중": "https://...jpg", "naver_image:봉피양": ""}, ttl=3600,
+          tags=["provider:naver"]
         응답 파라미터(예시):
           True (성공) 또는 False (실패)
         """
-        if not self.enabled or not self.connected:
+        if not items:
             return False
-        
         try:
-            data = json.dumps(value, ensure_ascii=False, default=str)
-            return self.redis_client.setex(key, ttl, data)
+            encoded = {key: self.serializer.dumps(value) for key, value in items.items()}
         except Exception as e:
-            logger.error(f"캐시 저장 오류: {e}")
+            logger.error(f"캐시 직렬화 오류: {e}")
             return False
-    
-    def delete(self, key: str) -> bool:
+
+        # Redis 연결 여부와 무관하게 L1에는 저장 (Redis 장애 중에도 프로세스 내 캐시는 동작)
+        if self.l1 is not None:
+            for key, value in items.items():
+                self.l1.set(key, value, min(self.l1_ttl, ttl), len(encoded[key]))
+        if not await self._ready():
+            return False
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, data in encoded.items():
+                pipe.setex(key, ttl, data)
+            if tags:
+                tag_keys = [self.TAG_PREFIX + tag for tag in tags]
+                pipe.eval(self._TAG_SCRIPT, len(tag_keys), *tag_keys, ttl, *items.keys())
+            with REDIS_DURATION.time("mset"):
+                replies = await pipe.execute()
+            return all(replies[:len(items)])
+        except Exception as e:
+            self._handle_error("캐시 저장 오류", e)
+            return False
+
+    async def delete(self, key: str) -> bool:
         """함수명: delete
         기능: 캐시에서 데이터를 삭제합니다.
         요청 파라미터(예시):
@@ -133,114 +393,522 @@ class CacheManager:
         응답 파라미터(예시):
           True (성공) 또는 False (실패)
         """
-        if not self.enabled or not self.connected:
+        if self.l1 is not None:
+            self.l1.delete(key)
+
+        if not await self._ready():
             return False
-        
+
         try:
-            return bool(self.redis_client.delete(key))
+            await self._publish_invalidation(keys=[key])
+            return bool(await self.redis_client.delete(key))
         except Exception as e:
-            logger.error(f"캐시 삭제 오류: {e}")
+            self._handle_error("캐시 삭제 오류", e)
             return False
-    
-    def delete_pattern(self, pattern: str) -> int:
+
+    async def _unlink_batches(self, keys) -> int:
+        """비동기 키 이터레이터를 SCAN_BATCH 단위로 UNLINK(메모리 해제는 Redis 백그라운드 스레드)"""
+        deleted = 0
+        batch: List[Any] = []
+        async for key in keys:
+            batch.append(key)
+            if len(batch) >= self.SCAN_BATCH:
+                deleted += await self.redis_client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await self.redis_client.unlink(*batch)
+        return deleted
+
+    async def delete_pattern(self, pattern: str) -> int:
         """함수명: delete_pattern
-        기능: 패턴에 맞는 캐시 키들을 삭제합니다.
+        기능: 패턴에 맞는 캐시 키들을 삭제합니다. KEYS 대신 SCAN으로 나눠 순회하므로 Redis를 막지 않고,
+          SCAN_BATCH개씩 UNLINK합니다.
         요청 파라미터(예시):
           pattern="restaurant:*"
         응답 파라미터(예시):
           5 (삭제된 키 개수)
         """
-        if not self.enabled or not self.connected:
+        if self.l1 is not None:
+            self.l1.delete_pattern(pattern)
+
+        if not await self._ready():
             return 0
-        
+
         try:
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                return self.redis_client.delete(*keys)
+            await self._publish_invalidation(pattern=pattern)
+            return await self._unlink_batches(
+                self.redis_client.scan_iter(match=pattern, count=self.SCAN_BATCH)
+            )
+        except Exception as e:
+            self._handle_error("패턴 캐시 삭제 오류", e)
+            return 0
+
+    async def purge_tag(self, tag: str) -> int:
+        """함수명: purge_tag
+        기능: 태그에 등록된 캐시 키들을 삭제합니다. 태그 집합을 먼저 임시 키로 RENAME해
+          삭제 중에 새로 등록되는 키는 다음 태그 집합에 남도록 하고, SSCAN으로 나눠 UNLINK합니다.
+        요청 파라미터(예시):
+          tag="provider:kakao" 또는 "region:wydm6"
+        응답 파라미터(예시):
+          42 (삭제된 키 개수, 이미 만료된 키 제외)
+        """
+        if not await self._ready():
             return 0
+
+        tag_key = self.TAG_PREFIX + tag
+        purging_key = f"{tag_key}:purging:{uuid.uuid4().hex}"
+        try:
+            await self.redis_client.rename(tag_key, purging_key)
+        except Exception as e:
+            if "no such key" in str(e).lower():
+                return 0
+            self._handle_error("태그 캐시 삭제 오류", e)
+            return 0
+
+        pending: List[str] = []
+
+        async def members():
+            async for key in self.redis_client.sscan_iter(purging_key, count=self.SCAN_BATCH):
+                key = key.decode() if isinstance(key, bytes) else key
+                if self.l1 is not None:
+                    self.l1.delete(key)
+                    pending.append(key)
+                    if len(pending) >= self.SCAN_BATCH:
+                        await self._publish_invalidation(keys=pending[:])
+                        pending.clear()
+                yield key
+
+        try:
+            deleted = await self._unlink_batches(members())
+            if pending:
+                await self._publish_invalidation(keys=pending)
+            await self.redis_client.unlink(purging_key)
+            logger.info(f"🏷️ 태그 캐시 삭제: {tag} ({deleted}개)")
+            return deleted
         except Exception as e:
-            logger.error(f"패턴 캐시 삭제 오류: {e}")
+            self._handle_error("태그 캐시 삭제 오류", e)
             return 0
-    
-    def get_stats(self) -> Dict[str, Any]:
+
+    async def get_stats(self) -> Dict[str, Any]:
         """함수명: get_stats
         기능: 캐시 통계 정보를 반환합니다.
         요청 파라미터(예시):
           - 없음
         응답 파라미터(예시):
-          {"connected": true, "keys": 150, "memory": "2.5MB"}
+          {"connected": true, "keys": 150, "memory": "2.5MB",
+           "l1": {"hits": 900, "misses": 100, "hit_rate": 0.9, ...},
+           "l2": {"hits": 80, "misses": 20, "hit_rate": 0.8},
+           "pool": {"max_connections": 50, "in_use": 1, "available": 2}}
         """
         if not self.enabled:
             return {"connected": False, "enabled": False, "reason": "캐시가 비활성화됨"}
-        
-        if not self.connected:
+
+        l2_lookups = self.l2_hits + self.l2_misses
+        tiers = {
+            "l1": self.l1.get_stats() if self.l1 is not None else {"enabled": False},
+            "l2": {
+                "hits": self.l2_hits,
+                "misses": self.l2_misses,
+                "hit_rate": round(self.l2_hits / l2_lookups, 4) if l2_lookups else 0.0,
+            },
+            "single_flight": dict(self.single_flight),
+            "freshness": dict(self.freshness),
+            "serializer": {
+                "format": self.serializer.fmt,
+                "compression": self.serializer.compression,
+                "threshold": self.serializer.threshold,
+            },
+            "pool": {
+                "max_connections": self._pool.max_connections,
+                "in_use": len(getattr(self._pool, "_in_use_connections", ())),
+                "available": len(getattr(self._pool, "_available_connections", ())),
+            },
+        }
+
+        if not await self._ready():
             return {"connected": False, "enabled": True, "reason": "Redis 연결 실패"}
-        
+
         try:
-            info = self.redis_client.info()
+            info = await self.redis_client.info()
             return {
                 "connected": True,
                 "enabled": True,
                 "keys": info.get("db0", {}).get("keys", 0),
                 "memory": f"{info.get('used_memory_human', '0B')}",
                 "hits": info.get("keyspace_hits", 0),
-                "misses": info.get("keyspace_misses", 0)
+                "misses": info.get("keyspace_misses", 0),
+                **tiers,
             }
         except Exception as e:
             logger.error(f"캐시 통계 조회 오류: {e}")
-            return {"connected": False, "enabled": True, "error": str(e)}
+            return {"connected": False, "enabled": True, "error": str(e), **tiers}
+
+
+COORD_FIELDS = frozenset({"lat", "lng", "latitude", "longitude"})
+
+
+def _quantize(value: float, grid: float) -> float:
+    """좌표를 grid(도) 간격의 격자점으로 양자화 (grid가 0이면 소수 6자리 반올림)"""
+    if grid > 0:
+        return round(round(value / grid) * grid, 7)
+    return round(value, 6)
+
+
+def canonicalize(value: Any, name: Optional[str] = None, grid: float = 0.0,
+                 unordered: Iterable[str] = ()) -> Any:
+    """함수명: canonicalize
+    기능: 캐시 키용으로 인자 값을 정규화합니다.
+      - 실수는 소수 6자리로 반올림하고, 좌표 필드(lat/lng)는 grid 간격으로 양자화
+      - unordered에 이름이 있는 좌표 dict 리스트(users 등)만 (lat, lng) 순으로 정렬해 입력 순서와 무관하게 만듦
+        (결과가 입력 순서에 의존하는 함수는 정렬하면 안 되므로 기본값은 순서 유지)
+      - dict는 키 정렬, 문자열은 앞뒤 공백 제거
+    요청 파라미터(예시):
+      value=[{"lat": 37.5665, "lng": 126.978}, {"lng": 127.11070001, "lat": 37.3943}], name="users",
+      unordered=("users",)
+    응답 파라미터(예시):
+      [{"lat": 37.3943, "lng": 127.1107}, {"lat": 37.5665, "lng": 126.978}]
+    """
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        if name in COORD_FIELDS:
+            return _quantize(float(value), grid)
+        return round(value, 6) if isinstance(value, float) else value
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        return {str(k): canonicalize(v, str(k), grid, unordered)
+                for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        items = [canonicalize(v, None, grid, unordered) for v in value]
+        if name in unordered and items and all(isinstance(v, dict) and "lat" in v and "lng" in v for v in items):
+            items.sort(key=lambda v: (v["lat"], v["lng"]))
+        return items
+    return str(value)
+
+
+def build_cache_key(prefix: str, signature: inspect.Signature, args: tuple, kwargs: dict,
+                    grid: float = 0.0, unordered: Iterable[str] = ()) -> str:
+    """함수명: build_cache_key
+    기능: 함수 시그니처에 인자를 바인딩해 self/cls를 제외하고 정규화한 뒤 해시한 캐시 키를 생성합니다.
+      (같은 요청은 워커/재시작과 무관하게 같은 키를 가짐, unordered에 있는 인자는 좌표 순서와도 무관)
+    요청 파라미터(예시):
+      prefix="kakao_search", signature=<Signature (self, lat, lng, radius, query, size)>,
+      args=(service, 37.4804, 127.04435, 1500, "한식 맛집", 5), kwargs={}, grid=0.0005, unordered=()
+    응답 파라미터(예시):
+      "kakao_search:6f1c2a0e9b7d4c3a8e5f1b2d"
+    """
+    try:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = {k: v for k, v in bound.arguments.items() if k not in ("self", "cls")}
+    except TypeError:
+        arguments = {"args": list(args), "kwargs": kwargs}
+    canonical = canonicalize(arguments, None, grid, unordered)
+    payload = json.dumps(canonical, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=12).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def region_tag(lat: float, lng: float, precision: Optional[int] = None) -> str:
+    """함수명: region_tag
+    기능: 좌표가 속한 geohash 셀의 지역 태그를 반환합니다. (purge_tag로 지역 단위 캐시 삭제)
+    요청 파라미터(예시):
+      lat=37.4979, lng=127.0276, precision=5
+    응답 파라미터(예시):
+      "region:wydm6"
+    """
+    cell = geohash_encode(lat, lng, precision or config.CACHE_TAG_REGION_PRECISION)
+    return f"region:{cell}"
+
+
+# 프로세스 내 진행 중인 캐시 재계산 (키 → 태스크)
+_inflight: Dict[str, "asyncio.Task"] = {}
+
+# 현재 요청에서 캐시가 반환한 값의 신선도 기록 [(prefix, status, age), ...]
+_freshness_log: ContextVar[Optional[List[Tuple[str, str, float]]]] = ContextVar("cache_freshness", default=None)
+
+# 신선도 상태 (뒤로 갈수록 오래된 데이터, error는 stale 값도 없어 error_result로 대체한 경우)
+FRESHNESS_ORDER = ("fresh", "miss", "stale", "stale_error", "error")
+
+# 이 상태가 기록된 계산 결과는 상위 캐시에 저장하지 않음 (제공자 장애가 한 단계 위에서 캐시되는 것 방지)
+DEGRADED_FRESHNESS = frozenset({"stale_error", "error"})
+
+
+class FreshnessTracker:
+    """요청 단위로 캐시 신선도를 수집하는 컨텍스트 관리자
+
+    with track_freshness() as tracker:
+        content = await handler(arguments)
+    tracker.summary()  # {"status": "stale", "max_age": 1210.5, "sources": {"kakao_search": "stale"}}
+    """
 
+    def __init__(self):
+        self.records: List[Tuple[str, str, float]] = []
+        self._token = None
 
-def cache_result(prefix: str, ttl: int = 3600, key_func: Optional[callable] = None, enabled: bool = True):
+    def __enter__(self) -> "FreshnessTracker":
+        self._token = _freshness_log.set(self.records)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _freshness_log.reset(self._token)
+
+    @property
+    def degraded(self) -> bool:
+        """하위 캐시가 오류로 stale 값이나 error_result를 대신 반환한 적이 있는지 여부"""
+        return any(status in DEGRADED_FRESHNESS for _, status, _ in self.records)
+
+    def summary(self) -> Dict[str, Any]:
+        """함수명: summary
+        기능: 가장 오래된 상태를 대표값으로 하는 신선도 요약을 반환합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          {"status": "stale", "max_age": 1210.5, "sources": {"meetup_search": "miss", "kakao_search": "stale"}}
+        """
+        if not self.records:
+            return {"status": "fresh", "max_age": 0.0, "sources": {}}
+        sources: Dict[str, str] = {}
+        for prefix, status, _ in self.records:
+            if FRESHNESS_ORDER.index(status) >= FRESHNESS_ORDER.index(sources.get(prefix, "fresh")):
+                sources[prefix] = status
+        status = max(sources.values(), key=FRESHNESS_ORDER.index)
+        return {
+            "status": status,
+            "max_age": round(max(age for _, _, age in self.records), 1),
+            "sources": sources,
+        }
+
+
+def track_freshness() -> FreshnessTracker:
+    """함수명: track_freshness
+    기능: 현재 요청의 캐시 신선도 수집을 시작합니다. (with 문과 함께 사용)
+    요청 파라미터(예시):
+      - 없음
+    응답 파라미터(예시):
+      FreshnessTracker 인스턴스
+    """
+    return FreshnessTracker()
+
+
+def _record_freshness(prefix: str, status: str, age: float = 0.0) -> None:
+    cache_manager.freshness[status] += 1
+    CACHE_REQUESTS.inc(prefix, status)
+    records = _freshness_log.get()
+    if records is not None:
+        records.append((prefix, status, age))
+
+
+def _wrap(value: Any) -> Dict[str, Any]:
+    """stale-while-revalidate용 저장 형식 (값 + 저장 시각)"""
+    return {"__swr__": 1, "v": value, "t": time.time()}
+
+
+def _unwrap(cached: Any) -> Tuple[Any, Optional[float]]:
+    """저장 형식을 풀어 (값, 경과 시간)을 반환 (이전 형식 값은 경과 시간 None)"""
+    if isinstance(cached, dict) and cached.get("__swr__") == 1:
+        return cached.get("v"), max(0.0, time.time() - cached.get("t", 0))
+    return cached, None
+
+
+async def _wait_for_refill(cache_key: str, wait: float) -> Optional[Any]:
+    """다른 워커가 락을 보유한 동안 최대 wait초까지 캐시가 채워지기를 기다림"""
+    deadline = time.monotonic() + wait
+    delay = 0.05
+    while time.monotonic() < deadline:
+        await asyncio.sleep(delay)
+        value = await cache_manager.get(cache_key)
+        if value is not None:
+            return value
+        delay = min(delay * 2, 0.4)
+    return None
+
+
+_NO_RESULT = object()
+
+
+def cache_result(prefix: str, ttl: int = 3600, key_func: Optional[callable] = None, enabled: bool = True,
+                 quantize_coords: bool = False, single_flight: bool = True,
+                 distributed_lock: Optional[bool] = None, stale_ttl: int = 0,
+                 error_result: Any = _NO_RESULT,
+                 tags: Optional[Union[List[str], Callable[..., List[str]]]] = None,
+                 result_tags: Optional[Callable[[Any], List[str]]] = None,
+                 order_insensitive: Tuple[str, ...] = ()):
     """함수명: cache_result
-    기능: 함수 결과를 캐시하는 데코레이터입니다.
+    기능: 함수 결과를 캐시하는 데코레이터입니다. 모든 데코레이터는 전역 cache_manager(공유 커넥션 풀)를 사용합니다.
+      기본 키는 build_cache_key로 만든 정규화 해시 키이며, quantize_coords=True이면 좌표를
+      Config.CACHE_KEY_COORD_GRID 격자로 양자화해 가까운 동일 검색이 같은 항목을 공유합니다.
+      order_insensitive에 지정한 인자(좌표 dict 리스트)는 정렬해서 키를 만듭니다. 결과가 그 인자의 순서에
+      의존하면 같은 키를 쓰는 다른 순서의 호출이 서로의 결과를 받으므로, 호출자가 결과를 자기 순서로 되돌려야 합니다.
+      데코레이트된 함수의 cache_key(*args, **kwargs)로 같은 키를 계산할 수 있어 mget 일괄 조회에 활용됩니다.
+      peek(*args, **kwargs)는 함수를 실행하지 않고 캐시 값만 조회하고, prime(result, *args, **kwargs)는
+      함수 밖에서 단계별로 계산한 결과(스트리밍 응답 등)를 같은 키로 저장합니다.
+      single_flight=True이면 같은 키의 동시 미스는 프로세스 내에서 하나의 실행 결과를 함께 기다리고,
+      distributed_lock(기본값 Config.CACHE_LOCK_ENABLED)이 켜져 있으면 Redis 단기 락으로 워커 간에도
+      한 워커만 재계산하며 나머지는 stale 값을 받거나 CACHE_LOCK_WAIT초 동안 캐시가 채워지기를 기다립니다.
+      stale_ttl > 0이면 ttl은 soft TTL이 되고 Redis 항목은 ttl + stale_ttl(hard TTL)까지 유지됩니다.
+      soft TTL이 지난 값은 즉시 반환하면서 백그라운드에서 갱신하고(stale-while-revalidate),
+      함수가 예외를 던지면 hard TTL 내의 stale 값을 대신 반환합니다. stale 값도 없으면 error_result
+      (지정한 경우, 캐시하지 않음, 신선도 error)를 반환하거나 예외를 그대로 전달합니다.
+      함수 실행 중 하위 캐시가 stale_error/error를 기록했으면 그 결과는 반환만 하고 저장하지 않습니다.
+      tags는 태그 목록 또는 함수와 같은 인자를 받아 태그 목록을 돌려주는 함수이며,
+      저장되는 항목을 해당 태그 집합에 등록합니다. (cache_manager.purge_tag로 일괄 삭제)
+      result_tags는 저장할 결과를 받아 태그 목록을 돌려주는 함수로, 결과에서 이미 계산된 값(중간 지점 등)으로
+      태그를 만들 때 사용하며 tags와 합쳐 등록합니다.
     요청 파라미터(예시):
-      @cache_result("restaurant", ttl=1800, enabled=True)
-      def search_restaurants(lat, lng, radius):
+      @cache_result("restaurant", ttl=1800, enabled=True, quantize_coords=True, stale_ttl=3600, error_result=[],
+                    tags=lambda self, lat, lng, *a, **kw: ["provider:kakao", region_tag(lat, lng)])
+      async def search_restaurants(lat, lng, radius):
           ...
     응답 파라미터(예시):
       - 데코레이터가 적용된 함수의 결과
     """
     def decorator(func):
+        signature = inspect.signature(func)
+        grid = config.CACHE_KEY_COORD_GRID if quantize_coords else 0.0
+        use_lock = config.CACHE_LOCK_ENABLED if distributed_lock is None else distributed_lock
+        swr = stale_ttl > 0
+
+        def build_key(*args, **kwargs) -> str:
+            if key_func:
+                return key_func(*args, **kwargs)
+            return build_cache_key(prefix, signature, args, kwargs, grid, order_insensitive)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # 캐시가 비활성화된 경우 바로 함수 실행
             if not enabled:
                 return await func(*args, **kwargs)
-            
-            # 캐시 매니저 인스턴스 가져오기
-            cache_manager = getattr(wrapper, '_cache_manager', None)
-            if not cache_manager:
-                cache_manager = CacheManager(enabled=enabled)
-                wrapper._cache_manager = cache_manager
-            
+
             # 캐시 키 생성
-            if key_func:
-                cache_key = key_func(*args, **kwargs)
-            else:
-                cache_key = cache_manager._generate_key(prefix, *args, *kwargs.values())
-            
+            cache_key = build_key(*args, **kwargs)
+
             # 캐시에서 조회
-            cached_result = cache_manager.get(cache_key)
-            if cached_result is not None:
-                logger.info(f"🎯 캐시 히트: {cache_key}")
-                return cached_result
-            
+            value = await lookup(cache_key, args, kwargs)
+            if value is not _NO_RESULT:
+                return value
+
             # 캐시 미스 - 함수 실행
             logger.info(f"💾 캐시 미스: {cache_key}")
-            result = await func(*args, **kwargs)
-            
-            # 결과 캐시 저장
-            cache_manager.set(cache_key, result, ttl)
+            _record_freshness(prefix, "miss")
+            if not single_flight:
+                return await load(cache_key, args, kwargs, None)
+            # 한 호출자가 취소되어도 공유 실행은 계속되도록 shield
+            return await asyncio.shield(flight(cache_key, args, kwargs, None))
+
+        async def lookup(cache_key: str, args: tuple, kwargs: dict) -> Any:
+            """캐시 값을 반환 (soft TTL이 지났으면 백그라운드 갱신 시작), 없으면 _NO_RESULT"""
+            cached_result = await cache_manager.get(cache_key)
+            if cached_result is None:
+                return _NO_RESULT
+            value, age = _unwrap(cached_result) if swr else (cached_result, None)
+            if age is None or age < ttl:
+                logger.info(f"🎯 캐시 히트: {cache_key}")
+                _record_freshness(prefix, "fresh", age or 0.0)
+                return value
+            # soft TTL 경과 - stale 값을 즉시 반환하고 백그라운드에서 갱신
+            logger.info(f"♻️ 캐시 stale 히트 ({age:.0f}s): {cache_key}")
+            _record_freshness(prefix, "stale", age)
+            flight(cache_key, args, kwargs, (value, age))
+            return value
+
+        async def store(cache_key: str, result: Any, args: tuple, kwargs: dict) -> None:
+            """결과를 캐시에 저장 (stale 허용 시 생성 시각과 함께 hard TTL로 저장)"""
+            entry_tags = list((tags(*args, **kwargs) if callable(tags) else tags) or [])
+            if result_tags:
+                entry_tags.extend(result_tags(result))
+            if swr:
+                await cache_manager.set(cache_key, _wrap(result), ttl + stale_ttl, entry_tags)
+            else:
+                await cache_manager.set(cache_key, result, ttl, entry_tags)
             logger.info(f"💾 캐시 저장: {cache_key}")
-            
-            return result
+
+        async def peek(*args, **kwargs) -> Optional[Any]:
+            """함수를 실행하지 않고 캐시 값만 조회 (없으면 None)"""
+            if not enabled:
+                return None
+            value = await lookup(build_key(*args, **kwargs), args, kwargs)
+            return None if value is _NO_RESULT else value
+
+        async def prime(result: Any, *args, **kwargs) -> None:
+            """함수 밖에서 계산한 결과를 같은 키로 캐시에 저장 (현재 요청에서 하위 캐시 오류가 기록됐으면 저장하지 않음)"""
+            records = _freshness_log.get()
+            if records and any(status in DEGRADED_FRESHNESS for _, status, _ in records):
+                logger.warning(f"⚠️ 하위 캐시 오류 결과라 저장하지 않음: {build_key(*args, **kwargs)}")
+                return
+            if enabled:
+                await store(build_key(*args, **kwargs), result, args, kwargs)
+
+        def flight(cache_key: str, args: tuple, kwargs: dict, stale: Optional[Tuple[Any, float]]) -> "asyncio.Task":
+            """같은 키의 진행 중인 재계산 태스크를 반환하거나 새로 시작"""
+            task = _inflight.get(cache_key)
+            if task is None:
+                cache_manager.single_flight["leaders"] += 1
+                task = asyncio.ensure_future(load(cache_key, args, kwargs, stale))
+                _inflight[cache_key] = task
+                task.add_done_callback(lambda t: _inflight.pop(cache_key, None) if _inflight.get(cache_key) is t else None)
+            else:
+                cache_manager.single_flight["coalesced"] += 1
+            return task
+
+        async def load(cache_key: str, args: tuple, kwargs: dict, stale: Optional[Tuple[Any, float]]) -> Any:
+            token = None
+            if use_lock:
+                token = await cache_manager.acquire_lock(cache_key, config.CACHE_LOCK_TTL_MS)
+                if token is None and cache_manager.connected:
+                    # 다른 워커가 재계산 중 - stale 값이 있으면 그대로 두고, 없으면 잠시 기다림
+                    cache_manager.single_flight["lock_waited"] += 1
+                    if stale is not None:
+                        return stale[0]
+                    value = await _wait_for_refill(cache_key, config.CACHE_LOCK_WAIT)
+                    if value is not None:
+                        cache_manager.single_flight["lock_wait_hits"] += 1
+                        return _unwrap(value)[0] if swr else value
+                elif token is not None:
+                    cache_manager.single_flight["lock_acquired"] += 1
+            try:
+                # 함수 안의 하위 캐시 신선도를 따로 모아 오류가 있었는지 확인 (요청 단위 기록에도 합침)
+                outer = _freshness_log.get()
+                inner = track_freshness()
+                try:
+                    with inner:
+                        result = await func(*args, **kwargs)
+                except Exception as e:
+                    if stale is not None:
+                        logger.warning(f"⚠️ 갱신 실패, stale 값 유지: {cache_key} ({e})")
+                        _record_freshness(prefix, "stale_error", stale[1])
+                        return stale[0]
+                    if error_result is not _NO_RESULT:
+                        logger.warning(f"⚠️ 캐시 대상 함수 오류: {cache_key} ({e})")
+                        _record_freshness(prefix, "error")
+                        return error_result
+                    raise
+                finally:
+                    if outer is not None:
+                        outer.extend(inner.records)
+
+                if inner.degraded:
+                    # 하위 제공자 오류로 만든 결과는 저장하지 않음 (기존 stale 항목도 덮어쓰지 않음)
+                    logger.warning(f"⚠️ 하위 캐시 오류 결과라 저장하지 않음: {cache_key}")
+                    return result
+
+                # 결과 캐시 저장
+                await store(cache_key, result, args, kwargs)
+                return result
+            finally:
+                if token is not None:
+                    await cache_manager.release_lock(cache_key, token)
+
+        wrapper.cache_key = build_key
+        wrapper.peek = peek
+        wrapper.prime = prime
+        wrapper.cache_prefix = prefix
+        wrapper.cache_ttl = ttl
         return wrapper
     return decorator
 
 
-# 환경변수에서 캐시 설정 읽기
-CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
-
-# 전역 캐시 매니저 인스턴스
-cache_manager = CacheManager(enabled=CACHE_ENABLED)
+# 전역 캐시 매니저 인스턴스 (Config 기반 단일 커넥션 풀)
+cache_manager = CacheManager(**config.get_redis_config(), **config.get_l1_cache_config(),
+                             **config.get_serializer_config())
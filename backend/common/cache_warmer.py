@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+캐시 예열 모듈
+요청 로그(또는 별도 검색 목록)에서 자주 쓰인 중간 지점/요리/반경 조합을 골라
+Kakao 검색, 역지오코딩, 이미지 조회를 미리 실행해 배포 직후나 Redis 초기화 후의 콜드 캐시를 줄입니다.
+
+- 조합 선택: 중간 지점을 grid(도) 격자로 묶고 (셀, 요리, 반경, max_results, rank_by) 빈도순 상위 top개를 고르며,
+  셀마다 가장 많이 쓰인 실제 중간 지점을 대표 좌표로 예열합니다. (CACHE_KEY_COORD_GRID를 쓰면 셀 안 다른 중간 지점도 같은 키로 적중)
+- 예열 범위: 실제 요청과 같은 search_places 경로(역지오코딩 → 네이버 지역 검색, Kakao 검색 페이지 수)와 이미지 조회
+- 호출 예산: 예열 대상은 토큰 버킷(rate/초)으로 시작하며 Kakao 호출은 kakao_rate_limiter도 함께 거칩니다.
+"""
+
+import asyncio
+import glob
+import json
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import config
+from cache_manager import _quantize, track_freshness
+from image_store import image_worker
+from midpoint import GEOMETRIC_MODES, compute_midpoint
+from rate_limit import RateLimiter
+from request_log import iter_logged_calls
+from validation import extract_rank_by, extract_search_parameters, validate_users
+
+logger = logging.getLogger(__name__)
+
+
+def load_calls(log_pattern: Optional[str] = None, queries_file: Optional[str] = None) -> List[Dict[str, Any]]:
+    """함수명: load_calls
+    기능: 요청 로그(회전 파일 포함 glob 패턴)와 검색 목록 파일에서 recommend_meetup_restaurants 인자를 읽습니다.
+      검색 목록은 JSON 배열 또는 JSON Lines이며, 각 항목은 도구 인자({"users": [...], ...})이거나
+      중간 지점을 직접 지정한 {"lat": .., "lng": .., "radius": .., "cuisine": .., "max_results": .., "rank_by": ..}입니다.
+    요청 파라미터(예시):
+      log_pattern="./logs/meetup_server.log*", queries_file="./data/warm_queries.jsonl"
+    응답 파라미터(예시):
+      [{"users": [...], "radius": 1500, "cuisine": "한식"}, {"lat": 37.4979, "lng": 127.0276, "radius": 1000}]
+    """
+    calls: List[Dict[str, Any]] = []
+    for path in sorted(glob.glob(log_pattern)) if log_pattern else []:
+        calls += [call["arguments"] for call in iter_logged_calls(path, "recommend_meetup_restaurants")]
+    if queries_file:
+        with open(queries_file, encoding="utf-8") as f:
+            text = f.read()
+        try:
+            parsed = json.loads(text)
+            entries = parsed if isinstance(parsed, list) else [parsed]
+        except json.JSONDecodeError:
+            entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+        calls += [entry for entry in entries if isinstance(entry, dict)]
+    return calls
+
+
+def _call_target(arguments: Dict[str, Any],
+                 default_mode: str) -> Optional[Tuple[float, float, Optional[str], int, int, str]]:
+    """도구 인자 → (중간 지점 위도, 경도, 요리, 반경, max_results, rank_by), 해석할 수 없으면 None"""
+    try:
+        radius, cuisine, max_results = extract_search_parameters(arguments)
+        rank_by = extract_rank_by(arguments, config.RANK_BY)
+        if "lat" in arguments and "lng" in arguments:
+            return float(arguments["lat"]), float(arguments["lng"]), cuisine, radius, max_results, rank_by
+        users = validate_users(arguments.get("users") or arguments.get("locations") or [])
+    except Exception:
+        return None
+    # travel_time은 그래프 없이 계산할 수 없으므로 가장 가까운 기하 모드(minimax)로 근사
+    mode = arguments.get("midpoint_mode") or default_mode
+    midpoint = compute_midpoint(users, mode if mode in GEOMETRIC_MODES else "minimax")
+    return midpoint["lat"], midpoint["lng"], cuisine, radius, max_results, rank_by
+
+
+def hot_targets(calls: Iterable[Dict[str, Any]], top: int = 50, grid: float = 0.005,
+                default_mode: str = "centroid") -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """함수명: hot_targets
+    기능: 호출 목록에서 (격자 셀, 요리, 반경, max_results, rank_by) 빈도 상위 top개 조합과 커버리지 통계를 계산합니다.
+      key_coverage는 예열 대상과 캐시 키가 같은 호출 비율(CACHE_KEY_COORD_GRID 기준 양자화 좌표 일치),
+      cell_coverage는 예열 대상과 같은 셀에 속한 호출 비율입니다.
+    요청 파라미터(예시):
+      calls=[{"users": [...], "radius": 1500, "cuisine": "한식"}, ...], top=50, grid=0.005
+    응답 파라미터(예시):
+      ([{"lat": 37.4981, "lng": 127.0279, "cuisine": "한식", "radius": 1500, "max_results": 15,
+         "rank_by": "provider", "count": 212}, ...],
+       {"calls": 5000, "parsed": 4980, "combos": 640, "selected": 50, "cell_coverage": 0.71, "key_coverage": 0.38})
+    """
+    key_grid = config.CACHE_KEY_COORD_GRID
+    cells: Dict[Tuple, Counter] = {}
+    total = parsed = 0
+    for arguments in calls:
+        total += 1
+        target = _call_target(arguments, default_mode)
+        if target is None:
+            continue
+        parsed += 1
+        lat, lng, cuisine, radius, max_results, rank_by = target
+        cell = (_quantize(lat, grid), _quantize(lng, grid), cuisine, radius, max_results, rank_by)
+        cells.setdefault(cell, Counter())[(_quantize(lat, key_grid), _quantize(lng, key_grid))] += 1
+
+    ranked = sorted(cells.items(), key=lambda item: -sum(item[1].values()))[:max(top, 0)]
+    targets: List[Dict[str, Any]] = []
+    cell_hits = key_hits = 0
+    for (_, _, cuisine, radius, max_results, rank_by), points in ranked:
+        (lat, lng), exact = points.most_common(1)[0]
+        count = sum(points.values())
+        cell_hits += count
+        key_hits += exact
+        targets.append({"lat": lat, "lng": lng, "cuisine": cuisine, "radius": radius, "max_results": max_results,
+                        "rank_by": rank_by, "count": count})
+    stats = {
+        "calls": total,
+        "parsed": parsed,
+        "combos": len(cells),
+        "selected": len(targets),
+        "cell_coverage": round(cell_hits / parsed, 4) if parsed else 0.0,
+        "key_coverage": round(key_hits / parsed, 4) if parsed else 0.0,
+    }
+    return targets, stats
+
+
+class CacheWarmer:
+    """hot_targets로 고른 조합을 호출 예산 안에서 미리 실행하는 예열기"""
+
+    def __init__(self, log_pattern: str = "./logs/meetup_server.log*", queries_file: Optional[str] = None,
+                 top: int = 50, grid: float = 0.005, rate: float = 2.0, concurrency: int = 4,
+                 interval: float = 0.0, image_wait: float = 5.0):
+        """함수명: CacheWarmer.__init__
+        기능: 예열 원본(로그/검색 목록), 대상 수, 셀 크기, 초당 예열 대상 수, 동시 실행 수, 반복 주기를 설정합니다.
+          interval이 0이면 start()는 한 번만 실행합니다.
+        요청 파라미터(예시):
+          log_pattern="./logs/meetup_server.log*", top=50, grid=0.005, rate=2.0, concurrency=4, interval=3600
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        self.log_pattern = log_pattern
+        self.queries_file = queries_file
+        self.top = top
+        self.grid = grid
+        self.rate = rate
+        self.concurrency = max(concurrency, 1)
+        self.interval = interval
+        self.image_wait = image_wait
+        self._task: Optional[asyncio.Task] = None
+        self._last_report: Optional[Dict[str, Any]] = None
+        self._runs = 0
+
+    async def warm_target(self, service: Any, target: Dict[str, Any]) -> Dict[str, Any]:
+        """함수명: warm_target
+        기능: 한 조합에 대해 실제 요청과 같은 search_places 경로(역지오코딩 + 네이버 지역 검색, 조합의 max_results/rank_by로
+          정한 후보 수만큼 Kakao 검색)를 실행하고, 응답에 쓰일 수 있는 후보의 이미지를 조회합니다.
+          kakao_search 캐시 상태로 이미 예열되어 있었는지(fresh) 새로 채웠는지(miss/stale)를 구분합니다.
+        요청 파라미터(예시):
+          service=<PlaceSearchService>, target={"lat": 37.4981, "lng": 127.0279, "cuisine": "한식", "radius": 1500,
+                                                "max_results": 15, "rank_by": "total"}
+        응답 파라미터(예시):
+          {"status": "miss", "places": 30, "images_pending": 6, "error": ""}
+        """
+        keyword = f"{target['cuisine']} 맛집" if target["cuisine"] else "맛집"
+        max_results, rank_by = target["max_results"], target["rank_by"]
+        size = service.candidate_count(max_results, rank_by)
+        midpoint = {"lat": target["lat"], "lng": target["lng"]}
+        locate = asyncio.ensure_future(service.locate_midpoint(midpoint))
+        try:
+            with track_freshness() as freshness:
+                _, places = await asyncio.gather(
+                    locate,
+                    service.search_places(midpoint, locate, target["radius"], keyword, size, target["cuisine"]),
+                )
+            # provider 순서는 앞 max_results건만 응답에 쓰이고, 그 외 기준은 참가자 위치에 따라 후보 전체가 쓰일 수 있음
+            _, pending = await service.lookup_images(places[:max_results] if rank_by == "provider" else places)
+            if pending and self.image_wait > 0:
+                async for _ in image_worker.watch(pending, self.image_wait):
+                    pass
+            status = freshness.summary()["sources"].get("kakao_search", "miss")
+            return {"status": status, "places": len(places), "images_pending": len(pending), "error": ""}
+        except Exception as e:
+            locate.cancel()
+            logger.warning(f"캐시 예열 실패 ({target['lat']:.4f}, {target['lng']:.4f}): {e}")
+            return {"status": "error", "places": 0, "images_pending": 0, "error": str(e)}
+
+    async def warm(self, service: Any, targets: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """함수명: warm
+        기능: 예열 대상을 토큰 버킷(rate/초)과 동시 실행 수(concurrency) 제한 안에서 실행하고 결과를 집계합니다.
+        요청 파라미터(예시):
+          service=<PlaceSearchService>, targets=[{"lat": ..., "lng": ..., "cuisine": ..., "radius": ...}, ...]
+        응답 파라미터(예시):
+          {"targets": 50, "already_warm": 12, "warmed": 37, "errors": 1, "images_requested": 210, "seconds": 26.4}
+        """
+        limiter = RateLimiter(self.rate, 1, "cache_warm")
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+
+        async def run(target: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                await limiter.acquire()
+                return await self.warm_target(service, target)
+
+        results = await asyncio.gather(*(run(t) for t in targets))
+        statuses = Counter(r["status"] for r in results)
+        return {
+            "targets": len(targets),
+            "already_warm": statuses["fresh"],
+            "warmed": len(results) - statuses["fresh"] - statuses["error"],
+            "errors": statuses["error"],
+            "images_requested": sum(r["images_pending"] for r in results),
+            "seconds": round(time.perf_counter() - started, 1),
+        }
+
+    async def run_once(self, service: Any) -> Dict[str, Any]:
+        """함수명: run_once
+        기능: 로그/검색 목록을 다시 읽어 대상을 고르고 예열한 뒤, 커버리지와 예열 결과를 합친 보고서를 반환합니다.
+        요청 파라미터(예시):
+          service=<PlaceSearchService>
+        응답 파라미터(예시):
+          {"coverage": {"calls": 5000, "selected": 50, "cell_coverage": 0.71, ...}, "warm": {"warmed": 37, ...}}
+        """
+        calls = await asyncio.to_thread(load_calls, self.log_pattern, self.queries_file)
+        # 호출마다 검증 + 중간 지점 계산(median은 수 ms)을 하므로 이벤트 루프 밖에서 실행
+        targets, coverage = await asyncio.to_thread(hot_targets, calls, self.top, self.grid, config.MIDPOINT_MODE)
+        report = {"coverage": coverage, "warm": await self.warm(service, targets)}
+        self._last_report = report
+        self._runs += 1
+        logger.info(
+            f"🔥 캐시 예열: 대상 {coverage['selected']}개 (호출 커버리지 셀 {coverage['cell_coverage']:.0%}, "
+            f"키 {coverage['key_coverage']:.0%}), 새로 채움 {report['warm']['warmed']}개, "
+            f"이미 예열 {report['warm']['already_warm']}개, 실패 {report['warm']['errors']}개"
+        )
+        return report
+
+    async def _loop(self, service: Any) -> None:
+        while True:
+            try:
+                await self.run_once(service)
+            except Exception as e:
+                logger.warning(f"캐시 예열 오류: {e}")
+            if self.interval <= 0:
+                return
+            await asyncio.sleep(self.interval)
+
+    def start(self, service: Any) -> None:
+        """서버 시작 시 예열을 백그라운드로 시작 (interval > 0이면 주기적으로 반복)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop(service))
+
+    async def stop(self) -> None:
+        """진행 중인 예열 중단"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """예열 설정과 마지막 실행 보고서 반환"""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "runs": self._runs,
+            "top": self.top,
+            "rate": self.rate,
+            "interval": self.interval,
+            "last_report": self._last_report,
+        }
+
+
+# 전역 캐시 예열기 인스턴스
+cache_warmer = CacheWarmer(**config.get_cache_warm_config())
@@ -4,41 +4,179 @@
 위경도 좌표를 주소로 변환하는 기능을 제공합니다.
 """
 
-import requests
 import os
 import asyncio
-from typing import Dict, Optional
+import json
+import time
+from typing import Any, Dict, Optional
 import logging
 
+from config import config
+from http_client import http_client
+from cache_manager import cache_manager
+from spatial import geohash_encode
+from metrics import track_provider
+
 logger = logging.getLogger(__name__)
 
+
+class ReverseGeocodeCache:
+    """geohash 셀 단위 역지오코딩 캐시 (사전 적재 → cache_manager L1 → Redis)"""
+
+    def __init__(self, precision: int = 8, ttl: int = 604800, preload_file: Optional[str] = None):
+        self.precision = precision
+        self.ttl = ttl
+        self._preloaded: Dict[str, Dict] = {}
+        self._stats = {"preload_hits": 0, "cache_hits": 0, "misses": 0}
+        if preload_file:
+            self.load_file(preload_file)
+
+    def cell(self, lat: float, lng: float) -> str:
+        """좌표를 캐시 셀(geohash)로 양자화"""
+        return geohash_encode(lat, lng, self.precision)
+
+    def _redis_key(self, cell: str) -> str:
+        return f"reverse_geocode:{self.precision}:{cell}"
+
+    def load_file(self, path: str) -> int:
+        """셀→주소 사전 파일(JSON 객체 또는 JSON Lines) 적재
+
+        JSON 객체: {"wydm6d6d": {"address": "...", ...}, ...}
+        JSON Lines: {"cell": "wydm6d6d", "address": "...", ...}
+        셀 길이가 precision보다 길면 잘라서 사용하고, 짧으면 무시합니다.
+        JSON이 아니거나 cell이 없는 줄은 건너뛰고 개수를 경고로 남깁니다.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except OSError as e:
+            logger.warning(f"역지오코딩 사전 파일을 읽을 수 없습니다: {path} ({e})")
+            return 0
+
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            parsed = None
+
+        skipped = 0
+        if isinstance(parsed, dict) and "cell" not in parsed:
+            entries = list(parsed.items())
+        else:
+            entries = []
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                    entries.append((row.pop("cell"), row))
+                except (json.JSONDecodeError, AttributeError, KeyError, TypeError):
+                    # 깨진 줄이나 cell이 없는 줄은 건너뛰고 나머지는 적재
+                    skipped += 1
+
+        loaded = 0
+        for cell, address in entries:
+            if not isinstance(cell, str) or not isinstance(address, dict):
+                skipped += 1
+                continue
+            if len(cell) < self.precision:
+                continue
+            self._preloaded[cell[:self.precision]] = address
+            loaded += 1
+        if skipped:
+            logger.warning(f"⚠️ 역지오코딩 사전의 잘못된 항목 {skipped}개를 건너뛰었습니다 ({path})")
+        logger.info(f"📍 역지오코딩 사전 적재: {loaded}개 셀 ({path})")
+        return loaded
+
+    async def get(self, cell: str) -> Optional[Dict]:
+        """셀에 해당하는 주소 조회 (없으면 None)"""
+        address = self._preloaded.get(cell)
+        if address is not None:
+            self._stats["preload_hits"] += 1
+            return address
+
+        # 프로세스 내 L1과 Redis는 cache_manager가 처리 (TTL/무효화 공유)
+        address = await cache_manager.get(self._redis_key(cell))
+        if address is not None:
+            self._stats["cache_hits"] += 1
+            return address
+
+        self._stats["misses"] += 1
+        return None
+
+    async def set(self, cell: str, address: Dict) -> None:
+        """셀 주소를 cache_manager(L1 + Redis)에 저장"""
+        await cache_manager.set(self._redis_key(cell), address, self.ttl)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 계층별 적중 통계 반환"""
+        lookups = sum(self._stats.values())
+        hits = lookups - self._stats["misses"]
+        return {
+            "precision": self.precision,
+            "preloaded": len(self._preloaded),
+            **self._stats,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
 class GeocodingService:
     """역지오코딩 서비스 클래스"""
-    
-    def __init__(self):
+
+    PROVIDERS = ("kakao", "naver")
+
+    def __init__(self, hedge_enabled: bool = False, hedge_delay: float = 0.3,
+                 cache: Optional[ReverseGeocodeCache] = None):
         self.kakao_api_key = os.getenv('KAKAO_API_KEY')
         self.naver_client_id = os.getenv('NAVER_CLIENT_ID')
         self.naver_client_secret = os.getenv('NAVER_CLIENT_SECRET')
-    
+        self.hedge_enabled = hedge_enabled
+        self.hedge_delay = hedge_delay
+        self.cache = cache
+        self._stats: Dict[str, Dict[str, float]] = {
+            name: {"calls": 0, "successes": 0, "failures": 0, "cancelled": 0,
+                   "wins": 0, "latency_total": 0.0, "latency_max": 0.0}
+            for name in self.PROVIDERS
+        }
+        # 같은 셀의 동시 조회는 하나의 제공자 호출을 공유 (셀 → 태스크)
+        self._inflight: Dict[str, "asyncio.Task"] = {}
+        self._coalesced = 0
+
+    def _record(self, provider: str, started: float, ok: bool) -> None:
+        """제공자별 호출 결과와 지연 시간을 기록"""
+        elapsed = time.perf_counter() - started
+        stats = self._stats[provider]
+        stats["calls"] += 1
+        stats["successes" if ok else "failures"] += 1
+        stats["latency_total"] += elapsed
+        stats["latency_max"] = max(stats["latency_max"], elapsed)
+
+    async def _get_json(self, url: str, headers: Dict[str, str], provider: str) -> Dict[str, Any]:
+        """공유 HTTP 세션으로 GET 요청 후 JSON 응답을 반환"""
+        session = await http_client.get_session()
+        with track_provider(provider, "reverse_geocode"):
+            async with session.get(url, headers=headers) as resp:
+                resp.raise_for_status()
+                return await resp.json(content_type=None)
+
     async def reverse_geocode_kakao(self, lat: float, lng: float) -> Optional[Dict]:
         """카카오 API를 사용한 역지오코딩"""
         if not self.kakao_api_key:
             logger.warning("카카오 API 키가 설정되지 않았습니다.")
             return None
-            
+
         url = f"https://dapi.kakao.com/v2/local/geo/coord2address.json?x={lng}&y={lat}"
         headers = {'Authorization': f'KakaoAK {self.kakao_api_key}'}
-        
+
+        started = time.perf_counter()
         try:
-            response = requests.get(url, headers=headers, timeout=5)
-            response.raise_for_status()
-            data = response.json()
-            
+            data = await self._get_json(url, headers, "kakao")
+
             if data.get('documents') and len(data['documents']) > 0:
                 doc = data['documents'][0]
-                address = doc.get('address', {})
-                road_address = doc.get('road_address', {})
-                
+                address = doc.get('address') or {}
+                road_address = doc.get('road_address') or {}
+
+                self._record("kakao", started, True)
                 return {
                     'address': road_address.get('address_name', '') or address.get('address_name', ''),
                     'road_address': road_address.get('address_name', ''),
@@ -48,40 +186,44 @@ class GeocodingService:
                     'region3': address.get('region_3depth_name', ''),
                     'provider': 'kakao'
                 }
+        except asyncio.CancelledError:
+            self._stats["kakao"]["cancelled"] += 1
+            raise
         except Exception as e:
             logger.error(f"카카오 역지오코딩 실패: {e}")
-        
+
+        self._record("kakao", started, False)
         return None
-    
+
     async def reverse_geocode_naver(self, lat: float, lng: float) -> Optional[Dict]:
         """네이버 API를 사용한 역지오코딩"""
         if not self.naver_client_id or not self.naver_client_secret:
             logger.warning("네이버 API 키가 설정되지 않았습니다.")
             return None
-            
+
         url = f"https://naveropenapi.apigw.ntruss.com/map-reversegeocode/v2/gc?coords={lng},{lat}&output=json"
         headers = {
             'X-NCP-APIGW-API-KEY-ID': self.naver_client_id,
             'X-NCP-APIGW-API-KEY': self.naver_client_secret
         }
-        
+
+        started = time.perf_counter()
         try:
-            response = requests.get(url, headers=headers, timeout=5)
-            response.raise_for_status()
-            data = response.json()
-            
+            data = await self._get_json(url, headers, "naver")
+
             if data.get('results') and len(data['results']) > 0:
                 result = data['results'][0]
                 land = result.get('land', {})
                 region = result.get('region', {})
-                
+
                 region1 = region.get('area1', {}).get('name', '')
                 region2 = region.get('area2', {}).get('name', '')
                 region3 = region.get('area3', {}).get('name', '')
-                
+
                 road_address = land.get('name', '')
                 jibun_address = f"{region1} {region2} {region3}".strip()
-                
+
+                self._record("naver", started, True)
                 return {
                     'address': road_address or jibun_address,
                     'road_address': road_address,
@@ -91,20 +233,72 @@ class GeocodingService:
                     'region3': region3,
                     'provider': 'naver'
                 }
+        except asyncio.CancelledError:
+            self._stats["naver"]["cancelled"] += 1
+            raise
         except Exception as e:
             logger.error(f"네이버 역지오코딩 실패: {e}")
-        
+
+        self._record("naver", started, False)
         return None
-    
-    async def reverse_geocode(self, lat: float, lng: float) -> Dict:
-        """위경도를 주소로 변환 (카카오 우선, 실패 시 네이버)"""
-        # 카카오 API 시도
+
+    async def _reverse_geocode_sequential(self, lat: float, lng: float) -> Optional[Dict]:
+        """카카오 우선, 실패 시 네이버 순차 호출"""
         result = await self.reverse_geocode_kakao(lat, lng)
-        
-        # 카카오 실패 시 네이버 API 시도
         if not result:
             result = await self.reverse_geocode_naver(lat, lng)
-        
+        return result
+
+    async def _reverse_geocode_hedged(self, lat: float, lng: float) -> Optional[Dict]:
+        """카카오가 hedge_delay 내 응답하지 않으면 네이버를 병행 호출하고 먼저 성공한 결과 사용"""
+        kakao_task = asyncio.create_task(self.reverse_geocode_kakao(lat, lng))
+        pending = {kakao_task}
+        try:
+            # 대기 중 호출자가 취소되어도 finally에서 카카오 태스크를 정리하도록 try 안에서 대기
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if done and kakao_task.result():
+                return kakao_task.result()
+
+            pending.add(asyncio.create_task(self.reverse_geocode_naver(lat, lng)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result:
+                        return result
+            return None
+        finally:
+            # 늦게 도착한 쪽(패자)은 취소
+            for task in pending:
+                task.cancel()
+
+    async def reverse_geocode(self, lat: float, lng: float) -> Dict:
+        """위경도를 주소로 변환 (셀 캐시 우선, 카카오 → 실패 또는 지연 시 네이버)"""
+        cell = self.cache.cell(lat, lng) if self.cache else None
+        if not cell:
+            return await self._resolve(lat, lng, None)
+
+        cached = await self.cache.get(cell)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(cell)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve(lat, lng, cell))
+            self._inflight[cell] = task
+            task.add_done_callback(lambda t: self._inflight.pop(cell, None))
+        else:
+            self._coalesced += 1
+        # 한 호출자가 취소되어도 공유 조회는 계속되도록 shield
+        return await asyncio.shield(task)
+
+    async def _resolve(self, lat: float, lng: float, cell: Optional[str]) -> Dict:
+        """제공자를 호출해 주소를 얻고, 성공하면 셀 캐시에 저장"""
+        if self.hedge_enabled:
+            result = await self._reverse_geocode_hedged(lat, lng)
+        else:
+            result = await self._reverse_geocode_sequential(lat, lng)
+
         # 모든 API 실패 시 기본값 반환
         if not result:
             logger.warning(f"주소 변환 실패: ({lat}, {lng})")
@@ -117,8 +311,41 @@ class GeocodingService:
                 'region3': '',
                 'provider': 'none'
             }
-        
+
+        self._stats[result['provider']]["wins"] += 1
+        if cell:
+            await self.cache.set(cell, result)
         return result
 
+    def get_stats(self) -> Dict[str, Any]:
+        """제공자별 호출 수, 승리 횟수, 평균/최대 지연 시간(ms) 반환"""
+        providers = {}
+        for name, stats in self._stats.items():
+            calls = stats["calls"]
+            providers[name] = {
+                "calls": int(calls),
+                "successes": int(stats["successes"]),
+                "failures": int(stats["failures"]),
+                "cancelled": int(stats["cancelled"]),
+                "wins": int(stats["wins"]),
+                "avg_latency_ms": round(stats["latency_total"] / calls * 1000, 1) if calls else 0.0,
+                "max_latency_ms": round(stats["latency_max"] * 1000, 1),
+            }
+        return {
+            "mode": "hedged" if self.hedge_enabled else "sequential",
+            "hedge_delay": self.hedge_delay,
+            "providers": providers,
+            "coalesced": self._coalesced,
+            "cache": self.cache.get_stats() if self.cache else None,
+        }
+
 # 전역 인스턴스
-geocoding_service = GeocodingService()
+geocoding_service = GeocodingService(
+    hedge_enabled=config.GEOCODE_HEDGE_ENABLED,
+    hedge_delay=config.GEOCODE_HEDGE_DELAY,
+    cache=ReverseGeocodeCache(
+        precision=config.GEOCODE_CACHE_PRECISION,
+        ttl=config.GEOCODE_CACHE_TTL,
+        preload_file=config.GEOCODE_PRELOAD_FILE,
+    ) if config.GEOCODE_CACHE_ENABLED else None,
+)
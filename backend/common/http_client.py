@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+HTTP 클라이언트 관리 모듈
+외부 API(Kakao/Naver) 호출에 공통으로 사용하는 aiohttp 세션과 커넥션 풀을 관리합니다.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderError(Exception):
+    """외부 API(Kakao/Naver)가 오류 응답을 반환한 경우"""
+
+
+class HttpClientManager:
+    """프로세스 전역 aiohttp 세션 관리자"""
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 20, dns_cache_ttl: int = 300,
+                 keepalive_timeout: float = 30.0, total_timeout: float = 10.0,
+                 connect_timeout: float = 3.0, read_timeout: float = 8.0):
+        """함수명: HttpClientManager.__init__
+        기능: 커넥션 풀/타임아웃 설정을 저장합니다. (세션은 start() 또는 최초 사용 시 생성)
+        요청 파라미터(예시):
+          limit=100, limit_per_host=20, dns_cache_ttl=300, keepalive_timeout=30.0,
+          total_timeout=10.0, connect_timeout=3.0, read_timeout=8.0
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout,
+            sock_connect=connect_timeout,
+            sock_read=read_timeout,
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+
+    async def start(self) -> aiohttp.ClientSession:
+        """함수명: start
+        기능: 커넥션 풀(keep-alive, DNS 캐시, 호스트별 연결 제한)을 가진 세션을 생성합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          aiohttp.ClientSession 인스턴스
+        """
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        self._connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self._session = aiohttp.ClientSession(connector=self._connector, timeout=self.timeout)
+        logger.info(
+            f"🌐 HTTP 세션 생성 (limit={self.limit}, per_host={self.limit_per_host}, "
+            f"dns_ttl={self.dns_cache_ttl}s)"
+        )
+        return self._session
+
+    async def close(self) -> None:
+        """함수명: close
+        기능: 세션과 커넥션 풀을 닫습니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          - 없음
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("🌐 HTTP 세션 종료")
+        self._session = None
+        self._connector = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """함수명: get_session
+        기능: 공유 세션을 반환합니다. (startup 이전 또는 스크립트 실행 시 지연 생성)
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          aiohttp.ClientSession 인스턴스
+        """
+        if self._session is None or self._session.closed:
+            return await self.start()
+        return self._session
+
+    def get_stats(self) -> Dict[str, Any]:
+        """함수명: get_stats
+        기능: 커넥션 풀 통계(열린/유휴/대기 연결 수)를 반환합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          {"active": true, "open": 5, "in_use": 2, "idle": 3, "waiting": 0,
+           "limit": 100, "limit_per_host": 20, "hosts": {"dapi.kakao.com:443": {"idle": 2}}}
+        """
+        connector = self._connector
+        if self._session is None or self._session.closed or connector is None:
+            return {"active": False, "limit": self.limit, "limit_per_host": self.limit_per_host}
+
+        # aiohttp 내부 상태를 읽으므로 버전 차이에 대비해 방어적으로 접근
+        acquired = getattr(connector, "_acquired", set()) or set()
+        conns = getattr(connector, "_conns", {}) or {}
+        waiters = getattr(connector, "_waiters", {}) or {}
+
+        hosts: Dict[str, Dict[str, int]] = {}
+        idle = 0
+        for key, protos in conns.items():
+            count = len(protos)
+            idle += count
+            hosts[f"{key.host}:{key.port}"] = {"idle": count}
+
+        waiting = 0
+        for key, futures in waiters.items():
+            count = len(futures)
+            waiting += count
+            hosts.setdefault(f"{key.host}:{key.port}", {})["waiting"] = count
+
+        in_use = len(acquired)
+        return {
+            "active": True,
+            "open": in_use + idle,
+            "in_use": in_use,
+            "idle": idle,
+            "waiting": waiting,
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "hosts": hosts,
+        }
+
+
+# 전역 HTTP 클라이언트 인스턴스
+http_client = HttpClientManager(**config.get_http_config())
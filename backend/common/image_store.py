@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+장소 이미지 저장소 / 백그라운드 보강 작업자 모듈
+식당 대표 이미지를 장소명 대신 place_id 기준으로 저장하고(cache_manager L1 → Redis), 이미지가 없는 장소는
+빈 문자열로 짧게 저장(negative cache)해 반복 조회를 막습니다.
+이미지 조회는 요청 경로 밖의 작업 큐에서 처리하며, 결과는 저장소에 기록되고 대기 중인 구독자(스트림)에 전달됩니다.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from config import config
+from cache_manager import cache_manager
+
+logger = logging.getLogger(__name__)
+
+
+class ImageStore:
+    """place_id → 이미지 URL 저장소 (cache_manager의 L1 → Redis, 빈 문자열 = 이미지 없음)"""
+
+    def __init__(self, ttl: int = 30 * 86400, negative_ttl: int = 86400):
+        """함수명: ImageStore.__init__
+        기능: 저장 기간(이미지 있음/없음)을 설정합니다. 프로세스 내 캐시는 cache_manager L1을 사용하므로
+          /cache/clear, purge_tag, 워커 간 무효화가 그대로 적용됩니다.
+        요청 파라미터(예시):
+          ttl=2592000, negative_ttl=86400
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._stats = {"hits": 0, "misses": 0, "stored": 0, "negative_stored": 0}
+
+    @staticmethod
+    def _redis_key(place_id: str) -> str:
+        return f"place_image:{place_id}"
+
+    async def get_many(self, place_ids: Iterable[str]) -> Dict[str, str]:
+        """함수명: get_many
+        기능: 여러 장소의 이미지를 한 번의 cache_manager.mget으로 조회합니다. (L1 미스만 Redis에서 읽음)
+          이미지가 없다고 기록된 장소는 빈 문자열, 아직 모르는 장소는 결과에서 빠집니다.
+        요청 파라미터(예시):
+          place_ids=["26410902", "8130556", "naver_1270404100_374849800"]
+        응답 파라미터(예시):
+          {"26410902": "https://...jpg", "8130556": ""}
+        """
+        ids = list(dict.fromkeys(p for p in place_ids if p))
+        if not ids:
+            return {}
+        values = await cache_manager.mget([self._redis_key(p) for p in ids])
+        found = {place_id: url for place_id, url in zip(ids, values) if url is not None}
+        self._stats["hits"] += len(found)
+        self._stats["misses"] += len(ids) - len(found)
+        return found
+
+    async def put_many(self, images: Dict[str, str]) -> None:
+        """함수명: put_many
+        기능: 장소별 이미지 조회 결과를 cache_manager(L1 + Redis)에 저장합니다. (빈 문자열은 negative_ttl 동안만 저장)
+        요청 파라미터(예시):
+          images={"26410902": "https://...jpg", "8130556": ""}
+        응답 파라미터(예시):
+          - 없음
+        """
+        found = {self._redis_key(p): url for p, url in images.items() if url}
+        empty = {self._redis_key(p): "" for p, url in images.items() if not url}
+        self._stats["stored"] += len(found)
+        self._stats["negative_stored"] += len(empty)
+        if found:
+            await cache_manager.mset(found, self.ttl, tags=["provider:naver"])
+        if empty:
+            await cache_manager.mset(empty, self.negative_ttl, tags=["provider:naver"])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 적중/저장 통계 반환"""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+class ImageEnrichWorker:
+    """이미지 조회 작업 큐 (place_id 단위 중복 제거, 동시 작업자 수 제한)"""
+
+    def __init__(self, store: ImageStore, concurrency: int = 5, queue_size: int = 1000):
+        """함수명: ImageEnrichWorker.__init__
+        기능: 결과를 기록할 저장소, 동시 작업자 수, 대기열 크기를 설정합니다. (작업자는 start()에서 시작)
+        요청 파라미터(예시):
+          store=image_store, concurrency=5, queue_size=1000
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        self.store = store
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._fetch: Optional[Callable[[Dict[str, Any]], Awaitable[str]]] = None
+        self._tasks: List[asyncio.Task] = []
+        self._inflight: Set[str] = set()
+        self._watchers: Dict[str, Set[asyncio.Queue]] = {}
+        self._stats = {"submitted": 0, "resolved": 0, "found": 0, "errors": 0, "dropped": 0}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self, fetch: Callable[[Dict[str, Any]], Awaitable[str]]) -> None:
+        """함수명: start
+        기능: 장소 dict를 받아 이미지 URL을 돌려주는 조회 함수로 작업자들을 시작합니다.
+          조회 함수가 예외를 던지면 결과를 저장하지 않아 다음 요청에서 다시 조회합니다.
+        요청 파라미터(예시):
+          fetch=service.fetch_place_image
+        응답 파라미터(예시):
+          - 없음
+        """
+        if self._tasks:
+            return
+        self._fetch = fetch
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+        logger.info(f"🖼️ 이미지 보강 작업자 시작: {self.concurrency}개")
+
+    async def stop(self) -> None:
+        """작업자 종료 (대기 중인 작업은 버림)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._inflight.clear()
+
+    def is_pending(self, place_id: str) -> bool:
+        """대기열에 있거나 조회 중인 장소인지 여부"""
+        return place_id in self._inflight
+
+    def submit(self, places: Iterable[Dict[str, Any]]) -> List[str]:
+        """함수명: submit
+        기능: 이미지 조회가 필요한 장소를 대기열에 넣고, 결과를 기다리는 place_id 목록을 반환합니다.
+          이미 조회 중인 장소는 다시 넣지 않고 목록에만 포함하며, 대기열이 가득 차면 버립니다.
+        요청 파라미터(예시):
+          places=[{"place_id": "26410902", "place_name": "설마중", "place_address": "서울 서초구 양재동 2-3"}]
+        응답 파라미터(예시):
+          ["26410902"]
+        """
+        if not self._tasks:
+            return []
+        pending: List[str] = []
+        for place in places:
+            place_id = place.get("place_id")
+            if not place_id or place_id in pending:
+                continue
+            if place_id not in self._inflight:
+                try:
+                    self._queue.put_nowait(place)
+                except asyncio.QueueFull:
+                    self._stats["dropped"] += 1
+                    continue
+                self._inflight.add(place_id)
+                self._stats["submitted"] += 1
+            pending.append(place_id)
+        return pending
+
+    async def watch(self, place_ids: List[str], timeout: float) -> AsyncIterator[Tuple[str, str]]:
+        """함수명: watch
+        기능: submit으로 받은 place_id의 조회 결과를 끝나는 순서대로 (place_id, URL)로 내보냅니다.
+          이미지를 찾지 못한 장소는 내보내지 않으며, timeout(초)이 지나면 남은 장소를 기다리지 않고 끝냅니다.
+        요청 파라미터(예시):
+          place_ids=["26410902", "8130556"], timeout=2.0
+        응답 파라미터(예시):
+          ("26410902", "https://...jpg") 반복
+        """
+        waiting = {p for p in place_ids if p in self._inflight}
+        if not waiting:
+            return
+        inbox: asyncio.Queue = asyncio.Queue()
+        for place_id in waiting:
+            self._watchers.setdefault(place_id, set()).add(inbox)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            while waiting:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    place_id, url = await asyncio.wait_for(inbox.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                waiting.discard(place_id)
+                if url:
+                    yield place_id, url
+        finally:
+            for place_id in place_ids:
+                watchers = self._watchers.get(place_id)
+                if watchers is not None:
+                    watchers.discard(inbox)
+                    if not watchers:
+                        del self._watchers[place_id]
+
+    async def _run(self) -> None:
+        while True:
+            place = await self._queue.get()
+            place_id = place["place_id"]
+            url: Optional[str] = None
+            try:
+                url = await self._fetch(place)
+                await self.store.put_many({place_id: url})
+                self._stats["resolved"] += 1
+                self._stats["found"] += bool(url)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.warning(f"이미지 보강 실패 ({place_id}): {e}")
+            finally:
+                self._inflight.discard(place_id)
+                for inbox in self._watchers.pop(place_id, ()):
+                    inbox.put_nowait((place_id, url or ""))
+                self._queue.task_done()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """함수명: get_stats
+        기능: 작업 큐 상태와 처리 통계, 저장소 통계를 반환합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          {"running": true, "queued": 3, "inflight": 8, "submitted": 120, "resolved": 110, "found": 97,
+           "errors": 2, "dropped": 0, "store": {...}}
+        """
+        return {
+            "running": self.running,
+            "workers": len(self._tasks),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "inflight": len(self._inflight),
+            **self._stats,
+            "store": self.store.get_stats(),
+        }
+
+
+# 전역 이미지 저장소 / 작업자 인스턴스
+image_store = ImageStore(**config.get_image_store_config())
+image_worker = ImageEnrichWorker(image_store, config.IMAGE_ENRICH_CONCURRENCY, config.IMAGE_QUEUE_SIZE)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+프로세스 내 캐시 모듈
+Redis 앞단(L1)에서 사용하는 항목 수/바이트 제한, TTL, LRU + TinyLFU 승인 정책을 가진 캐시를 제공합니다.
+"""
+
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class FrequencySketch:
+    """TinyLFU 빈도 추정용 Count-Min Sketch (4비트 카운터, 주기적 감쇠)"""
+
+    DEPTH = 4
+    MAX_COUNT = 15
+
+    def __init__(self, width: int = 4096):
+        """함수명: FrequencySketch.__init__
+        기능: 카운터 테이블을 초기화합니다. (width는 2의 거듭제곱으로 올림)
+        요청 파라미터(예시):
+          width=4096
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        self.width = 1 << max(4, (width - 1).bit_length())
+        self._mask = self.width - 1
+        self._rows = [[0] * self.width for _ in range(self.DEPTH)]
+        self._additions = 0
+        self._sample_size = self.width * 10
+
+    def _indexes(self, key: str):
+        h = hash(key)
+        for i in range(self.DEPTH):
+            yield i, (h >> (i * 8) ^ h * (i * 2 + 1)) & self._mask
+
+    def increment(self, key: str) -> None:
+        """함수명: increment
+        기능: 키의 접근 빈도를 1 증가시키고, 표본 크기에 도달하면 모든 카운터를 절반으로 감쇠합니다.
+        요청 파라미터(예시):
+          key="naver_image:설마중"
+        응답 파라미터(예시):
+          - 없음
+        """
+        for row, idx in self._indexes(key):
+            if self._rows[row][idx] < self.MAX_COUNT:
+                self._rows[row][idx] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            for row in self._rows:
+                for idx in range(self.width):
+                    row[idx] >>= 1
+            self._additions //= 2
+
+    def estimate(self, key: str) -> int:
+        """함수명: estimate
+        기능: 키의 추정 접근 빈도를 반환합니다.
+        요청 파라미터(예시):
+          key="naver_image:설마중"
+        응답 파라미터(예시):
+          3
+        """
+        return min(self._rows[row][idx] for row, idx in self._indexes(key))
+
+
+class LocalCache:
+    """항목 수/바이트 제한과 TTL을 가진 스레드 안전 LRU 캐시 (TinyLFU 승인 정책)
+
+    저장된 값은 복사 없이 그대로 반환되므로 호출자는 값을 읽기 전용으로 다뤄야 합니다.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024,
+                 admission: bool = True):
+        """함수명: LocalCache.__init__
+        기능: 용량 제한과 승인 정책을 설정합니다.
+        요청 파라미터(예시):
+          max_entries=10000, max_bytes=67108864, admission=True
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._sketch = FrequencySketch(max_entries) if admission else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """함수명: get
+        기능: 만료되지 않은 값을 조회합니다. (없거나 만료 시 None)
+        요청 파라미터(예시):
+          key="naver_image:설마중"
+        응답 파라미터(예시):
+          "https://.../image.jpg"
+        """
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, size = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float, size: int) -> bool:
+        """함수명: set
+        기능: 값을 저장합니다. 용량 초과 시 LRU 희생 후보보다 자주 쓰이는 키만 승인합니다.
+        요청 파라미터(예시):
+          key="naver_image:설마중", value="https://...", ttl=60, size=40
+        응답 파라미터(예시):
+          True (저장) 또는 False (용량/승인 정책으로 거절)
+        """
+        if ttl <= 0 or size > self.max_bytes:
+            return False
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and (len(self._entries) >= self.max_entries
+                                     or self._bytes + size > self.max_bytes):
+                victim = next(iter(self._entries))
+                if (self._sketch is not None
+                        and self._sketch.estimate(key) < self._sketch.estimate(victim)):
+                    self.rejections += 1
+                    return False
+                self._remove(victim)
+                self.evictions += 1
+            self._entries[key] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+            return True
+
+    def delete(self, key: str) -> bool:
+        """함수명: delete
+        기능: 키를 삭제합니다.
+        요청 파라미터(예시):
+          key="naver_image:설마중"
+        응답 파라미터(예시):
+          True (삭제됨) 또는 False (없음)
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def delete_pattern(self, pattern: str) -> int:
+        """함수명: delete_pattern
+        기능: glob 패턴에 맞는 키들을 삭제합니다.
+        요청 파라미터(예시):
+          pattern="kakao_search:*"
+        응답 파라미터(예시):
+          12 (삭제된 키 개수)
+        """
+        with self._lock:
+            keys = [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """함수명: get_stats
+        기능: 적중률과 용량 사용량을 반환합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          {"entries": 120, "bytes": 48213, "hits": 900, "misses": 100, "hit_rate": 0.9, ...}
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "rejections": self.rejections,
+        }
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+메트릭 모듈
+외부 의존성 없이 카운터/게이지/히스토그램을 메모리에 집계하고 Prometheus 텍스트 형식(0.0.4)으로 출력합니다.
+측정 비용은 레이블 튜플 조회와 정수 덧셈 수준이라 운영 환경에서 항상 켜 둘 수 있습니다.
+"""
+
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from http_client import ProviderError
+
+logger = logging.getLogger(__name__)
+
+# 외부 API/파이프라인 단계 지연용 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Redis 왕복/이벤트 루프 지연처럼 짧은 구간용 버킷 (초)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """레이블 값 튜플별로 값을 보관하는 메트릭 기본 클래스"""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Tuple[str, ...]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames}이(가) 필요합니다")
+        return labels
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """증감 가능한 현재 값"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def get(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램 (버킷별 개수는 출력 시 누적)"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 → [버킷별 개수..., +Inf 개수], 합계
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    def time(self, *labels: str) -> "_Timer":
+        """with 블록의 실행 시간을 관측 (예외가 나도 관측)"""
+        return _Timer(self, labels)
+
+    def get_count(self, *labels: str) -> int:
+        return sum(self._counts.get(labels, ()))
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        for labels, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(self._sums[labels])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class _Timer:
+    """Histogram.time()용 컨텍스트 매니저 (제너레이터 기반보다 호출 비용이 작음)"""
+
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: Tuple[str, ...]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, *self.labels)
+
+
+class MetricsRegistry:
+    """메트릭 등록/출력"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """함수명: render
+        기능: 등록된 모든 메트릭을 Prometheus 텍스트 형식으로 출력합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          '# HELP meetup_stage_duration_seconds ...\\n# TYPE ... histogram\\nmeetup_stage_duration_seconds_bucket{stage="kakao_search",le="0.1"} 3\\n...'
+        """
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 전역 레지스트리와 메트릭
+registry = MetricsRegistry()
+
+STAGE_DURATION = registry.histogram(
+    "meetup_stage_duration_seconds", "추천 파이프라인 단계별 소요 시간", ["stage"])
+PROVIDER_DURATION = registry.histogram(
+    "meetup_provider_request_duration_seconds", "외부 API 호출 소요 시간", ["provider", "endpoint"])
+PROVIDER_ERRORS = registry.counter(
+    "meetup_provider_errors_total", "외부 API 오류 수 (kind: timeout | http | error)", ["provider", "endpoint", "kind"])
+CACHE_REQUESTS = registry.counter(
+    "meetup_cache_requests_total", "캐시 조회 결과 수 (result: fresh | stale | miss | stale_error | error)", ["prefix", "result"])
+REDIS_DURATION = registry.histogram(
+    "meetup_redis_duration_seconds", "Redis 파이프라인 왕복 시간", ["op"], FAST_BUCKETS)
+HTTP_IN_FLIGHT = registry.gauge(
+    "meetup_http_requests_in_flight", "처리 중인 HTTP 요청 수")
+HTTP_DURATION = registry.histogram(
+    "meetup_http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트 경로 기준)", ["method", "route", "status"])
+LOOP_LAG = registry.gauge(
+    "meetup_event_loop_lag_seconds", "가장 최근 측정한 이벤트 루프 지연")
+LOOP_LAG_HISTOGRAM = registry.histogram(
+    "meetup_event_loop_lag_distribution_seconds", "이벤트 루프 지연 분포", (), FAST_BUCKETS)
+HTTP_IN_FLIGHT.set(0)
+LOOP_LAG.set(0)
+
+
+@contextmanager
+def track_provider(provider: str, endpoint: str) -> Iterator[None]:
+    """함수명: track_provider
+    기능: 외부 API 호출 시간을 관측하고, 예외 종류별 오류 수를 셉니다. (취소된 호출은 관측하지 않음)
+    요청 파라미터(예시):
+      with track_provider("kakao", "local_search"):
+          async with session.get(...) as resp: ...
+    응답 파라미터(예시):
+      - 없음 (예외는 그대로 전달)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except asyncio.CancelledError:
+        raise
+    except asyncio.TimeoutError:
+        PROVIDER_ERRORS.inc(provider, endpoint, "timeout")
+        PROVIDER_DURATION.observe(time.perf_counter() - started, provider, endpoint)
+        raise
+    except Exception as e:
+        kind = "http" if isinstance(e, (ProviderError, aiohttp.ClientResponseError)) else "error"
+        PROVIDER_ERRORS.inc(provider, endpoint, kind)
+        PROVIDER_DURATION.observe(time.perf_counter() - started, provider, endpoint)
+        raise
+    else:
+        PROVIDER_DURATION.observe(time.perf_counter() - started, provider, endpoint)
+
+
+def timed_stage(stage: str):
+    """함수명: timed_stage
+    기능: 비동기 함수의 실행 시간을 파이프라인 단계 히스토그램에 기록하는 데코레이터입니다.
+      (functools.wraps로 cache_result가 붙인 cache_key/peek 등의 속성도 유지)
+    요청 파라미터(예시):
+      @timed_stage("kakao_search")
+      @cache_result("kakao_search", ttl=1800)
+      async def search_kakao_category(...): ...
+    응답 파라미터(예시):
+      - 데코레이터가 적용된 함수의 결과
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            with STAGE_DURATION.time(stage):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class MetricsMiddleware:
+    """HTTP 요청 수/처리 시간을 기록하는 ASGI 미들웨어 (라우트 템플릿 기준으로 레이블 수 제한)"""
+
+    def __init__(self, app, exclude_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def metrics_send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, metrics_send)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            # 매칭된 라우트가 없으면(404 등) 경로 대신 고정 레이블을 사용해 레이블 폭증 방지
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_DURATION.observe(time.perf_counter() - started, scope["method"], route, str(status))
+
+
+class EventLoopLagMonitor:
+    """주기적으로 sleep 후 예정 시각과의 차이로 이벤트 루프 지연을 측정"""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            LOOP_LAG.set(lag)
+            LOOP_LAG_HISTOGRAM.observe(lag)
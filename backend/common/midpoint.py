@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+중간 지점 계산 모듈
+사용자 좌표들로부터 만남 장소 중심을 계산합니다. 좌표는 무게중심 기준 등거리 평면(미터)으로 투영해
+NumPy 벡터 연산으로 계산하고, 결과 평가는 하버사인 거리로 합니다.
+
+모드:
+  - centroid: 위경도 산술 평균 (기존 방식)
+  - median: 기하 중앙값 (Weiszfeld, 이동 거리 합 최소화)
+  - minimax: 최소 외접원 중심 (가장 먼 사람의 이동 거리 최소화)
+  - travel_time: 도로/대중교통 그래프 기준 이동 시간 최소화 (routing 모듈에서 계산)
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from spatial import EARTH_RADIUS_M
+
+GEOMETRIC_MODES = ("centroid", "median", "minimax")
+MIDPOINT_MODES = GEOMETRIC_MODES + ("travel_time",)
+
+# 재현 가능한 결과(= 같은 캐시 키/태그)를 위해 고정 시드 사용
+_SHUFFLE_SEED = 20240601
+
+
+def haversine_np(lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """함수명: haversine_np
+    기능: 한 좌표에서 여러 좌표까지의 하버사인 거리(미터)를 벡터 연산으로 계산합니다.
+    요청 파라미터(예시):
+      lat=37.4804, lng=127.04435, lats=np.array([37.5665, 37.3943]), lngs=np.array([126.978, 127.1107])
+    응답 파라미터(예시):
+      array([11222.1, 11222.3])
+    """
+    p1 = np.radians(lat)
+    p2 = np.radians(lats)
+    a = (np.sin((p2 - p1) / 2) ** 2
+         + np.cos(p1) * np.cos(p2) * np.sin(np.radians(lngs - lng) / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class _Projection:
+    """기준 위도에서의 등거리 원통 투영 (도 ↔ 미터)"""
+
+    def __init__(self, lat0: float, lng0: float):
+        self.lat0 = lat0
+        self.lng0 = lng0
+        self.ky = np.pi / 180 * EARTH_RADIUS_M
+        self.kx = self.ky * np.cos(np.radians(lat0))
+
+    def forward(self, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        return np.column_stack(((lngs - self.lng0) * self.kx, (lats - self.lat0) * self.ky))
+
+    def inverse(self, point: np.ndarray) -> Tuple[float, float]:
+        return float(self.lat0 + point[1] / self.ky), float(self.lng0 + point[0] / self.kx)
+
+
+def _weiszfeld(points: np.ndarray, tol: float = 0.01, max_iter: int = 200) -> np.ndarray:
+    """점들까지의 거리 합을 최소화하는 점 (tol: 미터 단위 수렴 기준)"""
+    current = points.mean(axis=0)
+    for _ in range(max_iter):
+        dist = np.linalg.norm(points - current, axis=1)
+        coincident = dist < 1e-9
+        if coincident.any():
+            # 현재 점이 입력 점과 겹치면 그 점이 최적인지(나머지 점들의 당김 합 ≤ 1) 확인 후 살짝 벗어남
+            others = ~coincident
+            if not others.any():
+                return current
+            pull = ((points[others] - current) / dist[others, None]).sum(axis=0)
+            if np.linalg.norm(pull) <= coincident.sum():
+                return current
+            dist = np.where(coincident, 1e-9, dist)
+        weights = 1.0 / dist
+        updated = (points * weights[:, None]).sum(axis=0) / weights.sum()
+        if np.linalg.norm(updated - current) < tol:
+            return updated
+        current = updated
+    return current
+
+
+def _circle_two(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, float]:
+    center = (a + b) / 2
+    return center, float(np.linalg.norm(a - center))
+
+
+def _circle_three(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> Tuple[np.ndarray, float]:
+    bx, by = b - a
+    cx, cy = c - a
+    d = 2 * (bx * cy - by * cx)
+    if abs(d) < 1e-12:
+        # 세 점이 한 직선 위: 가장 먼 두 점의 지름 원
+        pairs = [(a, b), (a, c), (b, c)]
+        return max((_circle_two(p, q) for p, q in pairs), key=lambda circle: circle[1])
+    ux = (cy * (bx * bx + by * by) - by * (cx * cx + cy * cy)) / d
+    uy = (bx * (cx * cx + cy * cy) - cx * (bx * bx + by * by)) / d
+    center = a + np.array([ux, uy])
+    return center, float(np.hypot(ux, uy))
+
+
+def _first_outside(points: np.ndarray, center: np.ndarray, radius: float) -> int:
+    """원 밖에 있는 첫 점의 인덱스 (없으면 -1)"""
+    outside = np.linalg.norm(points - center, axis=1) > radius * (1 + 1e-9) + 1e-6
+    return int(outside.argmax()) if outside.any() else -1
+
+
+def _enclosing_circle(points: np.ndarray) -> Tuple[np.ndarray, float]:
+    """최소 외접원 (무작위 순서 증분 알고리즘, 포함 여부 검사는 벡터 연산)"""
+    points = points[np.random.default_rng(_SHUFFLE_SEED).permutation(len(points))]
+    center, radius = points[0].copy(), 0.0
+    while (i := _first_outside(points, center, radius)) >= 0:
+        # points[:i]는 모두 원 안 → points[i]를 경계에 둔 최소 원을 다시 구성
+        p = points[i]
+        center, radius = p.copy(), 0.0
+        while (j := _first_outside(points[:i], center, radius)) >= 0:
+            q = points[j]
+            center, radius = _circle_two(p, q)
+            while (k := _first_outside(points[:j], center, radius)) >= 0:
+                center, radius = _circle_three(p, q, points[k])
+    return center, radius
+
+
+def solve_midpoint(lats: Sequence[float], lngs: Sequence[float], mode: str = "centroid") -> Tuple[float, float]:
+    """함수명: solve_midpoint
+    기능: 지정한 모드로 중간 지점 좌표를 계산합니다.
+    요청 파라미터(예시):
+      lats=[37.5665, 37.3943, 37.5013], lngs=[126.9780, 127.1107, 127.0396], mode="median"
+    응답 파라미터(예시):
+      (37.5013, 127.0396)
+    """
+    if mode not in GEOMETRIC_MODES:
+        raise ValueError(f"좌표로 계산할 수 없는 중간 지점 모드: {mode}")
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    if mode == "centroid":
+        return float(lats.mean()), float(lngs.mean())
+
+    projection = _Projection(float(lats.mean()), float(lngs.mean()))
+    points = projection.forward(lats, lngs)
+    if mode == "median":
+        return projection.inverse(_weiszfeld(points))
+    center, _ = _enclosing_circle(points)
+    return projection.inverse(center)
+
+
+def compute_midpoint(users: List[Dict[str, float]], mode: str = "centroid") -> Dict[str, float]:
+    """함수명: compute_midpoint
+    기능: 사용자 좌표 목록으로 중간 지점을 계산합니다. (solve_midpoint 참고)
+    요청 파라미터(예시):
+      users=[{"lat": 37.5665, "lng": 126.9780}, {"lat": 37.3943, "lng": 127.1107}], mode="minimax"
+    응답 파라미터(예시):
+      {"lat": 37.4804, "lng": 127.04435}
+    """
+    lat, lng = solve_midpoint([float(u["lat"]) for u in users], [float(u["lng"]) for u in users], mode)
+    return {"lat": lat, "lng": lng}
+
+
+def fairness(users: List[Dict[str, float]], midpoint: Dict[str, float]) -> Dict[str, float]:
+    """함수명: fairness
+    기능: 중간 지점까지 사용자별 직선 거리의 합계/평균/최대/표준편차(미터)를 계산합니다.
+    요청 파라미터(예시):
+      users=[{"lat": 37.5665, "lng": 126.9780}, ...], midpoint={"lat": 37.4804, "lng": 127.04435}
+    응답 파라미터(예시):
+      {"total_m": 22444.4, "mean_m": 11222.2, "max_m": 11222.3, "std_m": 0.1}
+    """
+    dist = haversine_np(midpoint["lat"], midpoint["lng"],
+                        np.array([u["lat"] for u in users], dtype=float),
+                        np.array([u["lng"] for u in users], dtype=float))
+    return {
+        "total_m": round(float(dist.sum()), 1),
+        "mean_m": round(float(dist.mean()), 1),
+        "max_m": round(float(dist.max()), 1),
+        "std_m": round(float(dist.std()), 1),
+    }
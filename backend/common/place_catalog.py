@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+로컬 장소 카탈로그 모듈
+Kakao/Naver에서 받은 장소와 대량 가져오기(import) 데이터를 SQLite에 저장하고,
+메모리의 격자 셀 인덱스로 반경 + 요리 키워드 검색을 외부 API 없이 처리합니다.
+
+동작 모드 (PLACE_CATALOG_MODE):
+  - off: 사용하지 않음
+  - write_through: 외부 API 결과만 기록 (검색에는 사용하지 않음)
+  - primary: 카탈로그의 최신 장소가 충분하면 외부 API를 호출하지 않음
+  - fallback: 외부 API 결과가 없을 때(오류/빈 결과) 카탈로그로 대체
+  - gap_fill: 외부 API 결과가 부족하면 카탈로그 장소로 채움
+"""
+
+import asyncio
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from config import config
+from spatial import METERS_PER_DEG_LAT, haversine_m
+
+logger = logging.getLogger(__name__)
+
+CATALOG_MODES = ("off", "write_through", "primary", "fallback", "gap_fill")
+
+# 카탈로그에 저장하는 필드 (distance는 검색 중심 기준이므로 저장하지 않음)
+PLACE_FIELDS = ("place_id", "place_name", "place_url", "place_phone", "place_address", "place_road_address",
+                "place_category", "place_x", "place_y", "image_url", "source")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS places (
+    place_id TEXT PRIMARY KEY,
+    place_name TEXT NOT NULL,
+    place_url TEXT,
+    place_phone TEXT,
+    place_address TEXT,
+    place_road_address TEXT,
+    place_category TEXT,
+    place_x REAL NOT NULL,
+    place_y REAL NOT NULL,
+    image_url TEXT,
+    source TEXT,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+class PlaceCatalog:
+    """SQLite 저장소 + 메모리 격자 인덱스 기반 장소 카탈로그"""
+
+    def __init__(self, path: str = "./data/places.db", mode: str = "write_through", cell_m: float = 500.0,
+                 max_age: float = 7 * 86400, stale_age: float = 90 * 86400):
+        """함수명: PlaceCatalog.__init__
+        기능: 저장 경로, 동작 모드, 격자 셀 크기, 신선도 기준을 설정합니다. (데이터는 load()에서 읽음)
+          max_age 이내에 갱신된 장소만 primary/gap_fill 결과로 쓰고, fallback은 stale_age까지 허용합니다.
+        요청 파라미터(예시):
+          path="./data/places.db", mode="gap_fill", cell_m=500, max_age=604800, stale_age=7776000
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        if mode not in CATALOG_MODES:
+            raise ValueError(f"지원하지 않는 카탈로그 모드: {mode}")
+        self.path = path
+        self.mode = mode
+        self.cell_m = cell_m
+        self.max_age = max_age
+        self.stale_age = stale_age
+        self._lat_step = cell_m / METERS_PER_DEG_LAT
+        self._places: Dict[str, Dict[str, Any]] = {}
+        self._cells: Dict[Tuple[int, int], Set[str]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._pending: Set[asyncio.Task] = set()
+        self._stats = {"queries": 0, "query_ms": 0.0, "recorded": 0, "persisted": 0, "served": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    # ------------------------------------------------------------------
+    # 저장소
+    # ------------------------------------------------------------------
+    def load(self) -> int:
+        """함수명: load
+        기능: SQLite 파일을 열고(없으면 생성) 전체 장소를 메모리 인덱스로 읽어 옵니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          12840  (불러온 장소 수)
+        """
+        started = time.perf_counter()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._db_lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(_SCHEMA)
+            rows = self._conn.execute(f"SELECT {', '.join(PLACE_FIELDS)}, updated_at FROM places").fetchall()
+        for row in rows:
+            place = dict(zip(PLACE_FIELDS + ("updated_at",), row))
+            self._index(place)
+        logger.info(f"📚 장소 카탈로그 로드: {len(rows):,}건 ({(time.perf_counter() - started) * 1000:.0f}ms, "
+                    f"mode={self.mode})")
+        return len(rows)
+
+    def _persist(self, places: List[Dict[str, Any]]) -> None:
+        with self._db_lock:
+            if self._conn is None:
+                return
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO places ({', '.join(PLACE_FIELDS)}, updated_at) "
+                f"VALUES ({', '.join('?' for _ in PLACE_FIELDS)}, ?)",
+                [tuple(p.get(f) for f in PLACE_FIELDS) + (p["updated_at"],) for p in places],
+            )
+            self._conn.commit()
+        self._stats["persisted"] += len(places)
+
+    async def close(self) -> None:
+        """함수명: close
+        기능: 진행 중인 저장 작업을 기다린 뒤 SQLite 연결을 닫습니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          - 없음
+        """
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # 인덱스
+    # ------------------------------------------------------------------
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        row = math.floor(lat / self._lat_step)
+        return row, math.floor(lng / self._lng_step(row))
+
+    def _lng_step(self, row: int) -> float:
+        return self._lat_step / max(math.cos(math.radians((row + 0.5) * self._lat_step)), 1e-6)
+
+    def _index(self, place: Dict[str, Any]) -> None:
+        place_id = place["place_id"]
+        previous = self._places.get(place_id)
+        if previous is not None:
+            self._cells.get(self._cell(previous["place_y"], previous["place_x"]), set()).discard(place_id)
+        self._places[place_id] = place
+        self._cells.setdefault(self._cell(place["place_y"], place["place_x"]), set()).add(place_id)
+
+    def upsert(self, places: Iterable[Dict[str, Any]], updated_at: Optional[float] = None) -> List[Dict[str, Any]]:
+        """함수명: upsert
+        기능: 장소를 메모리 인덱스에 반영하고, 저장용으로 정규화한 레코드를 반환합니다.
+          기존 값이 있으면 새 값이 비어 있는 필드(전화번호, 이미지 등)는 기존 값을 유지합니다.
+        요청 파라미터(예시):
+          places=[{"place_id": "26410902", "place_name": "설마중", "place_x": 127.04037, "place_y": 37.48501, ...}]
+        응답 파라미터(예시):
+          [{"place_id": "26410902", ..., "updated_at": 1718000000.0}]
+        """
+        now = updated_at or time.time()
+        records = []
+        for place in places:
+            if not place.get("place_id") or not place.get("place_name"):
+                continue
+            try:
+                x, y = float(place["place_x"]), float(place["place_y"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            previous = self._places.get(place["place_id"], {})
+            record = {f: place.get(f) or previous.get(f) or "" for f in PLACE_FIELDS}
+            record.update(place_x=x, place_y=y, updated_at=now)
+            self._index(record)
+            records.append(record)
+        return records
+
+    def record(self, places: List[Dict[str, Any]]) -> None:
+        """함수명: record
+        기능: 외부 API에서 받은 장소를 즉시 메모리 인덱스에 반영하고, SQLite 저장은 백그라운드로 처리합니다.
+          (요청 지연에 디스크 쓰기 시간이 더해지지 않도록 작업 스레드에서 실행)
+        요청 파라미터(예시):
+          places=[{"place_id": "26410902", "place_name": "설마중", ...}]
+        응답 파라미터(예시):
+          - 없음
+        """
+        if not self.enabled or not places:
+            return
+        records = self.upsert(places)
+        if not records:
+            return
+        self._stats["recorded"] += len(records)
+        task = asyncio.get_running_loop().create_task(asyncio.to_thread(self._persist, records))
+        self._pending.add(task)
+        task.add_done_callback(self._persist_done)
+
+    def _persist_done(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"장소 카탈로그 저장 실패: {task.exception()}")
+
+    def import_places(self, places: Iterable[Dict[str, Any]], batch_size: int = 5000,
+                      updated_at: Optional[float] = None) -> int:
+        """함수명: import_places
+        기능: 대량 장소 데이터를 batch_size 단위로 인덱스에 반영하고 SQLite에 저장합니다. (동기, 도구용)
+        요청 파라미터(예시):
+          places=<장소 dict 반복자>, batch_size=5000
+        응답 파라미터(예시):
+          120000  (저장한 장소 수)
+        """
+        total = 0
+        batch: List[Dict[str, Any]] = []
+        for place in places:
+            batch.append(place)
+            if len(batch) >= batch_size:
+                total += self._import_batch(batch, updated_at)
+                batch = []
+        if batch:
+            total += self._import_batch(batch, updated_at)
+        return total
+
+    def _import_batch(self, batch: List[Dict[str, Any]], updated_at: Optional[float]) -> int:
+        records = self.upsert(batch, updated_at)
+        self._persist(records)
+        return len(records)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def search(self, lat: float, lng: float, radius: float, cuisine: Optional[str] = None,
+               limit: int = 15, max_age: Optional[float] = None) -> List[Dict[str, Any]]:
+        """함수명: search
+        기능: 반경 안의 장소를 격자 셀로 찾아 가까운 순으로 반환합니다.
+          cuisine이 있으면 카테고리 또는 장소명에 포함된 장소만, max_age가 있으면 그 안에 갱신된 장소만 반환합니다.
+        요청 파라미터(예시):
+          lat=37.4804, lng=127.04435, radius=1500, cuisine="한식", limit=15, max_age=604800
+        응답 파라미터(예시):
+          [{"place_id": "26410902", "place_name": "설마중", ..., "distance": "621", "source": "kakao",
+            "catalog_age": 3600}]
+        """
+        started = time.perf_counter()
+        now = time.time()
+        lat_span = radius / METERS_PER_DEG_LAT
+        row_lo, row_hi = math.floor((lat - lat_span) / self._lat_step), math.floor((lat + lat_span) / self._lat_step)
+        lng_span = radius / (METERS_PER_DEG_LAT * max(math.cos(math.radians(lat)), 1e-6))
+
+        found: List[Tuple[float, Dict[str, Any]]] = []
+        for row in range(row_lo, row_hi + 1):
+            step = self._lng_step(row)
+            for col in range(math.floor((lng - lng_span) / step), math.floor((lng + lng_span) / step) + 1):
+                for place_id in self._cells.get((row, col), ()):
+                    place = self._places[place_id]
+                    if max_age is not None and now - place["updated_at"] > max_age:
+                        continue
+                    if cuisine and cuisine not in place["place_category"] and cuisine not in place["place_name"]:
+                        continue
+                    distance = haversine_m(lat, lng, place["place_y"], place["place_x"])
+                    if distance <= radius:
+                        found.append((distance, place))
+        found.sort(key=lambda item: item[0])
+
+        self._stats["queries"] += 1
+        self._stats["query_ms"] += (time.perf_counter() - started) * 1000
+        return [
+            {**{f: place[f] for f in PLACE_FIELDS}, "distance": str(round(distance)),
+             "catalog_age": round(now - place["updated_at"])}
+            for distance, place in found[:max(limit, 0)]
+        ]
+
+    def served(self, count: int) -> None:
+        """카탈로그에서 응답에 사용한 장소 수 집계"""
+        self._stats["served"] += count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """함수명: get_stats
+        기능: 카탈로그 크기와 검색/기록 통계를 반환합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          {"mode": "gap_fill", "places": 12840, "cells": 2210, "queries": 40, "avg_query_ms": 0.21,
+           "recorded": 380, "persisted": 380, "served": 52, "pending_writes": 0}
+        """
+        queries = self._stats["queries"]
+        return {
+            "mode": self.mode,
+            "path": self.path,
+            "places": len(self._places),
+            "cells": len(self._cells),
+            "queries": queries,
+            "avg_query_ms": round(self._stats["query_ms"] / queries, 3) if queries else 0.0,
+            "recorded": self._stats["recorded"],
+            "persisted": self._stats["persisted"],
+            "served": self._stats["served"],
+            "pending_writes": len(self._pending),
+        }
+
+
+# 전역 장소 카탈로그 인스턴스
+place_catalog = PlaceCatalog(**config.get_place_catalog_config())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+장소 병합 모듈
+여러 제공자(Kakao/Naver)의 장소 목록을 좌표 격자 해시와 장소명 유사도로 비교해
+같은 장소를 하나의 레코드로 합칩니다.
+"""
+
+import html
+import math
+import re
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Tuple
+
+from spatial import METERS_PER_DEG_LAT, haversine_m
+
+# 장소명 비교 시 무시할 문자 (공백, 괄호, 구두점)
+_NAME_NOISE = re.compile(r"[\s\(\)\[\]\.,·&'\"-]+")
+
+# 비어 있을 때 보조 출처 값으로 채울 필드
+FILL_FIELDS = ("place_phone", "place_address", "place_road_address", "place_category", "image_url")
+
+
+def normalize_title(title: str) -> str:
+    """함수명: normalize_title
+    기능: 네이버 검색 결과 제목의 강조 태그(<b>)와 HTML 엔티티를 제거합니다.
+    요청 파라미터(예시):
+      title="<b>설마중</b> 양재점 &amp; 바"
+    응답 파라미터(예시):
+      "설마중 양재점 & 바"
+    """
+    return html.unescape(re.sub(r"<[^>]+>", "", title or "")).strip()
+
+
+def normalize_name(name: str) -> str:
+    """함수명: normalize_name
+    기능: 장소명 비교용으로 HTML 태그/공백/구두점을 제거하고 소문자로 바꿉니다.
+    요청 파라미터(예시):
+      name="<b>설마중</b> 양재점"
+    응답 파라미터(예시):
+      "설마중양재점"
+    """
+    return _NAME_NOISE.sub("", normalize_title(name)).lower()
+
+
+def name_similarity(a: str, b: str) -> float:
+    """함수명: name_similarity
+    기능: 정규화한 두 장소명의 유사도(0~1)를 계산합니다. 한쪽 이름이 다른 쪽에 포함되면 1.0입니다.
+      (예: "설마중" / "설마중 양재점")
+    요청 파라미터(예시):
+      a="설마중", b="설마중 양재점"
+    응답 파라미터(예시):
+      1.0
+    """
+    a, b = normalize_name(a), normalize_name(b)
+    if not a or not b:
+        return 0.0
+    if a in b or b in a:
+        return 1.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+class _CellIndex:
+    """cell_m 크기 격자 셀 → 항목 번호 목록 (주변 3x3 셀 조회용)"""
+
+    def __init__(self, cell_m: float):
+        self.lat_step = cell_m / METERS_PER_DEG_LAT
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        lng_step = self.lat_step / max(math.cos(math.radians(lat)), 1e-6)
+        return math.floor(lat / self.lat_step), math.floor(lng / lng_step)
+
+    def add(self, lat: float, lng: float, index: int) -> None:
+        self.cells.setdefault(self.cell(lat, lng), []).append(index)
+
+    def nearby(self, lat: float, lng: float) -> List[int]:
+        row, col = self.cell(lat, lng)
+        found: List[int] = []
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                found.extend(self.cells.get((row + dr, col + dc), ()))
+        return found
+
+
+def merge_places(primary: List[Dict[str, Any]], secondary: List[Dict[str, Any]],
+                 max_distance_m: float = 100.0, min_similarity: float = 0.6) -> List[Dict[str, Any]]:
+    """함수명: merge_places
+    기능: secondary 목록의 각 장소를 primary 목록과 비교해 같은 장소면 하나로 합칩니다.
+      max_distance_m 크기 격자 셀로 주변 후보만 찾고, 실제 거리가 max_distance_m 이하이면서
+      장소명 유사도가 min_similarity 이상인 가장 비슷한 항목과 병합합니다.
+      병합된 항목은 primary 값을 유지하고 빈 필드(FILL_FIELDS)만 secondary 값으로 채우며,
+      sources에 두 출처를 모두 기록합니다. 짝이 없는 secondary 항목은 뒤에 붙입니다.
+    요청 파라미터(예시):
+      primary=[{"place_name": "설마중", "place_x": 127.04037, "place_y": 37.48501, "source": "kakao", ...}],
+      secondary=[{"place_name": "설마중 양재점", "place_x": 127.04041, "place_y": 37.48498, "source": "naver", ...}]
+    응답 파라미터(예시):
+      [{"place_name": "설마중", ..., "source": "kakao", "sources": ["kakao", "naver"]}]
+    """
+    merged = [{**r, "sources": list(r.get("sources") or [r.get("source", "")])} for r in primary]
+    index = _CellIndex(max_distance_m)
+    for i, r in enumerate(merged):
+        index.add(r["place_y"], r["place_x"], i)
+
+    for other in secondary:
+        best, best_score = None, min_similarity
+        for i in index.nearby(other["place_y"], other["place_x"]):
+            candidate = merged[i]
+            if haversine_m(candidate["place_y"], candidate["place_x"], other["place_y"], other["place_x"]) > max_distance_m:
+                continue
+            score = name_similarity(candidate.get("place_name", ""), other.get("place_name", ""))
+            if score >= best_score:
+                best, best_score = candidate, score
+
+        if best is None:
+            entry = {**other, "sources": list(other.get("sources") or [other.get("source", "")])}
+            index.add(entry["place_y"], entry["place_x"], len(merged))
+            merged.append(entry)
+            continue
+        for field in FILL_FIELDS:
+            if not best.get(field) and other.get(field):
+                best[field] = other[field]
+        for source in other.get("sources") or [other.get("source", "")]:
+            if source not in best["sources"]:
+                best["sources"].append(source)
+    return merged
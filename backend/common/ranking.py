@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+식당 후보 순위 모듈
+검색으로 모은 후보를 참가자 전원 기준으로 다시 정렬합니다. 참가자 × 후보 하버사인 거리 행렬을
+NumPy 한 번의 벡터 연산으로 계산하고, 목적 함수 점수와 검색 제공자 순위를 섞어 상위 k개만 고릅니다.
+
+목적 함수 (rank_by):
+  - provider: 검색 제공자 순서 유지 (참가자별 거리만 첨부)
+  - total: 참가자 이동 거리 합 최소
+  - max: 가장 먼 참가자의 이동 거리 최소
+  - variance: 참가자 간 이동 거리 분산 최소 (공평함 우선)
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+
+from midpoint import haversine_np
+
+RANK_OBJECTIVES = ("provider", "total", "max", "variance")
+
+
+def distance_matrix(users: List[Dict[str, Any]], places: List[Dict[str, Any]]) -> np.ndarray:
+    """함수명: distance_matrix
+    기능: 참가자 × 후보 하버사인 거리 행렬(미터)을 한 번의 브로드캐스트 연산으로 계산합니다.
+    요청 파라미터(예시):
+      users=[{"lat": 37.5665, "lng": 126.9780}, ...], places=[{"place_y": 37.4804, "place_x": 127.0443}, ...]
+    응답 파라미터(예시):
+      array([[11222.1, ...], [11222.3, ...]])  # shape = (참가자 수, 후보 수)
+    """
+    user_lat = np.array([float(u["lat"]) for u in users])[:, None]
+    user_lng = np.array([float(u["lng"]) for u in users])[:, None]
+    place_lat = np.array([float(p["place_y"]) for p in places])[None, :]
+    place_lng = np.array([float(p["place_x"]) for p in places])[None, :]
+    return haversine_np(user_lat, user_lng, place_lat, place_lng)
+
+
+def _normalize(values: np.ndarray) -> np.ndarray:
+    """0~1 범위로 min-max 정규화 (모두 같으면 0)"""
+    span = values.max() - values.min()
+    return (values - values.min()) / span if span > 0 else np.zeros_like(values)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """함수명: top_k
+    기능: 점수가 낮은 k개의 인덱스를 점수 순으로 반환합니다. (전체 정렬 대신 argpartition 후 k개만 정렬)
+    요청 파라미터(예시):
+      scores=np.array([0.4, 0.1, 0.9, 0.2]), k=2
+    응답 파라미터(예시):
+      array([1, 3])
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=int)
+    if k < len(scores):
+        candidates = np.argpartition(scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    # 동점이면 제공자 순서(인덱스)가 앞선 후보 우선
+    return candidates[np.lexsort((candidates, scores[candidates]))]
+
+
+def rank_places(users: List[Dict[str, Any]], places: List[Dict[str, Any]], rank_by: str = "total",
+                k: int = 15, provider_weight: float = 0.2) -> List[Dict[str, Any]]:
+    """함수명: rank_places
+    기능: 후보를 참가자 거리 기준 목적 함수로 점수화해 상위 k개를 반환합니다.
+      점수 = (1 - provider_weight) × 정규화 목적 함수 값 + provider_weight × 정규화 제공자 순위 (낮을수록 좋음)
+      각 항목에 참가자 순서대로의 직선 거리(user_distances, 미터)를 첨부합니다. (원본 항목은 변경하지 않음)
+    요청 파라미터(예시):
+      users=[{"lat": 37.5665, "lng": 126.9780}, {"lat": 37.3943, "lng": 127.1107}],
+      places=[{"place_name": "설마중", "place_x": 127.0443, "place_y": 37.4804, ...}, ...],
+      rank_by="max", k=5, provider_weight=0.2
+    응답 파라미터(예시):
+      [{"place_name": "설마중", ..., "user_distances": [11222, 11230], "rank_score": 0.041}, ...]
+    """
+    if rank_by not in RANK_OBJECTIVES:
+        raise ValueError(f"지원하지 않는 순위 기준: {rank_by}")
+    if not places or not users:
+        return places[:k]
+
+    distances = distance_matrix(users, places)
+    if rank_by == "provider":
+        order = np.arange(min(k, len(places)))
+        scores = np.zeros(len(places))
+    else:
+        if rank_by == "total":
+            objective = distances.sum(axis=0)
+        elif rank_by == "max":
+            objective = distances.max(axis=0)
+        else:
+            objective = distances.var(axis=0)
+        provider_rank = np.arange(len(places), dtype=float)
+        scores = (1 - provider_weight) * _normalize(objective) + provider_weight * _normalize(provider_rank)
+        order = top_k(scores, k)
+
+    rounded = np.rint(distances).astype(int)
+    return [
+        {**places[i], "user_distances": rounded[:, i].tolist(), "rank_score": round(float(scores[i]), 4)}
+        for i in order.tolist()
+    ]
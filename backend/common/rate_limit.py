@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+호출 속도 제한 모듈
+외부 API(Kakao 등) 호출을 초당 요청 수 예산 안에서 실행하도록 토큰 버킷 리미터를 제공합니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+from config import config
+
+
+class RateLimiter:
+    """asyncio용 토큰 버킷 리미터 (대기 순서 보장)"""
+
+    def __init__(self, rate: float, burst: int, name: str = ""):
+        """함수명: RateLimiter.__init__
+        기능: 초당 보충 토큰 수(rate)와 버킷 크기(burst)를 설정합니다. rate <= 0이면 제한하지 않습니다.
+        요청 파라미터(예시):
+          rate=10.0, burst=20, name="kakao"
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.name = name
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._acquired = 0
+        self._waited = 0
+        self._wait_seconds = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """함수명: acquire
+        기능: 토큰 하나를 소비합니다. 토큰이 없으면 보충될 때까지 기다리며, 대기자는 도착 순서대로 처리됩니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          - 없음
+        """
+        self._acquired += 1
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                self._waited += 1
+                self._wait_seconds += delay
+                await asyncio.sleep(delay)
+                self._refill()
+            self._tokens -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """함수명: get_stats
+        기능: 리미터 설정과 누적 대기 통계를 반환합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          {"rate": 10.0, "burst": 20, "tokens": 17.5, "acquired": 120, "waited": 8, "wait_seconds": 0.41}
+        """
+        if self.rate > 0:
+            self._refill()
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "acquired": self._acquired,
+            "waited": self._waited,
+            "wait_seconds": round(self._wait_seconds, 3),
+        }
+
+
+# 전역 Kakao 호출 리미터 (타일 검색 등 한 요청이 여러 번 호출하는 경우의 예산)
+kakao_rate_limiter = RateLimiter(config.KAKAO_RATE_LIMIT, config.KAKAO_RATE_BURST, name="kakao")
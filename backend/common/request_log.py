@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+요청 로그 파싱 모듈
+서버 로그(meetup_server.log)의 [REQ] 레코드에서 MCP 도구 호출(/mcp/call, /mcp/stream, /mcp/batch)을 추출합니다.
+"""
+
+import json
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_REQ_PATTERN = re.compile(
+    r"^(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?\[REQ\] (?P<method>[A-Z]+) (?P<path>\S+) body=(?P<body>.*)$"
+)
+
+
+# 도구 호출 본문을 기록하는 경로 (/mcp/batch는 {"calls": [...]} 안에 여러 호출)
+CALL_PATHS = frozenset({"/mcp/call", "/mcp/stream", "/mcp/batch"})
+
+
+def parse_request_calls(line: str) -> List[Dict[str, Any]]:
+    """함수명: parse_request_calls
+    기능: 로그 한 줄이 POST /mcp/call, /mcp/stream, /mcp/batch 요청이면 도구 호출 목록을 반환합니다.
+      배치 요청은 calls 배열의 호출을 모두 꺼내며, 텍스트/JSON 로그 형식을 모두 지원합니다.
+    요청 파라미터(예시):
+      line='2024-01-01 12:00:00 - server - INFO - [REQ] POST /mcp/batch body={"calls": [{"name": "...", "arguments": {...}}]}'
+    응답 파라미터(예시):
+      [{"timestamp": datetime(2024, 1, 1, 12, 0), "name": "recommend_meetup_restaurants", "arguments": {...}}]
+    """
+    line = line.rstrip("\n")
+    if line.startswith("{"):
+        # LOG_FORMAT=json 레코드는 ts/message 필드를 텍스트 형식과 같은 한 줄로 바꿔 해석
+        try:
+            record = json.loads(line)
+            line = f"{record['ts']} - {record.get('logger', '')} - {record['message']}"
+        except (ValueError, KeyError, TypeError):
+            return []
+    match = _REQ_PATTERN.match(line)
+    if not match or match.group("method") != "POST" or match.group("path") not in CALL_PATHS:
+        return []
+    try:
+        payload = json.loads(match.group("body"))
+    except ValueError:
+        return []
+    if not isinstance(payload, dict):
+        return []
+    entries = payload.get("calls") if match.group("path") == "/mcp/batch" else [payload]
+    if not isinstance(entries, list):
+        return []
+    timestamp = datetime.strptime(match.group("ts"), "%Y-%m-%d %H:%M:%S")
+    return [
+        {"timestamp": timestamp, "name": entry["name"], "arguments": entry.get("arguments") or {}}
+        for entry in entries
+        if isinstance(entry, dict) and entry.get("name")
+    ]
+
+
+def iter_logged_calls(path: str, name: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """함수명: iter_logged_calls
+    기능: 로그 파일에서 MCP 도구 호출을 순서대로 읽습니다. (잘린/깨진 본문은 건너뜀)
+    요청 파라미터(예시):
+      path="./logs/meetup_server.log", name="recommend_meetup_restaurants"
+    응답 파라미터(예시):
+      {"timestamp": ..., "name": "recommend_meetup_restaurants", "arguments": {...}} 반복
+    """
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            for call in parse_request_calls(line):
+                if name is None or call["name"] == name:
+                    yield call
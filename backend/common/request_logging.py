@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+요청 로깅 모듈
+로그 레코드를 큐에 넣고 백그라운드 스레드(QueueListener)에서 콘솔/회전 파일에 기록하며,
+요청/응답 본문을 버퍼링하지 않는 ASGI 로깅 미들웨어를 제공합니다.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Optional
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# 본문을 남기지 않고 그대로 흘려보낼 스트리밍 응답 형식
+STREAM_MEDIA_TYPES = (b"text/event-stream", b"application/x-ndjson")
+
+access_logger = logging.getLogger("server.access")
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 출력 (미들웨어의 http 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": self.formatTime(record, LOG_DATEFMT),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        http = getattr(record, "http", None)
+        if http:
+            payload["http"] = http
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def setup_logging(level: str = "INFO", log_dir: str = "./logs", filename: str = "meetup_server.log",
+                  max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5,
+                  fmt: str = "text") -> QueueListener:
+    """함수명: setup_logging
+    기능: 루트 로거에 QueueHandler만 연결하고, 실제 출력(콘솔 + 크기 기반 회전 파일)은
+      QueueListener 스레드가 처리하도록 설정합니다. 이벤트 루프에서는 큐에 넣는 비용만 듭니다.
+    요청 파라미터(예시):
+      level="INFO", log_dir="./logs", max_bytes=10485760, backup_count=5, fmt="text"
+    응답 파라미터(예시):
+      QueueListener 인스턴스 (이미 시작됨, 프로세스 종료 시 자동 stop)
+    """
+    os.makedirs(log_dir, exist_ok=True)
+    formatter = JsonFormatter() if fmt == "json" else logging.Formatter(LOG_FORMAT, LOG_DATEFMT)
+
+    stream_handler = logging.StreamHandler()
+    file_handler = RotatingFileHandler(
+        os.path.join(log_dir, filename), maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    for handler in (stream_handler, file_handler):
+        handler.setFormatter(formatter)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+
+    listener = QueueListener(log_queue, stream_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+class _BodySample:
+    """max_bytes까지만 본문 조각을 복사해 두는 버퍼"""
+
+    __slots__ = ("limit", "data", "size")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.data = bytearray()
+        self.size = 0
+
+    def add(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        room = self.limit - len(self.data)
+        if room > 0 and chunk:
+            self.data += chunk[:room]
+
+    def text(self) -> str:
+        text = self.data.decode("utf-8", errors="replace")
+        if self.size > len(self.data):
+            text += f"... [truncated {self.size - len(self.data)} bytes]"
+        return text
+
+
+class RequestLoggingMiddleware:
+    """본문을 버퍼링하지 않는 ASGI 요청/응답 로깅 미들웨어"""
+
+    def __init__(self, app, sample_rate: float = 1.0, max_body_bytes: int = 4096):
+        """함수명: RequestLoggingMiddleware.__init__
+        기능: 본문 샘플링 비율과 본문 최대 기록 크기를 설정합니다.
+          요청/응답 메시지는 그대로 전달하고, 샘플링된 요청만 max_body_bytes까지 본문을 복사해 기록합니다.
+        요청 파라미터(예시):
+          app=<ASGI app>, sample_rate=0.1, max_body_bytes=4096
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        self.app = app
+        self.sample_rate = sample_rate
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        started = time.perf_counter()
+        sampled = self.sample_rate >= 1.0 or (self.sample_rate > 0 and random.random() < self.sample_rate)
+        request_body = _BodySample(self.max_body_bytes) if sampled else None
+        response_body: Optional[_BodySample] = None
+        status = 500
+        request_logged = False
+
+        def log_request() -> None:
+            nonlocal request_logged
+            request_logged = True
+            access_logger.info(f"[REQ] {method} {path} body={request_body.text()}")
+
+        async def logging_receive():
+            message = await receive()
+            if request_body is not None and message["type"] == "http.request":
+                request_body.add(message.get("body", b""))
+                if not message.get("more_body", False) and not request_logged:
+                    log_request()
+            return message
+
+        async def logging_send(message):
+            nonlocal status, response_body
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if sampled:
+                    content_type = dict(message.get("headers") or []).get(b"content-type", b"")
+                    if not content_type.startswith(STREAM_MEDIA_TYPES):
+                        response_body = _BodySample(self.max_body_bytes)
+            elif message["type"] == "http.response.body" and response_body is not None:
+                response_body.add(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, logging_receive, logging_send)
+        finally:
+            if request_body is not None and not request_logged:
+                log_request()  # 본문을 읽지 않는 요청 (GET 등)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            http = {"method": method, "path": path, "status": status, "duration_ms": round(elapsed_ms, 2)}
+            if response_body is not None:
+                access_logger.info(
+                    f"[RES] {method} {path} {status} {elapsed_ms:.1f}ms body={response_body.text()}",
+                    extra={"http": http},
+                )
+            else:
+                access_logger.info(f"[RES] {method} {path} {status} {elapsed_ms:.1f}ms", extra={"http": http})
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+오프라인 이동 시간 라우팅 모듈
+로컬 도로/대중교통 그래프 파일(OSM, GTFS 등에서 추출)을 CSR 배열 인접 구조로 불러와
+참가자별 이동 시간 필드를 계산하고, 최대(또는 합계) 이동 시간이 가장 작은 노드를 만남 장소로 고릅니다.
+외부 라우팅 서비스 없이 로컬에서만 동작합니다.
+
+그래프 파일 형식:
+  - .npz: node_lat, node_lng (노드 좌표), edge_src, edge_dst (노드 번호), edge_time (초),
+          선택적으로 bidirectional (스칼라, 기본 False)
+  - .json: {"nodes": [[lat, lng], ...], "edges": [[src, dst, seconds], ...], "bidirectional": false}
+간선은 src → dst 방향이며, bidirectional이면 역방향 간선을 자동으로 추가합니다.
+"""
+
+import heapq
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import config
+from spatial import METERS_PER_DEG_LAT
+
+logger = logging.getLogger(__name__)
+
+# 선택 의존성 체크 (없으면 순수 Python 동시 진행 Dijkstra 사용)
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra as scipy_dijkstra
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+OBJECTIVES = ("max", "total")
+
+
+class TravelGraph:
+    """CSR(압축 희소 행) 배열 기반 방향 그래프"""
+
+    def __init__(self, node_lat: Sequence[float], node_lng: Sequence[float], edge_src: Sequence[int],
+                 edge_dst: Sequence[int], edge_time: Sequence[float], bidirectional: bool = False):
+        """함수명: TravelGraph.__init__
+        기능: 노드 좌표와 간선 목록을 받아 출발 노드 기준으로 정렬한 CSR 배열(indptr/indices/weights)을 만듭니다.
+        요청 파라미터(예시):
+          node_lat=[37.50, 37.51], node_lng=[127.00, 127.01], edge_src=[0], edge_dst=[1], edge_time=[95.0],
+          bidirectional=True
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        self.node_lat = np.asarray(node_lat, dtype=np.float64)
+        self.node_lng = np.asarray(node_lng, dtype=np.float64)
+        src = np.asarray(edge_src, dtype=np.int64)
+        dst = np.asarray(edge_dst, dtype=np.int64)
+        weight = np.asarray(edge_time, dtype=np.float64)
+        if bidirectional:
+            src, dst = np.concatenate((src, dst)), np.concatenate((dst, src))
+            weight = np.concatenate((weight, weight))
+
+        n = len(self.node_lat)
+        # (출발, 도착) 순으로 정렬하고 평행 간선은 가장 짧은 것만 유지
+        order = np.lexsort((weight, dst, src))
+        src, dst, weight = src[order], dst[order], weight[order]
+        keep = np.ones(len(src), dtype=bool)
+        keep[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+        src, dst, weight = src[keep], dst[keep], weight[keep]
+        self.indices = dst.astype(np.int32)
+        self.weights = weight
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+
+        # 최근접 노드 검색용 평면 좌표 (미터)
+        self._lat0 = float(self.node_lat.mean()) if n else 0.0
+        self._kx = METERS_PER_DEG_LAT * np.cos(np.radians(self._lat0))
+        self._xy = np.column_stack((self.node_lng * self._kx, self.node_lat * METERS_PER_DEG_LAT))
+        self._csr = None
+        self._lists: Optional[Tuple[List[int], List[int], List[float]]] = None
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_lat)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+
+    @classmethod
+    def load(cls, path: str) -> "TravelGraph":
+        """함수명: TravelGraph.load
+        기능: .npz 또는 .json 그래프 파일을 읽습니다. (모듈 설명의 파일 형식 참고)
+        요청 파라미터(예시):
+          path="./data/seoul_graph.npz"
+        응답 파라미터(예시):
+          TravelGraph 인스턴스
+        """
+        if path.endswith(".npz"):
+            with np.load(path) as data:
+                bidirectional = bool(data["bidirectional"]) if "bidirectional" in data.files else False
+                return cls(data["node_lat"], data["node_lng"], data["edge_src"], data["edge_dst"],
+                           data["edge_time"], bidirectional)
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        nodes = np.asarray(data["nodes"], dtype=np.float64).reshape(-1, 2)
+        edges = np.asarray(data["edges"], dtype=np.float64).reshape(-1, 3)
+        return cls(nodes[:, 0], nodes[:, 1], edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64),
+                   edges[:, 2], bool(data.get("bidirectional", False)))
+
+    def save(self, path: str) -> None:
+        """함수명: save
+        기능: 그래프를 .npz 파일로 저장합니다. (CSR을 간선 목록으로 풀어서 저장)
+        요청 파라미터(예시):
+          path="./data/seoul_graph.npz"
+        응답 파라미터(예시):
+          - 없음
+        """
+        src = np.repeat(np.arange(self.node_count, dtype=np.int32), np.diff(self.indptr))
+        np.savez_compressed(path, node_lat=self.node_lat, node_lng=self.node_lng, edge_src=src,
+                            edge_dst=self.indices, edge_time=self.weights, bidirectional=False)
+
+    def nearest_nodes(self, lats: Sequence[float], lngs: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """함수명: nearest_nodes
+        기능: 각 좌표에서 가장 가까운 노드 번호와 그 노드까지의 직선 거리(미터)를 반환합니다.
+        요청 파라미터(예시):
+          lats=[37.5665, 37.3943], lngs=[126.9780, 127.1107]
+        응답 파라미터(예시):
+          (array([1042, 88211]), array([35.2, 120.8]))
+        """
+        points = np.column_stack((np.asarray(lngs, dtype=np.float64) * self._kx,
+                                  np.asarray(lats, dtype=np.float64) * METERS_PER_DEG_LAT))
+        nodes = np.empty(len(points), dtype=np.int64)
+        dists = np.empty(len(points), dtype=np.float64)
+        for i, point in enumerate(points):
+            d2 = ((self._xy - point) ** 2).sum(axis=1)
+            nodes[i] = int(d2.argmin())
+            dists[i] = float(np.sqrt(d2[nodes[i]]))
+        return nodes, dists
+
+    def csr(self):
+        """scipy.sparse.csr_matrix 뷰 (scipy 사용 시)"""
+        if self._csr is None:
+            n = self.node_count
+            self._csr = csr_matrix((self.weights, self.indices, self.indptr), shape=(n, n))
+        return self._csr
+
+    def lists(self) -> Tuple[List[int], List[int], List[float]]:
+        """순수 Python 탐색용 리스트 사본 (numpy 스칼라 인덱싱보다 빠름)"""
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist(), self.weights.tolist())
+        return self._lists
+
+
+def travel_fields(graph: TravelGraph, sources: Sequence[int], offsets: Sequence[float],
+                  max_time: float = np.inf) -> np.ndarray:
+    """함수명: travel_fields
+    기능: 참가자별 출발 노드에서 모든 노드까지의 이동 시간(초) 행렬을 계산합니다. (scipy 필요)
+      offsets는 참가자 위치에서 출발 노드까지의 접근 시간이며, max_time을 넘는 노드는 inf입니다.
+    요청 파라미터(예시):
+      graph=<TravelGraph>, sources=[1042, 88211], offsets=[29.3, 100.7], max_time=7200
+    응답 파라미터(예시):
+      array(shape=(2, node_count))
+    """
+    fields = scipy_dijkstra(graph.csr(), directed=True, indices=np.asarray(sources), limit=max_time)
+    return fields + np.asarray(offsets, dtype=np.float64)[:, None]
+
+
+def lockstep_meeting_node(graph: TravelGraph, sources: Sequence[int], offsets: Sequence[float],
+                          objective: str = "max", max_time: float = np.inf) -> Optional[Tuple[int, List[float]]]:
+    """함수명: lockstep_meeting_node
+    기능: 모든 참가자의 Dijkstra를 하나의 힙에서 시간 순으로 함께 진행합니다 (scipy 없을 때 사용).
+      - max: 모든 참가자가 처음으로 함께 도달한 노드가 최대 이동 시간 최소 노드이므로 바로 종료합니다.
+      - total: 도달한 노드의 합계 최솟값이, 아직 덜 도달한 노드의 하한(알려진 시간 + 남은 인원 × 현재 시간)
+        이하가 되면 종료합니다.
+    요청 파라미터(예시):
+      graph=<TravelGraph>, sources=[1042, 88211], offsets=[29.3, 100.7], objective="max"
+    응답 파라미터(예시):
+      (55120, [812.4, 809.9])  (모두가 도달할 수 있는 노드가 없으면 None)
+    """
+    indptr, indices, weights = graph.lists()
+    k = len(sources)
+    n = graph.node_count
+    inf = float("inf")
+    # 참가자 i의 노드 v 상태는 v * k + i 위치에 저장 (dict보다 빠른 평면 리스트)
+    best = [inf] * (n * k)
+    settled = bytearray(n * k)
+    reached_count = [0] * n
+    reached_sum = [0.0] * n
+    heap: List[Tuple[float, int, int]] = []
+    for i, (node, offset) in enumerate(zip(sources, offsets)):
+        slot = int(node) * k + i
+        if float(offset) < best[slot]:
+            best[slot] = float(offset)
+            heap.append((float(offset), i, int(node)))
+    heapq.heapify(heap)
+    heappop, heappush = heapq.heappop, heapq.heappush
+
+    best_node, best_total = -1, inf
+    partial: Dict[int, None] = {}  # 일부 참가자만 도달한 노드 (total 하한 계산용)
+    pops = 0
+    while heap:
+        t, i, v = heappop(heap)
+        if t > max_time:
+            break
+        slot = v * k + i
+        if settled[slot]:
+            continue
+        settled[slot] = 1
+        count = reached_count[v] + 1
+        reached_count[v] = count
+        reached_sum[v] += t
+        if count == k:
+            if objective == "max":
+                return v, [best[v * k + j] for j in range(k)]
+            partial.pop(v, None)
+            if reached_sum[v] < best_total:
+                best_node, best_total = v, reached_sum[v]
+        elif objective == "total":
+            partial[v] = None
+
+        pops += 1
+        if objective == "total" and best_node >= 0 and pops % 16384 == 0:
+            # 아직 모두 도달하지 않은 노드의 합계 하한 (미도달 노드는 k * t)
+            bound = k * t
+            for node in partial:
+                bound = min(bound, reached_sum[node] + (k - reached_count[node]) * t)
+            if bound >= best_total:
+                break
+
+        for e in range(indptr[v], indptr[v + 1]):
+            w = indices[e]
+            nt = t + weights[e]
+            slot = w * k + i
+            if nt < best[slot] and not settled[slot]:
+                best[slot] = nt
+                heappush(heap, (nt, i, w))
+
+    if best_node < 0:
+        return None
+    return best_node, [best[best_node * k + j] for j in range(k)]
+
+
+class TravelTimeRouter:
+    """그래프 로드/최근접 노드 스냅/만남 노드 선택을 담당하는 라우터"""
+
+    def __init__(self, graph_file: Optional[str] = None, objective: str = "max", walk_speed: float = 1.2,
+                 max_snap: float = 1000.0, max_time: float = 7200.0, memo_size: int = 256):
+        """함수명: TravelTimeRouter.__init__
+        기능: 그래프 파일 경로와 탐색 옵션을 설정합니다. (그래프는 load() 또는 최초 사용 시 로드)
+        요청 파라미터(예시):
+          graph_file="./data/seoul_graph.npz", objective="max", walk_speed=1.2, max_snap=1000, max_time=7200
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"지원하지 않는 이동 시간 목표: {objective}")
+        self.graph_file = graph_file
+        self.objective = objective
+        self.walk_speed = walk_speed
+        self.max_snap = max_snap
+        self.max_time = max_time
+        self.graph: Optional[TravelGraph] = None
+        self._load_failed = False
+        self._memo: "OrderedDict[Tuple, Optional[Dict[str, Any]]]" = OrderedDict()
+        self._memo_size = memo_size
+        self._lock = threading.Lock()  # 이벤트 루프와 작업 스레드(asyncio.to_thread)에서 함께 사용
+        self._stats = {"queries": 0, "memo_hits": 0, "no_route": 0, "total_ms": 0.0}
+
+    @property
+    def enabled(self) -> bool:
+        """그래프 파일이 설정돼 있는지 여부"""
+        return bool(self.graph_file)
+
+    def load(self) -> bool:
+        """함수명: load
+        기능: 그래프 파일을 읽어 CSR 구조를 만듭니다. 실패하면 경고 후 비활성 상태로 둡니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          True (로드 성공) / False
+        """
+        if self.graph is not None:
+            return True
+        if not self.graph_file or self._load_failed:
+            return False
+        with self._lock:
+            if self.graph is not None:
+                return True
+            started = time.perf_counter()
+            try:
+                self.graph = TravelGraph.load(self.graph_file)
+            except Exception as e:
+                self._load_failed = True
+                logger.warning(f"⚠️ 이동 시간 그래프 로드 실패 ({self.graph_file}): {e}")
+                return False
+        logger.info(
+            f"🗺️ 이동 시간 그래프 로드: 노드 {self.graph.node_count:,}개, 간선 {self.graph.edge_count:,}개 "
+            f"({(time.perf_counter() - started) * 1000:.0f}ms, backend={'scipy' if SCIPY_AVAILABLE else 'heapq'})"
+        )
+        return True
+
+    def meeting_point(self, users: List[Dict[str, float]], objective: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """함수명: meeting_point
+        기능: 참가자 좌표를 가장 가까운 노드로 스냅한 뒤 최대(max) 또는 합계(total) 이동 시간이 가장 작은
+          노드를 찾습니다. 같은 스냅 결과의 반복 계산은 메모이즈합니다.
+          그래프가 없거나, 참가자가 그래프에서 max_snap보다 멀거나, 모두 도달 가능한 노드가 없으면 None입니다.
+        요청 파라미터(예시):
+          users=[{"lat": 37.5665, "lng": 126.9780}, {"lat": 37.3943, "lng": 127.1107}], objective="max"
+        응답 파라미터(예시):
+          {"lat": 37.4861, "lng": 127.0335, "node": 55120, "objective": "max",
+           "times_s": [812.4, 809.9], "max_s": 812.4, "total_s": 1622.3}
+        """
+        objective = objective or self.objective
+        if not self.load():
+            return None
+        graph = self.graph
+        nodes, snap_m = graph.nearest_nodes([u["lat"] for u in users], [u["lng"] for u in users])
+        if (snap_m > self.max_snap).any():
+            self._stats["no_route"] += 1
+            return None
+        offsets = np.round(snap_m / self.walk_speed, 1)
+
+        self._stats["queries"] += 1
+        key = (tuple(nodes.tolist()), tuple(offsets.tolist()), objective)
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                self._stats["memo_hits"] += 1
+                return self._memo[key]
+
+        started = time.perf_counter()
+        if SCIPY_AVAILABLE:
+            fields = travel_fields(graph, nodes, offsets, self.max_time)
+            score = fields.max(axis=0) if objective == "max" else fields.sum(axis=0)
+            node = int(score.argmin())
+            found = (node, fields[:, node].tolist()) if np.isfinite(score[node]) else None
+        else:
+            found = lockstep_meeting_node(graph, nodes, offsets, objective, self.max_time)
+        self._stats["total_ms"] += (time.perf_counter() - started) * 1000
+
+        result = None
+        if found is None:
+            self._stats["no_route"] += 1
+        else:
+            node, times = found
+            result = {
+                "lat": float(graph.node_lat[node]),
+                "lng": float(graph.node_lng[node]),
+                "node": node,
+                "objective": objective,
+                "times_s": [round(t, 1) for t in times],
+                "max_s": round(max(times), 1),
+                "total_s": round(sum(times), 1),
+            }
+        with self._lock:
+            self._memo[key] = result
+            if len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """함수명: get_stats
+        기능: 그래프 로드 상태와 계산 통계를 반환합니다.
+        요청 파라미터(예시):
+          - 없음
+        응답 파라미터(예시):
+          {"enabled": true, "loaded": true, "nodes": 90000, "edges": 358800, "backend": "scipy",
+           "objective": "max", "queries": 12, "memo_hits": 5, "no_route": 0, "avg_ms": 48.2}
+        """
+        computed = self._stats["queries"] - self._stats["memo_hits"]
+        return {
+            "enabled": self.enabled,
+            "loaded": self.graph is not None,
+            "nodes": self.graph.node_count if self.graph is not None else 0,
+            "edges": self.graph.edge_count if self.graph is not None else 0,
+            "backend": "scipy" if SCIPY_AVAILABLE else "heapq",
+            "objective": self.objective,
+            "queries": self._stats["queries"],
+            "memo_hits": self._stats["memo_hits"],
+            "no_route": self._stats["no_route"],
+            "avg_ms": round(self._stats["total_ms"] / computed, 2) if computed > 0 else 0.0,
+        }
+
+
+# 전역 라우터 인스턴스
+travel_router = TravelTimeRouter(**config.get_routing_config())
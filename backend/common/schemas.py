@@ -26,7 +26,19 @@ MCP_TOOL_SCHEMA = {
             },
             "radius": {"type": "integer", "default": 1000, "description": "검색 반경 (미터)"},
             "cuisine": {"type": "string", "description": "선호 요리 키워드"},
-            "max_results": {"type": "integer", "default": 15, "description": "결과 개수 제한"}
+            "max_results": {"type": "integer", "default": 15, "description": "결과 개수 제한 (15건 초과 시 Kakao 추가 페이지 조회, 최대 15 × KAKAO_MAX_PAGES)"},
+            "midpoint_mode": {
+                "type": "string",
+                "enum": ["centroid", "median", "minimax", "travel_time"],
+                "default": "centroid",
+                "description": "중간 지점 계산 방식 (centroid: 좌표 평균, median: 이동 거리 합 최소, minimax: 가장 먼 사람의 이동 거리 최소, travel_time: 도로/대중교통 그래프 기준 이동 시간 최소)"
+            },
+            "rank_by": {
+                "type": "string",
+                "enum": ["provider", "total", "max", "variance"],
+                "default": "provider",
+                "description": "식당 순위 기준 (provider: 검색 제공자 순서, total: 참가자 이동 거리 합 최소, max: 가장 먼 참가자의 거리 최소, variance: 참가자 간 거리 차이 최소)"
+            }
         },
         "required": ["users"]
     }
@@ -41,6 +53,7 @@ DEFAULT_RESPONSE_FORMAT = {
     "midpoint": {
         "lat": 0.0, 
         "lng": 0.0,
+        "mode": "centroid",
         "address": "",
         "road_address": "",
         "jibun_address": "",
@@ -50,8 +63,9 @@ DEFAULT_RESPONSE_FORMAT = {
     },
     "users": [],
     "restaurants": [],
-    "source_stats": {"kakao": 0, "naver": 0, "total": 0},
+    "source_stats": {"kakao": 0, "naver": 0, "catalog": 0, "total": 0},
     "query": "",
     "total_found": 0,
-    "returned": 0
+    "returned": 0,
+    "images_pending": []
 }
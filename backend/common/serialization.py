@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+캐시 직렬화 모듈
+캐시 값을 버전 헤더가 붙은 바이너리(msgpack/JSON + 선택적 zlib/zstd 압축)로 변환합니다.
+
+저장 형식:
+  [형식 바이트][압축 바이트][본문]
+  - 형식: 0x01 JSON(UTF-8), 0x02 msgpack
+  - 압축: 0x00 없음, 0x01 zlib, 0x02 zstd
+헤더 없이 저장된 이전 JSON 텍스트 값도 그대로 읽을 수 있습니다.
+"""
+
+import json
+import logging
+import zlib
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# 선택 의존성 체크
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+FORMAT_JSON = 0x01
+FORMAT_MSGPACK = 0x02
+
+COMPRESSION_NONE = 0x00
+COMPRESSION_ZLIB = 0x01
+COMPRESSION_ZSTD = 0x02
+
+_FORMATS = {"json": FORMAT_JSON, "msgpack": FORMAT_MSGPACK}
+_COMPRESSIONS = {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "zstd": COMPRESSION_ZSTD}
+
+
+class SerializationError(ValueError):
+    """알 수 없는 형식/압축 헤더이거나 본문을 해석할 수 없는 경우"""
+
+
+class Serializer:
+    """버전 헤더 기반 캐시 직렬화기"""
+
+    def __init__(self, fmt: str = "msgpack", compression: str = "zlib", threshold: int = 1024,
+                 level: int = 3):
+        """함수명: Serializer.__init__
+        기능: 직렬화 형식과 압축 방식을 설정합니다. 설치되지 않은 선택 의존성은 대체 방식으로 전환합니다.
+          (msgpack 미설치 → JSON, zstandard 미설치 → zlib)
+        요청 파라미터(예시):
+          fmt="msgpack", compression="zstd", threshold=1024, level=3
+        응답 파라미터(예시):
+          - 없음 (인스턴스 내부 상태 설정)
+        """
+        if fmt not in _FORMATS:
+            raise ValueError(f"지원하지 않는 직렬화 형식: {fmt}")
+        if compression not in _COMPRESSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+        if fmt == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack 모듈이 없어 JSON 직렬화를 사용합니다. pip install msgpack을 실행하세요.")
+            fmt = "json"
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard 모듈이 없어 zlib 압축을 사용합니다.")
+            compression = "zlib"
+
+        self.fmt = fmt
+        self.compression = compression
+        self.threshold = threshold
+        self.level = level
+        self._zstd_compressor = zstandard.ZstdCompressor(level=level) if compression == "zstd" else None
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None
+
+    def dumps(self, value: Any) -> bytes:
+        """함수명: dumps
+        기능: 값을 헤더가 붙은 바이트로 직렬화하고, threshold 이상이면 압축합니다.
+        요청 파라미터(예시):
+          value={"restaurants": [...]}
+        응답 파라미터(예시):
+          b"\\x02\\x01x\\x9c..."
+        """
+        if self.fmt == "msgpack":
+            body = msgpack.packb(value, use_bin_type=True, default=str)
+            fmt_byte = FORMAT_MSGPACK
+        else:
+            body = json.dumps(value, ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8")
+            fmt_byte = FORMAT_JSON
+
+        comp_byte = COMPRESSION_NONE
+        if self.compression != "none" and len(body) >= self.threshold:
+            if self.compression == "zstd":
+                body = self._zstd_compressor.compress(body)
+                comp_byte = COMPRESSION_ZSTD
+            else:
+                body = zlib.compress(body, self.level)
+                comp_byte = COMPRESSION_ZLIB
+        return bytes((fmt_byte, comp_byte)) + body
+
+    def loads(self, data: Optional[bytes]) -> Any:
+        """함수명: loads
+        기능: 헤더를 보고 압축 해제/역직렬화합니다. 헤더가 없으면 이전 형식(JSON 텍스트)으로 해석합니다.
+        요청 파라미터(예시):
+          data=b"\\x02\\x01x\\x9c..."
+        응답 파라미터(예시):
+          {"restaurants": [...]}
+        """
+        if data is None:
+            return None
+        if isinstance(data, str):
+            return json.loads(data)
+        if not data or data[0] >= 0x20:
+            # 헤더 없는 이전 JSON 텍스트 값
+            return json.loads(data.decode("utf-8"))
+        if len(data) < 2:
+            raise SerializationError("캐시 값 헤더가 잘렸습니다")
+
+        fmt_byte, comp_byte, body = data[0], data[1], data[2:]
+        if comp_byte == COMPRESSION_ZLIB:
+            body = zlib.decompress(body)
+        elif comp_byte == COMPRESSION_ZSTD:
+            if self._zstd_decompressor is None:
+                raise SerializationError("zstd 압축 값이지만 zstandard 모듈이 없습니다")
+            body = self._zstd_decompressor.decompress(body)
+        elif comp_byte != COMPRESSION_NONE:
+            raise SerializationError(f"알 수 없는 압축 방식: {comp_byte}")
+
+        if fmt_byte == FORMAT_MSGPACK:
+            if not MSGPACK_AVAILABLE:
+                raise SerializationError("msgpack 값이지만 msgpack 모듈이 없습니다")
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+        if fmt_byte == FORMAT_JSON:
+            return json.loads(body.decode("utf-8"))
+        raise SerializationError(f"알 수 없는 직렬화 형식: {fmt_byte}")
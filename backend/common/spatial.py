@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+공간 유틸리티 모듈
+geohash 인코딩/디코딩, 거리 계산, 검색 타일 분할 등 좌표 관련 공통 기능을 제공합니다.
+"""
+
+import math
+from typing import List, Tuple
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_BASE32_INDEX = {c: i for i, c in enumerate(_BASE32)}
+
+EARTH_RADIUS_M = 6371008.8
+
+
+def geohash_encode(lat: float, lng: float, precision: int = 8) -> str:
+    """함수명: geohash_encode
+    기능: 위경도를 지정한 정밀도의 geohash 문자열로 변환합니다.
+      (정밀도 7 ≈ 153m x 153m, 8 ≈ 38m x 19m)
+    요청 파라미터(예시):
+      lat=37.4979, lng=127.0276, precision=7
+    응답 파라미터(예시):
+      "wydm6d6"
+    """
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            if lng >= mid:
+                bits = (bits << 1) | 1
+                lng_lo = mid
+            else:
+                bits <<= 1
+                lng_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_lo = mid
+            else:
+                bits <<= 1
+                lat_hi = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def geohash_bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """함수명: geohash_bounds
+    기능: geohash 셀의 경계(남, 서, 북, 동)를 반환합니다.
+    요청 파라미터(예시):
+      geohash="wydm6d6"
+    응답 파라미터(예시):
+      (37.4977, 127.0267, 37.4991, 127.0280)
+    """
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    even = True
+    for c in geohash:
+        value = _BASE32_INDEX[c]
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            if even:
+                mid = (lng_lo + lng_hi) / 2
+                if bit:
+                    lng_lo = mid
+                else:
+                    lng_hi = mid
+            else:
+                mid = (lat_lo + lat_hi) / 2
+                if bit:
+                    lat_lo = mid
+                else:
+                    lat_hi = mid
+            even = not even
+    return lat_lo, lng_lo, lat_hi, lng_hi
+
+
+def geohash_decode(geohash: str) -> Tuple[float, float]:
+    """함수명: geohash_decode
+    기능: geohash 셀의 중심 좌표를 반환합니다.
+    요청 파라미터(예시):
+      geohash="wydm6d6"
+    응답 파라미터(예시):
+      (37.4984, 127.0274)
+    """
+    lat_lo, lng_lo, lat_hi, lng_hi = geohash_bounds(geohash)
+    return (lat_lo + lat_hi) / 2, (lng_lo + lng_hi) / 2
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """함수명: haversine_m
+    기능: 두 좌표 사이의 대원 거리(미터)를 계산합니다.
+    요청 파라미터(예시):
+      lat1=37.5665, lng1=126.9780, lat2=37.3943, lng2=127.1107
+    응답 파라미터(예시):
+      22444.4
+    """
+    p1 = math.radians(lat1)
+    p2 = math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+METERS_PER_DEG_LAT = math.pi * EARTH_RADIUS_M / 180
+
+
+def grid_tiles(lat: float, lng: float, radius_m: float, tile_m: float,
+               max_tiles: int = 25) -> Tuple[float, List[Tuple[float, float]]]:
+    """함수명: grid_tiles
+    기능: 검색 원(lat, lng, radius_m)과 겹치는 전역 격자 타일의 중심 좌표 목록을 반환합니다.
+      격자는 위도 0/경도 0 기준으로 고정돼 있어 서로 다른 검색도 같은 타일 좌표를 공유합니다.
+      타일 수가 max_tiles를 넘으면 타일 한 변을 2배씩 키워 다시 계산합니다.
+    요청 파라미터(예시):
+      lat=37.4804, lng=127.04435, radius_m=8000, tile_m=2000, max_tiles=25
+    응답 파라미터(예시):
+      (4000.0, [(37.4595, 127.0126), (37.4595, 127.0578), ...])
+    """
+    tile_m = float(tile_m)
+    while True:
+        tiles = _tiles_in_circle(lat, lng, radius_m, tile_m)
+        if len(tiles) <= max(max_tiles, 1):
+            return tile_m, tiles
+        tile_m *= 2
+
+
+def _tiles_in_circle(lat: float, lng: float, radius_m: float, tile_m: float) -> List[Tuple[float, float]]:
+    lat_step = tile_m / METERS_PER_DEG_LAT
+    center_scale = METERS_PER_DEG_LAT * math.cos(math.radians(lat))
+    lat_span = radius_m / METERS_PER_DEG_LAT
+
+    tiles: List[Tuple[float, float]] = []
+    for row in range(math.floor((lat - lat_span) / lat_step), math.floor((lat + lat_span) / lat_step) + 1):
+        row_lat = (row + 0.5) * lat_step
+        # 행마다 경도 간격을 고정해 타일이 대략 정사각형이 되도록 함 (행 위치만으로 결정되므로 전역 격자 유지)
+        lng_step = tile_m / (METERS_PER_DEG_LAT * math.cos(math.radians(row_lat)))
+        lng_span = radius_m / center_scale
+        for col in range(math.floor((lng - lng_span) / lng_step), math.floor((lng + lng_span) / lng_step) + 1):
+            # 타일 사각형에서 검색 중심에 가장 가까운 점이 반경 안에 있으면 포함
+            near_lat = min(max(lat, row * lat_step), (row + 1) * lat_step)
+            near_lng = min(max(lng, col * lng_step), (col + 1) * lng_step)
+            dy = (near_lat - lat) * METERS_PER_DEG_LAT
+            dx = (near_lng - lng) * center_scale
+            if dx * dx + dy * dy <= radius_m * radius_m:
+                tiles.append((round(row_lat, 6), round((col + 0.5) * lng_step, 6)))
+    return tiles
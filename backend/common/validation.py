@@ -7,6 +7,9 @@
 from typing import Dict, Any, List, Tuple, Optional
 from fastapi import HTTPException
 
+from midpoint import MIDPOINT_MODES
+from ranking import RANK_OBJECTIVES
+
 
 def validate_users(users: List[Dict[str, Any]], field_name: str = "users") -> List[Dict[str, Any]]:
     """함수명: validate_users
@@ -73,3 +76,37 @@ def extract_search_parameters(arguments: Dict[str, Any]) -> Tuple[int, Optional[
     max_results = int(arguments.get("max_results") or arguments.get("limit", 15))
     
     return radius, cuisine, max_results
+
+
+def extract_midpoint_mode(arguments: Dict[str, Any], default: str = "centroid") -> str:
+    """함수명: extract_midpoint_mode
+    기능: 중간 지점 계산 모드를 추출하고 검증합니다. (centroid | median | minimax | travel_time)
+    요청 파라미터(예시):
+      arguments = {"midpoint_mode": "minimax"}, default = "centroid"
+    응답 파라미터(예시):
+      "minimax"
+    """
+    mode = arguments.get("midpoint_mode") or default
+    if mode not in MIDPOINT_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"midpoint_mode는 {', '.join(MIDPOINT_MODES)} 중 하나여야 합니다"
+        )
+    return mode
+
+
+def extract_rank_by(arguments: Dict[str, Any], default: str = "provider") -> str:
+    """함수명: extract_rank_by
+    기능: 식당 순위 기준을 추출하고 검증합니다. (provider | total | max | variance)
+    요청 파라미터(예시):
+      arguments = {"rank_by": "max"}, default = "provider"
+    응답 파라미터(예시):
+      "max"
+    """
+    rank_by = arguments.get("rank_by") or default
+    if rank_by not in RANK_OBJECTIVES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"rank_by는 {', '.join(RANK_OBJECTIVES)} 중 하나여야 합니다"
+        )
+    return rank_by
@@ -21,6 +21,91 @@ class Config:
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
     REDIS_PASSWORD: Optional[str] = os.getenv("REDIS_PASSWORD")
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+    CACHE_L1_ENABLED: bool = os.getenv("CACHE_L1_ENABLED", "true").lower() == "true"
+    CACHE_L1_MAX_ENTRIES: int = int(os.getenv("CACHE_L1_MAX_ENTRIES", "10000"))
+    CACHE_L1_MAX_BYTES: int = int(os.getenv("CACHE_L1_MAX_BYTES", str(64 * 1024 * 1024)))
+    CACHE_L1_TTL: int = int(os.getenv("CACHE_L1_TTL", "60"))
+    CACHE_SERIALIZER: str = os.getenv("CACHE_SERIALIZER", "msgpack")  # msgpack | json
+    CACHE_COMPRESSION: str = os.getenv("CACHE_COMPRESSION", "zlib")  # zlib | zstd | none
+    CACHE_COMPRESS_THRESHOLD: int = int(os.getenv("CACHE_COMPRESS_THRESHOLD", "1024"))  # 바이트
+    CACHE_LOCK_ENABLED: bool = os.getenv("CACHE_LOCK_ENABLED", "false").lower() == "true"
+    CACHE_LOCK_TTL_MS: int = int(os.getenv("CACHE_LOCK_TTL_MS", "10000"))
+    CACHE_LOCK_WAIT: float = float(os.getenv("CACHE_LOCK_WAIT", "2.0"))
+    CACHE_STALE_TTL: int = int(os.getenv("CACHE_STALE_TTL", "3600"))  # soft TTL 이후 stale 허용 시간 (초)
+    CACHE_KEY_COORD_GRID: float = float(os.getenv("CACHE_KEY_COORD_GRID", "0"))  # 도 단위, 0이면 양자화 안 함
+    CACHE_TAG_REGION_PRECISION: int = int(os.getenv("CACHE_TAG_REGION_PRECISION", "5"))  # geohash 5 ≈ 4.9km x 4.9km
+    
+    # HTTP 클라이언트 설정 (외부 API 커넥션 풀)
+    HTTP_POOL_LIMIT: int = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+    HTTP_POOL_LIMIT_PER_HOST: int = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20"))
+    HTTP_DNS_CACHE_TTL: int = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+    HTTP_KEEPALIVE_TIMEOUT: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+    HTTP_TOTAL_TIMEOUT: float = float(os.getenv("HTTP_TOTAL_TIMEOUT", "10"))
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3"))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", "8"))
+    
+    # 역지오코딩 설정 (hedged: 카카오 지연 시 네이버 병행 호출)
+    GEOCODE_HEDGE_ENABLED: bool = os.getenv("GEOCODE_HEDGE_ENABLED", "false").lower() == "true"
+    GEOCODE_HEDGE_DELAY: float = float(os.getenv("GEOCODE_HEDGE_DELAY", "0.3"))
+    GEOCODE_CACHE_ENABLED: bool = os.getenv("GEOCODE_CACHE_ENABLED", "true").lower() == "true"
+    GEOCODE_CACHE_PRECISION: int = int(os.getenv("GEOCODE_CACHE_PRECISION", "8"))  # geohash 8 ≈ 38m x 19m
+    GEOCODE_CACHE_TTL: int = int(os.getenv("GEOCODE_CACHE_TTL", "604800"))  # 7일
+    GEOCODE_PRELOAD_FILE: Optional[str] = os.getenv("GEOCODE_PRELOAD_FILE")
+    
+    # 중간 지점 설정
+    MIDPOINT_MODE: str = os.getenv("MIDPOINT_MODE", "centroid")  # 기본 계산 방식: centroid | median | minimax
+    
+    # 후보 순위 설정
+    RANK_BY: str = os.getenv("RANK_BY", "provider")  # 기본 순위 기준: provider | total | max | variance
+    RANK_PROVIDER_WEIGHT: float = float(os.getenv("RANK_PROVIDER_WEIGHT", "0.2"))  # 제공자 순위 반영 비율 (0~1)
+    RANK_CANDIDATES: int = int(os.getenv("RANK_CANDIDATES", "30"))  # provider 외 기준에서 순위 계산에 쓸 최소 후보 수
+    
+    # 이동 시간 라우팅 설정 (midpoint_mode="travel_time")
+    ROUTING_GRAPH_FILE: Optional[str] = os.getenv("ROUTING_GRAPH_FILE")  # .npz 또는 .json 그래프 파일
+    ROUTING_OBJECTIVE: str = os.getenv("ROUTING_OBJECTIVE", "max")  # max(최대 이동 시간) | total(이동 시간 합)
+    ROUTING_WALK_SPEED: float = float(os.getenv("ROUTING_WALK_SPEED", "1.2"))  # 그래프 노드까지 도보 속도(m/s)
+    ROUTING_MAX_SNAP: float = float(os.getenv("ROUTING_MAX_SNAP", "1000"))  # 그래프 노드까지 허용 거리(m)
+    ROUTING_MAX_TIME: float = float(os.getenv("ROUTING_MAX_TIME", "7200"))  # 탐색 최대 이동 시간(초)
+    
+    # Kakao 검색 설정
+    KAKAO_MAX_PAGES: int = int(os.getenv("KAKAO_MAX_PAGES", "3"))  # 검색당 최대 페이지 수 (페이지당 15건, API 최대 45)
+    KAKAO_RATE_LIMIT: float = float(os.getenv("KAKAO_RATE_LIMIT", "10"))  # 초당 호출 수 (0이면 제한 없음)
+    KAKAO_RATE_BURST: int = int(os.getenv("KAKAO_RATE_BURST", "20"))
+    KAKAO_TILE_ENABLED: bool = os.getenv("KAKAO_TILE_ENABLED", "true").lower() == "true"
+    KAKAO_TILE_THRESHOLD: int = int(os.getenv("KAKAO_TILE_THRESHOLD", "5000"))  # 이 반경(m)을 넘으면 타일 검색
+    KAKAO_TILE_SIZE: int = int(os.getenv("KAKAO_TILE_SIZE", "2000"))  # 타일 한 변 최소 길이(m)
+    KAKAO_TILE_MAX: int = int(os.getenv("KAKAO_TILE_MAX", "25"))  # 검색당 최대 타일 수 (넘으면 타일 크기 2배)
+    KAKAO_TILE_RESULTS: int = int(os.getenv("KAKAO_TILE_RESULTS", "15"))  # 타일당 조회 건수
+    
+    # 네이버 지역 검색 / 장소 병합 설정
+    NAVER_LOCAL_ENABLED: bool = os.getenv("NAVER_LOCAL_ENABLED", "true").lower() == "true"
+    NAVER_LOCAL_DISPLAY: int = int(os.getenv("NAVER_LOCAL_DISPLAY", "5"))  # API 최대 5
+    PLACE_MERGE_DISTANCE: float = float(os.getenv("PLACE_MERGE_DISTANCE", "100"))  # 같은 장소로 볼 최대 거리(m)
+    PLACE_MERGE_SIMILARITY: float = float(os.getenv("PLACE_MERGE_SIMILARITY", "0.6"))  # 장소명 유사도 기준 (0~1)
+    
+    # 로컬 장소 카탈로그 설정
+    PLACE_CATALOG_MODE: str = os.getenv("PLACE_CATALOG_MODE", "off")  # off | write_through | primary | fallback | gap_fill
+    PLACE_CATALOG_PATH: str = os.getenv("PLACE_CATALOG_PATH", "./data/places.db")
+    PLACE_CATALOG_CELL_M: float = float(os.getenv("PLACE_CATALOG_CELL_M", "500"))  # 격자 셀 크기(m)
+    PLACE_CATALOG_MAX_AGE: float = float(os.getenv("PLACE_CATALOG_MAX_AGE", str(7 * 86400)))  # primary/gap_fill 신선도(초)
+    PLACE_CATALOG_STALE_AGE: float = float(os.getenv("PLACE_CATALOG_STALE_AGE", str(90 * 86400)))  # fallback 허용(초)
+    
+    # 이미지 보강 설정
+    IMAGE_ENRICH_CONCURRENCY: int = int(os.getenv("IMAGE_ENRICH_CONCURRENCY", "5"))
+    IMAGE_ENRICH_BUDGET: float = float(os.getenv("IMAGE_ENRICH_BUDGET", "2.0"))  # 초 (inline 대기 / 스트림 image 이벤트 대기)
+    IMAGE_ENRICH_MODE: str = os.getenv("IMAGE_ENRICH_MODE", "inline")  # inline(예산만큼 대기) | background(즉시 응답)
+    IMAGE_QUEUE_SIZE: int = int(os.getenv("IMAGE_QUEUE_SIZE", "1000"))  # 이미지 조회 대기열 크기
+    IMAGE_STORE_TTL: int = int(os.getenv("IMAGE_STORE_TTL", str(30 * 86400)))  # place_id별 이미지 보관(초)
+    IMAGE_NEGATIVE_TTL: int = int(os.getenv("IMAGE_NEGATIVE_TTL", "86400"))  # 이미지 없음 보관(초)
+    
+    # MCP 배치 호출 설정
+    MCP_BATCH_MAX_CALLS: int = int(os.getenv("MCP_BATCH_MAX_CALLS", "50"))
+    MCP_BATCH_MAX_CONCURRENCY: int = int(os.getenv("MCP_BATCH_MAX_CONCURRENCY", "8"))
+    
+    # 메트릭 설정
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_LOOP_LAG_INTERVAL: float = float(os.getenv("METRICS_LOOP_LAG_INTERVAL", "0.5"))  # 초
     
     # 서버 설정
     SERVER_HOST: str = os.getenv("SERVER_HOST", "0.0.0.0")
@@ -29,6 +114,22 @@ class Config:
     # 로그 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_DIR: str = os.getenv("LOG_DIR", "./logs")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")  # text | json
+    LOG_MAX_BYTES: int = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))  # 파일 회전 크기
+    LOG_BACKUP_COUNT: int = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+    LOG_BODY_SAMPLE_RATE: float = float(os.getenv("LOG_BODY_SAMPLE_RATE", "1.0"))  # 본문을 기록할 요청 비율
+    LOG_BODY_MAX_BYTES: int = int(os.getenv("LOG_BODY_MAX_BYTES", "4096"))  # 본문 최대 기록 크기
+    
+    # 캐시 예열 설정 (tools/warm_cache.py, 서버 시작 시 예열)
+    CACHE_WARM_ON_STARTUP: bool = os.getenv("CACHE_WARM_ON_STARTUP", "false").lower() == "true"
+    CACHE_WARM_LOG: str = os.getenv("CACHE_WARM_LOG", os.path.join(LOG_DIR, "meetup_server.log*"))  # glob 패턴
+    CACHE_WARM_QUERIES: Optional[str] = os.getenv("CACHE_WARM_QUERIES")  # 추가 검색 목록 (JSON/JSON Lines)
+    CACHE_WARM_TOP: int = int(os.getenv("CACHE_WARM_TOP", "50"))  # 예열할 조합 수
+    CACHE_WARM_GRID: float = float(os.getenv("CACHE_WARM_GRID", "0.005"))  # 조합을 묶을 격자 (도, 0.005 ≈ 500m)
+    CACHE_WARM_RATE: float = float(os.getenv("CACHE_WARM_RATE", "2"))  # 초당 예열 조합 수
+    CACHE_WARM_CONCURRENCY: int = int(os.getenv("CACHE_WARM_CONCURRENCY", "4"))
+    CACHE_WARM_INTERVAL: float = float(os.getenv("CACHE_WARM_INTERVAL", "0"))  # 반복 주기 (초, 0이면 시작 시 한 번)
+    CACHE_WARM_IMAGE_WAIT: float = float(os.getenv("CACHE_WARM_IMAGE_WAIT", "5"))  # 조합당 이미지 조회 대기 (초)
     
     @classmethod
     def validate_api_keys(cls) -> dict:
@@ -47,7 +148,84 @@ class Config:
             "port": cls.REDIS_PORT,
             "db": cls.REDIS_DB,
             "password": cls.REDIS_PASSWORD,
-            "enabled": cls.CACHE_ENABLED
+            "enabled": cls.CACHE_ENABLED,
+            "max_connections": cls.REDIS_MAX_CONNECTIONS
+        }
+    
+    @classmethod
+    def get_l1_cache_config(cls) -> dict:
+        """프로세스 내 L1 캐시 설정을 반환합니다."""
+        return {
+            "l1_enabled": cls.CACHE_L1_ENABLED,
+            "l1_max_entries": cls.CACHE_L1_MAX_ENTRIES,
+            "l1_max_bytes": cls.CACHE_L1_MAX_BYTES,
+            "l1_ttl": cls.CACHE_L1_TTL
+        }
+    
+    @classmethod
+    def get_serializer_config(cls) -> dict:
+        """캐시 값 직렬화/압축 설정을 반환합니다."""
+        return {
+            "serializer": cls.CACHE_SERIALIZER,
+            "compression": cls.CACHE_COMPRESSION,
+            "compress_threshold": cls.CACHE_COMPRESS_THRESHOLD
+        }
+    
+    @classmethod
+    def get_http_config(cls) -> dict:
+        """HTTP 커넥션 풀/타임아웃 설정을 반환합니다."""
+        return {
+            "limit": cls.HTTP_POOL_LIMIT,
+            "limit_per_host": cls.HTTP_POOL_LIMIT_PER_HOST,
+            "dns_cache_ttl": cls.HTTP_DNS_CACHE_TTL,
+            "keepalive_timeout": cls.HTTP_KEEPALIVE_TIMEOUT,
+            "total_timeout": cls.HTTP_TOTAL_TIMEOUT,
+            "connect_timeout": cls.HTTP_CONNECT_TIMEOUT,
+            "read_timeout": cls.HTTP_READ_TIMEOUT
+        }
+    
+    @classmethod
+    def get_routing_config(cls) -> dict:
+        """이동 시간 라우팅 설정을 반환합니다."""
+        return {
+            "graph_file": cls.ROUTING_GRAPH_FILE,
+            "objective": cls.ROUTING_OBJECTIVE,
+            "walk_speed": cls.ROUTING_WALK_SPEED,
+            "max_snap": cls.ROUTING_MAX_SNAP,
+            "max_time": cls.ROUTING_MAX_TIME
+        }
+
+    @classmethod
+    def get_place_catalog_config(cls) -> dict:
+        """로컬 장소 카탈로그 설정을 반환합니다."""
+        return {
+            "path": cls.PLACE_CATALOG_PATH,
+            "mode": cls.PLACE_CATALOG_MODE,
+            "cell_m": cls.PLACE_CATALOG_CELL_M,
+            "max_age": cls.PLACE_CATALOG_MAX_AGE,
+            "stale_age": cls.PLACE_CATALOG_STALE_AGE
+        }
+
+    @classmethod
+    def get_image_store_config(cls) -> dict:
+        """place_id별 이미지 저장소 설정을 반환합니다."""
+        return {
+            "ttl": cls.IMAGE_STORE_TTL,
+            "negative_ttl": cls.IMAGE_NEGATIVE_TTL
+        }
+
+    @classmethod
+    def get_cache_warm_config(cls) -> dict:
+        """캐시 예열 설정을 반환합니다."""
+        return {
+            "log_pattern": cls.CACHE_WARM_LOG,
+            "queries_file": cls.CACHE_WARM_QUERIES,
+            "top": cls.CACHE_WARM_TOP,
+            "grid": cls.CACHE_WARM_GRID,
+            "rate": cls.CACHE_WARM_RATE,
+            "concurrency": cls.CACHE_WARM_CONCURRENCY,
+            "interval": cls.CACHE_WARM_INTERVAL,
+            "image_wait": cls.CACHE_WARM_IMAGE_WAIT
         }
 
 # 전역 설정 인스턴스
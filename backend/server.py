@@ -8,11 +8,13 @@ Meetup MCP Server
 - radius (m): 검색 반경 (기본 1000m)
 - cuisine: 선호 요리 키워드(선택)
 - max_results: 결과 개수 제한 (기본 15)
+- midpoint_mode: 중간 지점 계산 방식 (centroid | median | minimax | travel_time)
+- rank_by: 식당 순위 기준 (provider | total | max | variance)
 
 응답:
 - midpoint: 중간 지점 좌표
 - users: 입력된 사용자 정보
-- restaurants: 식당 목록(이름, 주소, 좌표, 전화, 카테고리, 이미지 URL 등)
+- restaurants: 식당 목록(이름, 주소, 좌표, 전화, 카테고리, 이미지 URL, 참가자별 거리 등)
 - source_stats: 출처별 카운트
 - query: 사용된 검색 쿼리
 - returned/total_found
@@ -21,26 +23,40 @@ Meetup MCP Server
 KAKAO Local / NAVER Local이 모두 불가한 경우 빈 배열 반환.
 """
 
+import asyncio
 import json
 import logging
+import math
 import os
 import sys
-from typing import Dict, Any, List, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime
 
-import aiohttp
-from fastapi import FastAPI, HTTPException, Body, Request
-from fastapi.responses import Response
+from fastapi import FastAPI, HTTPException, Body, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.wsgi import WSGIMiddleware
 import uvicorn
 
 # 공통 유틸리티 모듈 추가
 sys.path.append('./common')
-from validation import validate_users, extract_search_parameters
+from validation import validate_users, extract_search_parameters, extract_midpoint_mode, extract_rank_by
 from schemas import MCP_TOOLS
 from geocoding_service import geocoding_service
-from cache_manager import cache_manager, cache_result
+from cache_manager import _quantize, cache_manager, cache_result, canonicalize, region_tag, track_freshness
+from http_client import http_client, ProviderError
+from rate_limit import kakao_rate_limiter
+from spatial import grid_tiles, haversine_m
+from place_merge import merge_places, normalize_title
+from midpoint import compute_midpoint as solve_midpoint_for
+from routing import travel_router
+from place_catalog import place_catalog
+from ranking import rank_places
+from image_store import image_store, image_worker
+from cache_warmer import cache_warmer
+from request_logging import RequestLoggingMiddleware, setup_logging
+from metrics import EventLoopLagMonitor, MetricsMiddleware, registry as metrics_registry, timed_stage, track_provider
 from config import config
 
 
@@ -48,17 +64,13 @@ from config import config
 # LOGGING
 # =============================================================================
 
-# 로그 디렉토리 생성
-os.makedirs(config.LOG_DIR, exist_ok=True)
-
-logging.basicConfig(
-    level=getattr(logging, config.LOG_LEVEL.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(f'{config.LOG_DIR}/meetup_server.log')
-    ]
+# 로그 출력(콘솔 + 회전 파일)은 백그라운드 스레드에서 처리
+log_listener = setup_logging(
+    level=config.LOG_LEVEL,
+    log_dir=config.LOG_DIR,
+    max_bytes=config.LOG_MAX_BYTES,
+    backup_count=config.LOG_BACKUP_COUNT,
+    fmt=config.LOG_FORMAT,
 )
 logger = logging.getLogger(__name__)
 
@@ -67,7 +79,42 @@ logger = logging.getLogger(__name__)
 # APP
 # =============================================================================
 
-app = FastAPI(title="Meetup MCP Server", version="1.0.0")
+loop_lag_monitor = EventLoopLagMonitor(config.METRICS_LOOP_LAG_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """함수명: lifespan
+    기능: 서버 시작/종료 시 공유 리소스(HTTP 커넥션 풀, Redis 커넥션 풀, 이동 시간 그래프, 장소 카탈로그, 이미지 보강 작업자, 캐시 예열)를 생성하고 정리합니다.
+    요청 파라미터(예시):
+      - 없음 (FastAPI가 startup/shutdown 시 호출)
+    응답 파라미터(예시):
+      - 없음
+    """
+    await http_client.start()
+    await cache_manager.connect()
+    if travel_router.enabled:
+        await asyncio.to_thread(travel_router.load)
+    if place_catalog.enabled:
+        await asyncio.to_thread(place_catalog.load)
+    if service.naver_headers:
+        image_worker.start(service.fetch_place_image)
+    if config.CACHE_WARM_ON_STARTUP:
+        cache_warmer.start(service)
+    if config.METRICS_ENABLED:
+        loop_lag_monitor.start()
+    try:
+        yield
+    finally:
+        await loop_lag_monitor.stop()
+        await cache_warmer.stop()
+        await image_worker.stop()
+        await place_catalog.close()
+        await cache_manager.close()
+        await http_client.close()
+
+
+app = FastAPI(title="Meetup MCP Server", version="1.0.0", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -85,53 +132,24 @@ app.mount("/calculator", WSGIMiddleware(flask_app))       # ← 추가 (반드
 # MIDDLEWARE (Request/Response logging)
 # =============================================================================
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """함수명: log_requests
-    기능: 모든 HTTP 요청/응답을 로깅합니다.
-    요청 파라미터(예시):
-      - 없음 (미들웨어가 요청/응답 객체를 가로채서 처리)
-    응답 파라미터(예시):
-      - 원래 엔드포인트의 응답과 동일
-      {
-        "status": "healthy",
-        "service": "meetup"
-      }
-    """
-    body_bytes = b""
-    try:
-        body_bytes = await request.body()
-        body = body_bytes.decode("utf-8") if body_bytes else ""
-        logger.info(f"[REQ] {request.method} {request.url.path} body={body}")
-    except Exception as e:
-        logger.warning(f"[REQ] read error: {e}")
+# 라우트별 처리 시간/동시 처리 수 (/metrics)
+if config.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
-    async def receive():
-        return {"type": "http.request", "body": body_bytes}
-
-    request._receive = receive
-
-    response = await call_next(request)
-
-    try:
-        content = b""
-        async for chunk in response.body_iterator:
-            content += chunk
-        new_response = Response(content=content, status_code=response.status_code, headers=dict(response.headers), media_type=response.media_type)
-        sample = content.decode("utf-8", errors="ignore")
-        if len(sample) > 1000:
-            sample = sample[:1000] + "... [truncated]"
-        logger.info(f"[RES] {request.method} {request.url.path} {response.status_code} body={sample}")
-        return new_response
-    except Exception as e:
-        logger.warning(f"[RES] log error: {e}")
-        return response
+# CORS보다 바깥에서 모든 요청을 기록 (본문은 버퍼링하지 않고 샘플링/크기 제한만큼 복사)
+app.add_middleware(
+    RequestLoggingMiddleware,
+    sample_rate=config.LOG_BODY_SAMPLE_RATE,
+    max_body_bytes=config.LOG_BODY_MAX_BYTES,
+)
 
 
 # =============================================================================
 # SERVICES
 # =============================================================================
 
+KAKAO_PAGE_SIZE = 15  # Kakao 키워드 검색 페이지당 최대 건수
+
 class PlaceSearchService:
     def __init__(self) -> None:
         """함수명: PlaceSearchService.__init__
@@ -154,55 +172,79 @@ class PlaceSearchService:
         } if self.naver_client_id and self.naver_client_secret else None
 
     @staticmethod
-    def compute_midpoint(users: List[Dict[str, Any]]) -> Dict[str, float]:
+    def compute_midpoint(users: List[Dict[str, Any]], mode: str = "centroid") -> Dict[str, float]:
         """함수명: compute_midpoint
-        기능: 다중 사용자 좌표의 산술 평균으로 중간 지점(lat/lng)을 계산합니다.
+        기능: 다중 사용자 좌표로 중간 지점(lat/lng)을 계산합니다.
+          mode: centroid(위경도 산술 평균), median(이동 거리 합 최소), minimax(최대 이동 거리 최소),
+                travel_time(그래프 기준 이동 시간 최소, 경로가 없으면 minimax로 대체)
         요청 파라미터(예시):
           users = [
             {"lat": 37.5665, "lng": 126.9780},
             {"lat": 37.3943, "lng": 127.1107}
-          ]
+          ], mode="centroid"
         응답 파라미터(예시):
           {"lat": 37.4804, "lng": 127.04435}
         """
         if not users or len(users) < 2:
             raise ValueError("최소 2명의 사용자가 필요합니다")
+        if mode == "travel_time":
+            point = travel_router.meeting_point(users)
+            if point is not None:
+                return {"lat": point["lat"], "lng": point["lng"]}
+            logger.warning("이동 시간 경로를 찾지 못해 minimax 중간 지점을 사용합니다")
+            mode = "minimax"
+        return solve_midpoint_for(users, mode)
 
-        total_lat = sum(float(user["lat"]) for user in users)
-        total_lng = sum(float(user["lng"]) for user in users)
-        count = len(users)
-        
-        return {
-            "lat": total_lat / count,
-            "lng": total_lng / count
-        }
+    async def resolve_midpoint(self, users: List[Dict[str, Any]], mode: str = "centroid") -> Dict[str, Any]:
+        """함수명: resolve_midpoint
+        기능: compute_midpoint 결과에 mode를 붙여 반환합니다. travel_time 모드는 그래프 탐색이 수백 ms 걸릴 수 있어
+          작업 스레드에서 계산합니다. (결과는 라우터에 메모이즈되어 캐시 태그 계산 시 재사용)
+        요청 파라미터(예시):
+          users=[{"lat": 37.5665, "lng": 126.9780}, {"lat": 37.3943, "lng": 127.1107}], mode="travel_time"
+        응답 파라미터(예시):
+          {"lat": 37.4861, "lng": 127.0335, "mode": "travel_time"}
+        """
+        if mode == "travel_time":
+            midpoint = await asyncio.to_thread(self.compute_midpoint, users, mode)
+        else:
+            midpoint = self.compute_midpoint(users, mode)
+        return {**midpoint, "mode": mode}
 
-    @cache_result("kakao_search", ttl=1800)  # 30분 캐시
-    async def search_kakao_category(self, lat: float, lng: float, radius: int, query: Optional[str], size: int) -> List[Dict[str, Any]]:
-        """함수명: search_kakao_category
-        기능: 카카오 키워드 검색 API로 특정 좌표 주변의 장소(음식점)를 검색합니다.
+    @cache_result("kakao_search", ttl=1800, quantize_coords=True,
+                  stale_ttl=config.CACHE_STALE_TTL,
+                  error_result={"restaurants": [], "is_end": True, "pageable_count": 0},
+                  tags=lambda self, lat, lng, *a, **kw: ["provider:kakao", region_tag(lat, lng)])  # 30분 캐시 (+stale 허용)
+    async def search_kakao_page(self, lat: float, lng: float, radius: int, query: Optional[str],
+                                page: int = 1) -> Dict[str, Any]:
+        """함수명: search_kakao_page
+        기능: 카카오 키워드 검색 API의 한 페이지(KAKAO_PAGE_SIZE건)를 조회합니다. 페이지 단위로 캐시되므로
+          더 많은 후보를 요청하는 검색도 앞 페이지 캐시를 그대로 재사용합니다.
         요청 파라미터(예시):
-          lat=37.4804, lng=127.04435, radius=1500, query="한식 맛집", size=5
+          lat=37.4804, lng=127.04435, radius=1500, query="한식 맛집", page=1
         응답 파라미터(예시):
-          [
-            {
-              "place_id": "26410902",
-              "place_name": "설마중",
-              "place_url": "http://place.map.kakao.com/26410902",
-              "place_phone": "02-3462-8888",
-              "place_address": "서울 서초구 양재동 2-3",
-              "place_road_address": "서울 서초구 남부순환로 2648",
-              "place_category": "음식점 > 한식",
-              "place_x": 127.04037,
-              "place_y": 37.48501,
-              "distance": "621",
-              "image_url": "",
-              "source": "kakao"
-            }
-          ]
+          {
+            "restaurants": [
+              {
+                "place_id": "26410902",
+                "place_name": "설마중",
+                "place_url": "http://place.map.kakao.com/26410902",
+                "place_phone": "02-3462-8888",
+                "place_address": "서울 서초구 양재동 2-3",
+                "place_road_address": "서울 서초구 남부순환로 2648",
+                "place_category": "음식점 > 한식",
+                "place_x": 127.04037,
+                "place_y": 37.48501,
+                "distance": "621",
+                "image_url": "",
+                "source": "kakao"
+              }
+            ],
+            "is_end": false,
+            "pageable_count": 45
+          }
         """
         if not self.kakao_headers:
-            return []
+            return {"restaurants": [], "is_end": True, "pageable_count": 0}
         try:
             # Kakao: keyword search around coordinate
             # category_group_code FD6 = 음식점
@@ -212,14 +254,16 @@ class PlaceSearchService:
                 "x": f"{lng}",
                 "y": f"{lat}",
                 "radius": min(max(radius, 1), 20000),  # Kakao max 20km
-                "size": min(max(size, 1), 15),         # Kakao max 15
+                "page": min(max(page, 1), 45),          # Kakao max 45
+                "size": KAKAO_PAGE_SIZE,
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.kakao_headers, params=params, timeout=10) as resp:
+            await kakao_rate_limiter.acquire()
+            session = await http_client.get_session()
+            with track_provider("kakao", "local_search"):
+                async with session.get(url, headers=self.kakao_headers, params=params) as resp:
                     if resp.status != 200:
                         txt = await resp.text()
-                        logger.warning(f"Kakao search failed: {resp.status} {txt}")
-                        return []
+                        raise ProviderError(f"Kakao search failed: {resp.status} {txt}")
                     data = await resp.json()
                     restaurants: List[Dict[str, Any]] = []
                     for d in data.get("documents", []):
@@ -237,89 +281,409 @@ class PlaceSearchService:
                             "image_url": "",
                             "source": "kakao",
                         })
-                    return restaurants
+                    place_catalog.record(restaurants)
+                    meta = data.get("meta") or {}
+                    return {
+                        "restaurants": restaurants,
+                        "is_end": bool(meta.get("is_end", True)),
+                        "pageable_count": int(meta.get("pageable_count") or 0),
+                    }
         except Exception as e:
+            # 캐시 데코레이터가 stale 값 또는 빈 결과로 대체하도록 예외를 전달
             logger.error(f"Kakao search error: {e}")
+            raise
+
+    @timed_stage("kakao_search")
+    async def search_kakao_category(self, lat: float, lng: float, radius: int, query: Optional[str], size: int) -> List[Dict[str, Any]]:
+        """함수명: search_kakao_category
+        기능: 카카오 키워드 검색으로 특정 좌표 주변 장소를 size건까지 수집합니다.
+          radius가 KAKAO_TILE_THRESHOLD를 넘으면 타일 검색(search_kakao_tiles)을 사용하고,
+          그 외에는 search_kakao_pages로 필요한 페이지만큼 조회합니다.
+        요청 파라미터(예시):
+          lat=37.4804, lng=127.04435, radius=1500, query="한식 맛집", size=30
+        응답 파라미터(예시):
+          [{"place_id": "26410902", "place_name": "설마중", ...}, ...]  (최대 size건, search_kakao_page 항목과 동일)
+        """
+        if config.KAKAO_TILE_ENABLED and radius > config.KAKAO_TILE_THRESHOLD:
+            return await self.search_kakao_tiles(lat=lat, lng=lng, radius=radius, query=query, size=size)
+        return await self.search_kakao_pages(lat=lat, lng=lng, radius=radius, query=query, size=size)
+
+    async def search_kakao_pages(self, lat: float, lng: float, radius: int, query: Optional[str],
+                                 size: int) -> List[Dict[str, Any]]:
+        """함수명: search_kakao_pages
+        기능: 첫 페이지를 조회한 뒤 더 필요하면 남은 페이지(최대 KAKAO_MAX_PAGES)를 동시에 요청하고,
+          is_end/pageable_count로 마지막 페이지를 넘지 않으며 place_id 기준으로 중복을 제거합니다.
+        요청 파라미터(예시):
+          lat=37.4804, lng=127.04435, radius=1500, query="한식 맛집", size=30
+        응답 파라미터(예시):
+          [{"place_id": "26410902", "place_name": "설마중", ...}, ...]  (최대 size건)
+        """
+        size = max(size, 1)
+        first = await self.search_kakao_page(lat=lat, lng=lng, radius=radius, query=query, page=1)
+        pages = [first]
+
+        wanted = min(math.ceil(size / KAKAO_PAGE_SIZE), config.KAKAO_MAX_PAGES)
+        available = math.ceil(first["pageable_count"] / KAKAO_PAGE_SIZE)
+        last_page = min(wanted, available)
+        if not first["is_end"] and last_page > 1:
+            pages += await asyncio.gather(*(
+                self.search_kakao_page(lat=lat, lng=lng, radius=radius, query=query, page=page)
+                for page in range(2, last_page + 1)
+            ))
+        return self.dedupe_places(r for result in pages for r in result["restaurants"])[:size]
+
+    async def search_kakao_tiles(self, lat: float, lng: float, radius: int, query: Optional[str],
+                                 size: int) -> List[Dict[str, Any]]:
+        """함수명: search_kakao_tiles
+        기능: 넓은 검색 원을 전역 격자 타일로 나눠 타일마다 작은 원(타일 외접원)으로 동시에 검색하고,
+          검색 중심에서 radius 안의 장소를 타일별로 번갈아(round-robin) 하나씩 골라 size건을 채웁니다.
+          (가까운 순으로 자르면 넓은 반경 검색도 중심 근처 장소만 남으므로, 각 타일의 상위 장소가 고르게 포함되도록 함)
+          라운드 안에서는 중심에 가까운 타일이 먼저이며, 같은 장소는 place_id 기준으로 한 번만 포함합니다.
+          타일 좌표는 격자에 고정돼 있으므로 타일별 kakao_search 캐시를 다른 그룹의 검색과 공유하며,
+          외부 호출은 kakao_rate_limiter 예산 안에서 실행됩니다.
+        요청 파라미터(예시):
+          lat=37.4804, lng=127.04435, radius=8000, query="한식 맛집", size=30
+        응답 파라미터(예시):
+          [{"place_id": "26410902", "place_name": "설마중", "distance": "621", ...}, ...]  (distance는 검색 중심 기준)
+        """
+        tile_m, tiles = grid_tiles(lat, lng, radius, config.KAKAO_TILE_SIZE, config.KAKAO_TILE_MAX)
+        tile_radius = math.ceil(tile_m * math.sqrt(2) / 2)
+        logger.info(f"🧩 타일 검색: radius={radius}m → {len(tiles)}개 타일 (한 변 {tile_m:.0f}m)")
+
+        results = await asyncio.gather(*(
+            self.search_kakao_pages(lat=tile_lat, lng=tile_lng, radius=tile_radius, query=query,
+                                    size=config.KAKAO_TILE_RESULTS)
+            for tile_lat, tile_lng in tiles
+        ))
+
+        # 타일별 반경 안 후보 (타일 안에서는 Kakao 순서 유지), 중심에 가까운 타일부터
+        per_tile = []
+        for (tile_lat, tile_lng), places in zip(tiles, results):
+            inside = []
+            for r in places:
+                distance = haversine_m(lat, lng, r["place_y"], r["place_x"])
+                if distance <= radius:
+                    inside.append({**r, "distance": str(round(distance))})
+            per_tile.append((haversine_m(lat, lng, tile_lat, tile_lng), inside))
+        queues = [inside for _, inside in sorted(per_tile, key=lambda item: item[0]) if inside]
+
+        # 라운드마다 타일별로 depth번째 후보를 하나씩 꺼내 섞은 뒤 중복 제거
+        interleaved = [queue[depth] for depth in range(max((len(q) for q in queues), default=0))
+                       for queue in queues if depth < len(queue)]
+        return self.dedupe_places(interleaved)[:max(size, 1)]
+
+    @staticmethod
+    def dedupe_places(places: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """함수명: dedupe_places
+        기능: place_id(없으면 이름+좌표) 기준으로 처음 나온 항목만 남깁니다.
+        요청 파라미터(예시):
+          places=[{"place_id": "26410902", ...}, {"place_id": "26410902", ...}]
+        응답 파라미터(예시):
+          [{"place_id": "26410902", ...}]
+        """
+        seen = set()
+        restaurants: List[Dict[str, Any]] = []
+        for r in places:
+            key = r.get("place_id") or (r.get("place_name"), r.get("place_x"), r.get("place_y"))
+            if key in seen:
+                continue
+            seen.add(key)
+            restaurants.append(r)
+        return restaurants
+
+    @cache_result("naver_local", ttl=1800, quantize_coords=True,
+                  stale_ttl=config.CACHE_STALE_TTL, error_result=[],
+                  tags=lambda self, lat, lng, *a, **kw: ["provider:naver", region_tag(lat, lng)])  # 30분 캐시 (+stale 허용)
+    async def search_naver_local(self, lat: float, lng: float, radius: int, query: Optional[str],
+                                 area: str = "") -> List[Dict[str, Any]]:
+        """함수명: search_naver_local
+        기능: 네이버 지역 검색 API로 장소를 조회해 Kakao와 같은 식당 스키마로 변환합니다.
+          네이버 지역 검색은 좌표 파라미터가 없으므로 지역명(area)을 검색어 앞에 붙이고,
+          결과 좌표(mapx/mapy, WGS84 × 10^7)로 중심에서 radius 밖의 장소는 제외합니다.
+        요청 파라미터(예시):
+          lat=37.4804, lng=127.04435, radius=1500, query="한식 맛집", area="서초구 양재동"
+        응답 파라미터(예시):
+          [
+            {
+              "place_id": "naver_1270404100_374849800",
+              "place_name": "설마중 양재점",
+              "place_url": "https://www.instagram.com/...",
+              "place_phone": "",
+              "place_address": "서울특별시 서초구 양재동 2-3",
+              "place_road_address": "서울특별시 서초구 남부순환로 2648",
+              "place_category": "한식>육류,고기요리",
+              "place_x": 127.04041,
+              "place_y": 37.48498,
+              "distance": "615",
+              "image_url": "",
+              "source": "naver"
+            }
+          ]
+        """
+        if not self.naver_headers:
             return []
+        try:
+            url = "https://openapi.naver.com/v1/search/local.json"
+            params = {
+                "query": f"{area} {query or '맛집'}".strip(),
+                "display": min(max(config.NAVER_LOCAL_DISPLAY, 1), 5),  # Naver max 5
+                "sort": "random",  # 정확도순
+            }
+            session = await http_client.get_session()
+            with track_provider("naver", "local_search"):
+                async with session.get(url, headers=self.naver_headers, params=params) as resp:
+                    if resp.status != 200:
+                        txt = await resp.text()
+                        raise ProviderError(f"Naver local search failed: {resp.status} {txt}")
+                    data = await resp.json()
+            places: List[Dict[str, Any]] = []
+            for item in data.get("items", []):
+                mapx, mapy = item.get("mapx"), item.get("mapy")
+                if not mapx or not mapy:
+                    continue
+                x, y = int(mapx) / 1e7, int(mapy) / 1e7
+                places.append({
+                    "place_id": f"naver_{mapx}_{mapy}",
+                    "place_name": normalize_title(item.get("title", "")),
+                    "place_url": item.get("link", ""),
+                    "place_phone": item.get("telephone", ""),
+                    "place_address": item.get("address", ""),
+                    "place_road_address": item.get("roadAddress", ""),
+                    "place_category": item.get("category", ""),
+                    "place_x": x,
+                    "place_y": y,
+                    "distance": str(round(haversine_m(lat, lng, y, x))),
+                    "image_url": "",
+                    "source": "naver",
+                })
+            # 반경 밖 장소도 카탈로그에는 기록
+            place_catalog.record(places)
+            return [p for p in places if int(p["distance"]) <= radius]
+        except Exception as e:
+            # 캐시 데코레이터가 stale 값 또는 빈 결과로 대체하도록 예외를 전달
+            logger.warning(f"Naver local search error: {e}")
+            raise
 
-    @cache_result("naver_image", ttl=3600)  # 1시간 캐시
-    async def naver_image_for(self, place_name: str) -> str:
-        """함수명: naver_image_for
-        기능: 네이버 이미지 검색 API로 장소명에 대한 대표 이미지 URL 1건을 조회합니다.
+    @timed_stage("naver_search")
+    async def search_naver_near(self, located: Awaitable[Dict[str, Any]], radius: int,
+                                query: Optional[str]) -> List[Dict[str, Any]]:
+        """함수명: search_naver_near
+        기능: 중간 지점 역지오코딩 결과(시군구 + 동)를 지역명으로 사용해 search_naver_local을 호출합니다.
+          역지오코딩은 Kakao 검색과 동시에 실행되므로 Kakao 검색 시간과 겹칩니다.
         요청 파라미터(예시):
-          place_name="설마중"
+          located=<locate_midpoint 태스크>, radius=1500, query="한식 맛집"
+        응답 파라미터(예시):
+          [{"place_id": "naver_1270404100_374849800", "place_name": "설마중 양재점", ...}]
+        """
+        if not config.NAVER_LOCAL_ENABLED or not self.naver_headers:
+            return []
+        midpoint = await located
+        area = " ".join(p for p in (midpoint.get("region2"), midpoint.get("region3")) if p)
+        return await self.search_naver_local(lat=midpoint["lat"], lng=midpoint["lng"], radius=radius,
+                                             query=query, area=area)
+
+    async def search_places(self, midpoint: Dict[str, float], located: Awaitable[Dict[str, Any]],
+                            radius: int, query: Optional[str], size: int,
+                            cuisine: Optional[str] = None) -> List[Dict[str, Any]]:
+        """함수명: search_places
+        기능: Kakao 검색과 네이버 지역 검색을 동시에 실행하고, 좌표 격자 + 장소명 유사도로
+          같은 장소를 하나로 합친 목록을 반환합니다. (Kakao 항목 순서 유지, 네이버 단독 항목은 뒤에 추가)
+          PLACE_CATALOG_MODE에 따라 로컬 장소 카탈로그를 함께 사용합니다.
+            - primary: 최신(PLACE_CATALOG_MAX_AGE 이내) 카탈로그 장소가 size건 이상이면 외부 API를 호출하지 않음
+            - fallback: 외부 API 결과가 없으면 PLACE_CATALOG_STALE_AGE 이내 카탈로그 장소로 대체
+            - gap_fill (primary 포함): 외부 API 결과가 size건보다 적으면 최신 카탈로그 장소로 채움
+        요청 파라미터(예시):
+          midpoint={"lat": 37.4804, "lng": 127.04435}, located=<locate_midpoint 태스크>,
+          radius=1500, query="한식 맛집", size=15, cuisine="한식"
+        응답 파라미터(예시):
+          [{"place_name": "설마중", ..., "source": "kakao", "sources": ["kakao", "naver"]}, ...]
+        """
+        local = self.catalog_primary(midpoint, radius, size, cuisine)
+        if local is not None:
+            return local
+
+        kakao_list, naver_list = await asyncio.gather(
+            self.search_kakao_category(
+                lat=midpoint["lat"],
+                lng=midpoint["lng"],
+                radius=radius,
+                query=query,
+                size=size,
+            ),
+            self.search_naver_near(located, radius, query),
+        )
+        return self.combine_places(midpoint, radius, size, cuisine, kakao_list, naver_list)
+
+    def catalog_primary(self, midpoint: Dict[str, float], radius: int, size: int,
+                        cuisine: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """PLACE_CATALOG_MODE=primary이고 최신 카탈로그 장소가 size건 이상이면 그 목록, 아니면 None (외부 검색 필요)"""
+        if place_catalog.mode != "primary":
+            return None
+        local = place_catalog.search(midpoint["lat"], midpoint["lng"], radius, cuisine, size,
+                                     max_age=place_catalog.max_age)
+        return self.catalog_places(local) if len(local) >= size else None
+
+    def combine_places(self, midpoint: Dict[str, float], radius: int, size: int, cuisine: Optional[str],
+                       kakao_list: List[Dict[str, Any]], naver_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """함수명: combine_places
+        기능: Kakao/네이버 검색 결과를 병합하고 PLACE_CATALOG_MODE(fallback/gap_fill/primary)에 따라 카탈로그 장소로
+          대체하거나 채웁니다. (search_places와 스트림이 공유)
+        요청 파라미터(예시):
+          midpoint={"lat": 37.4804, "lng": 127.04435}, radius=1500, size=15, cuisine="한식",
+          kakao_list=[...], naver_list=[...]
+        응답 파라미터(예시):
+          [{"place_name": "설마중", ..., "source": "kakao", "sources": ["kakao", "naver"]}, ...]
+        """
+        mode = place_catalog.mode
+        lat, lng = midpoint["lat"], midpoint["lng"]
+        places = merge_places(kakao_list, naver_list, config.PLACE_MERGE_DISTANCE, config.PLACE_MERGE_SIMILARITY)
+
+        if mode == "fallback" and not places:
+            local = place_catalog.search(lat, lng, radius, cuisine, size, max_age=place_catalog.stale_age)
+            if local:
+                logger.info(f"📚 외부 검색 결과가 없어 카탈로그 장소 {len(local)}건으로 대체")
+            return self.catalog_places(local)
+        if mode in ("gap_fill", "primary") and len(places) < size:
+            # 외부 결과와 겹치는 장소를 감안해 여유 있게 조회한 뒤 병합
+            local = place_catalog.search(lat, lng, radius, cuisine, size + len(places), max_age=place_catalog.max_age)
+            merged = merge_places(places, self.catalog_places(local),
+                                  config.PLACE_MERGE_DISTANCE, config.PLACE_MERGE_SIMILARITY)
+            return merged[:max(size, len(places))]
+        return places
+
+    @staticmethod
+    def catalog_places(local: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """함수명: catalog_places
+        기능: 카탈로그 검색 결과에 출처(sources=["catalog"])를 표시하고 응답 집계에 반영합니다.
+        요청 파라미터(예시):
+          local=[{"place_id": "26410902", "source": "kakao", "catalog_age": 3600, ...}]
+        응답 파라미터(예시):
+          [{"place_id": "26410902", "source": "kakao", "sources": ["catalog"], "catalog_age": 3600, ...}]
+        """
+        place_catalog.served(len(local))
+        return [{**p, "sources": ["catalog"]} for p in local]
+
+    async def naver_image_search(self, query: str) -> str:
+        """함수명: naver_image_search
+        기능: 네이버 이미지 검색 API로 검색어에 대한 대표 이미지 URL 1건을 조회합니다.
+          오류는 예외로 전달해 이미지 없음("")과 구분합니다. (결과 저장은 image_store에서 place_id 기준으로 처리)
+        요청 파라미터(예시):
+          query="설마중 서초구"
         응답 파라미터(예시):
           "https://.../image.jpg"  (없을 경우 빈 문자열)
         """
-        if not self.naver_headers or not place_name:
+        if not self.naver_headers or not query:
             return ""
         try:
             url = "https://openapi.naver.com/v1/search/image"
-            params = {"query": place_name, "display": 1, "sort": "sim"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.naver_headers, params=params, timeout=10) as resp:
+            params = {"query": query, "display": 1, "sort": "sim"}
+            session = await http_client.get_session()
+            with track_provider("naver", "image_search"):
+                async with session.get(url, headers=self.naver_headers, params=params) as resp:
                     if resp.status != 200:
-                        return ""
+                        raise ProviderError(f"Naver image search failed: {resp.status}")
                     data = await resp.json()
                     items = data.get("items", [])
                     if items:
                         return items[0].get("link", "") or items[0].get("thumbnail", "") or ""
                     return ""
-        except Exception:
-            return ""
+        except Exception as e:
+            logger.warning(f"Naver image search error: {e}")
+            raise
 
-    async def enrich_images(self, restaurants: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """함수명: enrich_images
-        기능: 식당 리스트 각 항목에 이미지 URL이 없으면 네이버 이미지 검색으로 보강합니다.
+    @staticmethod
+    def image_query(place: Dict[str, Any]) -> str:
+        """함수명: image_query
+        기능: 이미지 검색어를 만듭니다. 같은 이름의 체인점이 섞이지 않도록 주소의 시군구를 붙입니다.
         요청 파라미터(예시):
-          restaurants=[{"place_name":"설마중", "image_url":""}, ...]
+          place={"place_name": "설마중", "place_address": "서울 서초구 양재동 2-3"}
         응답 파라미터(예시):
-          restaurants=[{"place_name":"설마중", "image_url":"https://...jpg"}, ...]
+          "설마중 서초구"
         """
-        if not restaurants:
-            return restaurants
-        result: List[Dict[str, Any]] = []
-        for r in restaurants:
-            if not r.get("image_url"):
-                img = await self.naver_image_for(r.get("place_name", ""))
-                if img:
-                    r["image_url"] = img
-            result.append(r)
-        return result
-
-    @cache_result("meetup_search", ttl=900)  # 15분 캐시
-    async def search_meetup_restaurants(self, users: List[Dict[str, Any]], radius: int = 1000, 
-                                        cuisine: Optional[str] = None, max_results: int = 15) -> Dict[str, Any]:
-        """함수명: search_meetup_restaurants
-        기능: 다중 사용자 중간 지점 계산 후 주변 식당을 검색하고 이미지 URL을 보강합니다.
+        name = place.get("place_name", "")
+        address = (place.get("place_address") or place.get("place_road_address") or "").split()
+        return f"{name} {address[1]}" if name and len(address) > 1 else name
+
+    async def fetch_place_image(self, place: Dict[str, Any]) -> str:
+        """함수명: fetch_place_image
+        기능: image_worker가 호출하는 장소별 이미지 조회 함수입니다.
         요청 파라미터(예시):
-          users=[
-            {"lat":37.5665,"lng":126.9780},
-            {"lat":37.3943,"lng":127.1107}
-          ], radius=1500, cuisine="한식", max_results=5
+          place={"place_id": "26410902", "place_name": "설마중", "place_address": "서울 서초구 양재동 2-3"}
         응답 파라미터(예시):
-          {
-            "midpoint": {"lat": 37.4804, "lng": 127.04435},
-            "users": [...],
-            "restaurants": [ {"place_name":"설마중", "image_url":"https://..."}, ... ],
-            "source_stats": {"kakao":5, "naver":0, "total":5},
-            "query": "한식 맛집",
-            "total_found": 5,
-            "returned": 5
-          }
+          "https://.../image.jpg"  (없을 경우 빈 문자열)
+        """
+        return await self.naver_image_search(self.image_query(place))
+
+    @staticmethod
+    def apply_images(restaurants: List[Dict[str, Any]], images: Dict[str, str]) -> List[Dict[str, Any]]:
+        """함수명: apply_images
+        기능: place_id → 이미지 URL 매핑을 image_url이 비어 있는 항목에 적용합니다.
+          캐시된 원본 목록을 변경하지 않도록 보강 항목은 복사본으로 교체합니다.
+        요청 파라미터(예시):
+          restaurants=[{"place_id":"26410902", "image_url":""}], images={"26410902": "https://...jpg"}
+        응답 파라미터(예시):
+          [{"place_id":"26410902", "image_url":"https://...jpg"}]
+        """
+        return [
+            {**r, "image_url": images[r.get("place_id", "")]}
+            if not r.get("image_url") and images.get(r.get("place_id", "")) else r
+            for r in restaurants
+        ]
+
+    async def lookup_images(self, restaurants: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """함수명: lookup_images
+        기능: image_store에 있는 이미지를 적용하고, 아직 모르는 장소는 image_worker 대기열에 넣습니다.
+          이미지 없음으로 기록된 장소는 다시 조회하지 않습니다.
+        요청 파라미터(예시):
+          restaurants=[{"place_id":"26410902", "place_name":"설마중", "image_url":""}, ...]
+        응답 파라미터(예시):
+          ([{"place_id":"26410902", "image_url":"https://...jpg"}, ...], ["8130556"])  # (적용 결과, 조회 대기 place_id)
+        """
+        ids = [r.get("place_id", "") for r in restaurants if not r.get("image_url") and r.get("place_id")]
+        if not ids:
+            return restaurants, []
+        known = await image_store.get_many(ids)
+        applied = self.apply_images(restaurants, known) if known else restaurants
+        pending = image_worker.submit(r for r in applied if not r.get("image_url") and r.get("place_id")
+                                      and r["place_id"] not in known)
+        return applied, pending
+
+    @timed_stage("enrich_images")
+    async def with_images(self, result: Dict[str, Any], wait: bool) -> Dict[str, Any]:
+        """함수명: with_images
+        기능: 검색 결과에 이미지를 붙입니다. (lookup_images 참고)
+          wait=True(IMAGE_ENRICH_MODE=inline)면 대기열 조회를 IMAGE_ENRICH_BUDGET초까지 기다려 적용하고,
+          아직 조회 중인 place_id는 images_pending으로 알려 GET /images로 나중에 가져갈 수 있게 합니다.
+        요청 파라미터(예시):
+          result={"restaurants": [...], ...}, wait=False
+        응답 파라미터(예시):
+          {"restaurants": [{"place_id":"26410902", "image_url":"https://...jpg"}, ...], ...,
+           "images_pending": ["8130556"]}
+        """
+        restaurants, pending = await self.lookup_images(result.get("restaurants", []))
+        if wait and pending:
+            images = {pid: url async for pid, url in image_worker.watch(pending, config.IMAGE_ENRICH_BUDGET)}
+            restaurants = self.apply_images(restaurants, images)
+            pending = [pid for pid in pending if pid not in images and image_worker.is_pending(pid)]
+        return {**result, "restaurants": restaurants, "images_pending": pending}
+
+    @timed_stage("midpoint_geocode")
+    async def locate_midpoint(self, midpoint: Dict[str, float]) -> Dict[str, Any]:
+        """함수명: locate_midpoint
+        기능: 중간 지점 좌표에 역지오코딩 주소 정보를 붙입니다.
+        요청 파라미터(예시):
+          midpoint={"lat": 37.4804, "lng": 127.04435, "mode": "centroid"}
+        응답 파라미터(예시):
+          {"lat": 37.4804, "lng": 127.04435, "mode": "centroid", "address": "서울특별시 서초구", "road_address": "...", ...}
         """
-        midpoint = self.compute_midpoint(users)
-        
-        # 중간 지점의 주소 정보 가져오기
         address_info = await geocoding_service.reverse_geocode(
             midpoint["lat"], 
             midpoint["lng"]
         )
-        
-        # midpoint에 주소 정보 추가
-        midpoint_with_address = {
+        return {
             "lat": midpoint["lat"],
             "lng": midpoint["lng"],
+            "mode": midpoint.get("mode", "centroid"),
             "address": address_info.get("address", ""),
             "road_address": address_info.get("road_address", ""),
             "jibun_address": address_info.get("jibun_address", ""),
@@ -327,36 +691,258 @@ class PlaceSearchService:
             "region2": address_info.get("region2", ""),
             "region3": address_info.get("region3", "")
         }
-        
-        keyword = f"{cuisine} 맛집" if cuisine else "맛집"
 
-        kakao_list = await self.search_kakao_category(
-            lat=midpoint["lat"],
-            lng=midpoint["lng"],
-            radius=radius,
-            query=keyword,
-            size=max_results,
-        )
+    @staticmethod
+    def rank_candidates(users: List[Dict[str, Any]], places: List[Dict[str, Any]], rank_by: str,
+                        max_results: int) -> List[Dict[str, Any]]:
+        """함수명: rank_candidates
+        기능: 검색 후보를 참가자 전원 기준으로 다시 정렬해 상위 max_results개를 반환합니다. (ranking.rank_places 참고)
+        요청 파라미터(예시):
+          users=[{"lat":37.5665,"lng":126.9780}, ...], places=[...30건...], rank_by="max", max_results=5
+        응답 파라미터(예시):
+          [{"place_name": "설마중", ..., "user_distances": [11222, 11230], "rank_score": 0.041}, ...]
+        """
+        return rank_places(users, places, rank_by, max_results, config.RANK_PROVIDER_WEIGHT)
 
-        # 이미지 보강 (가능 시)
-        enriched = await self.enrich_images(kakao_list)
+    @staticmethod
+    def candidate_count(max_results: int, rank_by: str) -> int:
+        """순위 계산에 쓸 검색 후보 수 (provider 순서면 max_results 그대로)"""
+        return max_results if rank_by == "provider" else max(max_results, config.RANK_CANDIDATES)
 
-        result = enriched[:max_results]
-        source_stats = {"kakao": len(result), "naver": 0, "total": len(result)}
+    @staticmethod
+    def assemble_result(midpoint: Dict[str, Any], users: List[Dict[str, Any]], keyword: str,
+                        restaurants: List[Dict[str, Any]], max_results: int,
+                        total_found: Optional[int] = None) -> Dict[str, Any]:
+        """함수명: assemble_result
+        기능: 단계별 결과를 search_meetup_restaurants 응답 형식으로 합칩니다.
+          source_stats는 반환 항목 중 각 출처가 포함된 항목 수입니다. (병합 항목은 양쪽에 모두 집계)
+          total_found를 생략하면 restaurants 길이를 사용합니다. (순위 계산 전 후보 수를 넘길 때 지정)
+        요청 파라미터(예시):
+          midpoint={...}, users=[...], keyword="한식 맛집", restaurants=[...], max_results=5, total_found=30
+        응답 파라미터(예시):
+          {"midpoint": {...}, "users": [...], "restaurants": [...], "source_stats": {...},
+           "query": "한식 맛집", "total_found": 5, "returned": 5}
+        """
+        result = restaurants[:max_results]
+        source_stats = {"kakao": 0, "naver": 0, "catalog": 0, "total": len(result)}
+        for r in result:
+            for source in r.get("sources") or [r.get("source", "kakao")]:
+                if source in source_stats:
+                    source_stats[source] += 1
         
         # users 정보 생성 (lat, lng만 포함)
         clean_users = [{"lat": user["lat"], "lng": user["lng"]} for user in users]
         
         return {
-            "midpoint": midpoint_with_address,
+            "midpoint": midpoint,
             "users": clean_users,
             "restaurants": result,
             "source_stats": source_stats,
             "query": keyword,
-            "total_found": len(enriched),
+            "total_found": len(restaurants) if total_found is None else total_found,
             "returned": len(result),
         }
 
+    @timed_stage("meetup_search")
+    async def search_meetup_restaurants(self, users: List[Dict[str, Any]], radius: int = 1000, 
+                                        cuisine: Optional[str] = None, max_results: int = 15,
+                                        midpoint_mode: str = "centroid",
+                                        rank_by: str = "provider") -> Dict[str, Any]:
+        """함수명: search_meetup_restaurants
+        기능: 다중 사용자 중간 지점 계산 후 주변 식당을 검색합니다. (이미지는 캐시 밖에서 with_images로 적용)
+          중간 지점 역지오코딩, Kakao 검색, 네이버 지역 검색(역지오코딩 지역명 사용)은 동시에 실행합니다.
+          rank_by가 provider가 아니면 RANK_CANDIDATES건까지 후보를 모아 참가자 거리 기준으로 상위 max_results건을 고릅니다.
+          결과는 사용자 순서와 무관한 키로 캐시하고(search_meetup_cached), users와 user_distances는 호출자의
+          사용자 순서로 맞춰 반환합니다.
+        요청 파라미터(예시):
+          users=[
+            {"lat":37.5665,"lng":126.9780},
+            {"lat":37.3943,"lng":127.1107}
+          ], radius=1500, cuisine="한식", max_results=5, midpoint_mode="median", rank_by="max"
+        응답 파라미터(예시):
+          {
+            "midpoint": {"lat": 37.4804, "lng": 127.04435, "mode": "median"},
+            "users": [...],
+            "restaurants": [ {"place_name":"설마중", "image_url":"https://...", "user_distances": [11222, 11230]}, ... ],
+            "source_stats": {"kakao":5, "naver":2, "total":5},
+            "query": "한식 맛집",
+            "total_found": 30,
+            "returned": 5
+          }
+        """
+        result = await self.search_meetup_cached(users, radius, cuisine, max_results, midpoint_mode, rank_by)
+        return self.align_users(result, users)
+
+    @cache_result("meetup_search", ttl=900, quantize_coords=True,
+                  stale_ttl=config.CACHE_STALE_TTL, order_insensitive=("users",),
+                  tags=["provider:kakao", "provider:naver"],
+                  result_tags=lambda result: [region_tag(result["midpoint"]["lat"], result["midpoint"]["lng"])]
+                  )  # 15분 캐시 (+stale 허용)
+    async def search_meetup_cached(self, users: List[Dict[str, Any]], radius: int = 1000,
+                                   cuisine: Optional[str] = None, max_results: int = 15,
+                                   midpoint_mode: str = "centroid",
+                                   rank_by: str = "provider") -> Dict[str, Any]:
+        """search_meetup_restaurants의 캐시 단계 (users 순서만 다른 호출과 항목을 공유하므로 반환값은 align_users로 맞춰 사용)"""
+        midpoint = await self.resolve_midpoint(users, midpoint_mode)
+        keyword = f"{cuisine} 맛집" if cuisine else "맛집"
+
+        locate = asyncio.ensure_future(self.locate_midpoint(midpoint))
+        midpoint_with_address, places = await asyncio.gather(
+            locate,
+            self.search_places(midpoint, locate, radius, keyword, self.candidate_count(max_results, rank_by), cuisine),
+        )
+        ranked = self.rank_candidates(users, places, rank_by, max_results)
+        return self.assemble_result(midpoint_with_address, users, keyword, ranked, max_results, len(places))
+
+    @staticmethod
+    def align_users(result: Dict[str, Any], users: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """함수명: align_users
+        기능: 다른 사용자 순서로 계산되어 캐시된 결과의 users와 각 식당의 user_distances를 호출자의 순서로 되돌립니다.
+          양쪽 사용자 목록을 캐시 키와 같은 기준(CACHE_KEY_COORD_GRID 양자화 좌표)으로 정렬해 대응시키며,
+          같은 격자점에 있는 사용자끼리는 입력 순서로 대응합니다. (거리 차이는 격자 크기 이내)
+        요청 파라미터(예시):
+          result={"users": [{"lat":37.3943,"lng":127.1107}, {"lat":37.5665,"lng":126.9780}],
+                  "restaurants": [{"place_name": "설마중", "user_distances": [11230, 11222]}], ...},
+          users=[{"lat":37.5665,"lng":126.9780}, {"lat":37.3943,"lng":127.1107}]
+        응답 파라미터(예시):
+          {"users": [{"lat":37.5665,"lng":126.9780}, {"lat":37.3943,"lng":127.1107}],
+           "restaurants": [{"place_name": "설마중", "user_distances": [11222, 11230]}], ...}
+        """
+        cached_users = result.get("users") or []
+        if len(cached_users) != len(users):
+            return result
+        grid = config.CACHE_KEY_COORD_GRID
+
+        def canonical_order(points: List[Dict[str, Any]]) -> List[int]:
+            return sorted(range(len(points)), key=lambda i: (_quantize(float(points[i]["lat"]), grid),
+                                                              _quantize(float(points[i]["lng"]), grid)))
+
+        source = [0] * len(users)
+        for mine, theirs in zip(canonical_order(users), canonical_order(cached_users)):
+            source[mine] = theirs
+        restaurants = result.get("restaurants", [])
+        if source != list(range(len(users))):
+            restaurants = [
+                {**r, "user_distances": [r["user_distances"][j] for j in source]} if r.get("user_distances") else r
+                for r in restaurants
+            ]
+        return {
+            **result,
+            "users": [{"lat": user["lat"], "lng": user["lng"]} for user in users],
+            "restaurants": restaurants,
+        }
+
+    async def stream_meetup_restaurants(self, users: List[Dict[str, Any]], radius: int = 1000,
+                                        cuisine: Optional[str] = None,
+                                        max_results: int = 15,
+                                        midpoint_mode: str = "centroid",
+                                        rank_by: str = "provider") -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """함수명: stream_meetup_restaurants
+        기능: search_meetup_restaurants를 단계별 이벤트로 나눠 내보냅니다.
+          역지오코딩, Kakao 검색, 네이버 검색(역지오코딩 지역명 사용)을 동시에 시작해 끝나는 순서대로 midpoint를 보내고,
+          Kakao 결과가 오면 네이버를 기다리지 않고 Kakao 후보만으로 순위를 매긴 restaurants(partial=true)를 먼저 보냅니다.
+          네이버 병합(+카탈로그)이 끝나면 최종 restaurants(partial=false)로 목록 전체를 다시 보내고,
+          image_worker 조회가 끝날 때마다(IMAGE_ENRICH_BUDGET초까지) 최종 목록 기준 image 이벤트, 마지막에 전체 결과(done)를 보냅니다.
+          (네이버 검색이 Kakao보다 먼저 끝났거나 카탈로그만 사용하면 partial 이벤트는 생략)
+          캐시된 결과가 있으면 장소 검색 없이 midpoint → restaurants → image → done을 보내고,
+          새로 계산한 결과는 이미지를 적용하기 전 상태로 같은 키에 캐시합니다.
+        요청 파라미터(예시):
+          users=[{"lat":37.5665,"lng":126.9780}, {"lat":37.3943,"lng":127.1107}], radius=1500, cuisine="한식", max_results=5,
+          midpoint_mode="centroid", rank_by="provider"
+        응답 파라미터(예시):
+          ("midpoint", {"lat": 37.4804, "lng": 127.04435, "mode": "centroid", "address": "..."})
+          ("restaurants", {"restaurants": [...Kakao 후보...], "query": "한식 맛집", "total_found": 30, "partial": True})
+          ("restaurants", {"restaurants": [...병합 후보...], "query": "한식 맛집", "total_found": 36, "partial": False})
+          ("image", {"index": 0, "place_id": "26410902", "image_url": "https://..."})
+          ("done", {...search_meetup_restaurants와 같은 전체 결과...})
+        """
+        cached = await PlaceSearchService.search_meetup_cached.peek(
+            self, users, radius, cuisine, max_results, midpoint_mode, rank_by
+        )
+        if cached is not None:
+            cached = self.align_users(cached, users)
+            yield "midpoint", cached["midpoint"]
+            restaurants, pending = await self.lookup_images(cached["restaurants"])
+            yield "restaurants", {"restaurants": restaurants, "query": cached["query"],
+                                  "total_found": cached["total_found"], "partial": False}
+            images: Dict[str, str] = {}
+            async for event in self.stream_images(restaurants, pending, images):
+                yield "image", event
+            yield "done", self.finish_images({**cached, "restaurants": restaurants}, pending, images)
+            return
+
+        midpoint = await self.resolve_midpoint(users, midpoint_mode)
+        keyword = f"{cuisine} 맛집" if cuisine else "맛집"
+        size = self.candidate_count(max_results, rank_by)
+        locate = asyncio.create_task(self.locate_midpoint(midpoint))
+        places = self.catalog_primary(midpoint, radius, size, cuisine)
+        tasks = [locate]
+        if places is None:
+            kakao = asyncio.create_task(self.search_kakao_category(midpoint["lat"], midpoint["lng"], radius,
+                                                                   keyword, size))
+            naver = asyncio.create_task(self.search_naver_near(locate, radius, keyword))
+            tasks += [kakao, naver]
+        located = False
+        try:
+            if places is None:
+                done, _ = await asyncio.wait({locate, kakao}, return_when=asyncio.FIRST_COMPLETED)
+                if locate in done:
+                    located = True
+                    yield "midpoint", locate.result()
+
+                kakao_list = await kakao
+                if not naver.done():
+                    # 네이버 검색(역지오코딩 지역명 필요)을 기다리지 않고 Kakao 결과부터 전달
+                    partial, _ = await self.lookup_images(self.rank_candidates(users, kakao_list, rank_by, max_results))
+                    yield "restaurants", {"restaurants": partial, "query": keyword, "total_found": len(kakao_list),
+                                          "partial": True}
+                if not located:
+                    located = True
+                    yield "midpoint", await locate
+                places = self.combine_places(midpoint, radius, size, cuisine, kakao_list, await naver)
+
+            ranked = self.rank_candidates(users, places, rank_by, max_results)
+            restaurants, pending = await self.lookup_images(ranked)
+            yield "restaurants", {"restaurants": restaurants, "query": keyword, "total_found": len(places),
+                                  "partial": False}
+
+            if not located:
+                yield "midpoint", await locate
+
+            images: Dict[str, str] = {}
+            async for event in self.stream_images(restaurants, pending, images):
+                yield "image", event
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        result = self.assemble_result(locate.result(), users, keyword, ranked, max_results, len(places))
+        await PlaceSearchService.search_meetup_cached.prime(
+            result, self, users, radius, cuisine, max_results, midpoint_mode, rank_by
+        )
+        yield "done", self.finish_images({**result, "restaurants": restaurants}, pending, images)
+
+    async def stream_images(self, restaurants: List[Dict[str, Any]], pending: List[str],
+                            images: Dict[str, str]) -> AsyncIterator[Dict[str, Any]]:
+        """함수명: stream_images
+        기능: image_worker 조회 결과를 image 이벤트 데이터로 내보내고, 받은 이미지를 images에 모읍니다.
+        요청 파라미터(예시):
+          restaurants=[{"place_id":"26410902", ...}, ...], pending=["26410902"], images={}
+        응답 파라미터(예시):
+          {"index": 0, "place_id": "26410902", "image_url": "https://..."} 반복
+        """
+        positions = {r.get("place_id"): index for index, r in enumerate(restaurants)}
+        async for place_id, url in image_worker.watch(pending, config.IMAGE_ENRICH_BUDGET):
+            images[place_id] = url
+            yield {"index": positions[place_id], "place_id": place_id, "image_url": url}
+
+    def finish_images(self, result: Dict[str, Any], pending: List[str], images: Dict[str, str]) -> Dict[str, Any]:
+        """스트림 done 결과에 받은 이미지를 적용하고 아직 조회 중인 place_id를 images_pending으로 표시"""
+        return {
+            **result,
+            "restaurants": self.apply_images(result["restaurants"], images),
+            "images_pending": [pid for pid in pending if pid not in images and image_worker.is_pending(pid)],
+        }
 
 service = PlaceSearchService()
 
@@ -368,6 +954,25 @@ service = PlaceSearchService()
 # 공통 스키마 사용
 _MCP_TOOLS = MCP_TOOLS
 
+# 도구 이름 → 비동기 핸들러 레지스트리
+MCPToolHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+_MCP_TOOL_HANDLERS: Dict[str, MCPToolHandler] = {}
+
+
+def mcp_tool(name: str) -> Callable[[MCPToolHandler], MCPToolHandler]:
+    """함수명: mcp_tool
+    기능: 비동기 함수를 MCP 도구 핸들러로 등록하는 데코레이터입니다.
+    요청 파라미터(예시):
+      @mcp_tool("recommend_meetup_restaurants")
+      async def _mcp_tool_recommend(arguments): ...
+    응답 파라미터(예시):
+      - 등록된 원래 함수
+    """
+    def decorator(func: MCPToolHandler) -> MCPToolHandler:
+        _MCP_TOOL_HANDLERS[name] = func
+        return func
+    return decorator
+
 
 @app.get("/mcp/tools")
 def mcp_list_tools() -> Dict[str, Any]:
@@ -383,7 +988,8 @@ def mcp_list_tools() -> Dict[str, Any]:
     return {"tools": _MCP_TOOLS}
 
 
-def _mcp_tool_recommend(arguments: Dict[str, Any]) -> Dict[str, Any]:
+@mcp_tool("recommend_meetup_restaurants")
+async def _mcp_tool_recommend(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """함수명: _mcp_tool_recommend
     기능: MCP 도구 요청을 검증하고 다중 사용자 기반 식당 추천을 실행합니다.
     요청 파라미터(예시):
@@ -396,7 +1002,21 @@ def _mcp_tool_recommend(arguments: Dict[str, Any]) -> Dict[str, Any]:
         "cuisine": "한식",
         "max_results": 5
       }
-    응답 파라미터(예시): search_meetup_restaurants의 반환과 동일
+    응답 파라미터(예시): search_meetup_restaurants의 반환 + images_pending (with_images 참고)
+    """
+    validated_users, radius, cuisine, max_results, midpoint_mode, rank_by = _parse_recommend_arguments(arguments)
+    result = await service.search_meetup_restaurants(validated_users, radius, cuisine, max_results, midpoint_mode,
+                                                     rank_by)
+    return await service.with_images(result, wait=config.IMAGE_ENRICH_MODE == "inline")
+
+
+def _parse_recommend_arguments(arguments: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int, Optional[str], int, str, str]:
+    """함수명: _parse_recommend_arguments
+    기능: recommend_meetup_restaurants 인자를 검증하고 검색 파라미터로 변환합니다.
+    요청 파라미터(예시):
+      arguments={"users": [{"lat":37.5665,"lng":126.9780}, {"lat":37.3943,"lng":127.1107}], "radius": 1500}
+    응답 파라미터(예시):
+      ([{"lat":37.5665,"lng":126.9780}, ...], 1500, None, 15, "centroid", "provider")
     """
     # users 또는 locations 배열 처리 및 검증 (하위 호환성 포함)
     users = arguments.get("users") or arguments.get("locations")
@@ -407,43 +1027,15 @@ def _mcp_tool_recommend(arguments: Dict[str, Any]) -> Dict[str, Any]:
     
     # 검색 파라미터 추출
     radius, cuisine, max_results = extract_search_parameters(arguments)
-
-    # 비동기 함수 실행
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # 이미 실행 중인 루프가 있는 경우 새 루프 생성
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(
-                    service.search_meetup_restaurants(validated_users, radius, cuisine, max_results)
-                )
-                return result
-            finally:
-                loop.close()
-        else:
-            # 기존 루프 사용
-            result = loop.run_until_complete(
-                service.search_meetup_restaurants(validated_users, radius, cuisine, max_results)
-            )
-            return result
-    except RuntimeError:
-        # 루프가 없는 경우 새로 생성
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(
-                service.search_meetup_restaurants(validated_users, radius, cuisine, max_results)
-            )
-            return result
-        finally:
-            loop.close()
+    midpoint_mode = extract_midpoint_mode(arguments, config.MIDPOINT_MODE)
+    if midpoint_mode == "travel_time" and not travel_router.enabled:
+        raise HTTPException(status_code=400, detail="ROUTING_GRAPH_FILE이 설정되지 않아 travel_time 모드를 사용할 수 없습니다")
+    rank_by = extract_rank_by(arguments, config.RANK_BY)
+    return validated_users, radius, cuisine, max_results, midpoint_mode, rank_by
 
 
 @app.post("/mcp/call")
-def mcp_call_tool(payload: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+async def mcp_call_tool(payload: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     """함수명: mcp_call_tool
     기능: MCP 규격의 도구 호출을 받아 내부 도구 구현으로 라우팅합니다.
     요청 파라미터(예시):
@@ -460,24 +1052,140 @@ def mcp_call_tool(payload: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
         }
       }
     응답 파라미터(예시):
-      {"content": {...}, "isError": false}
+      {"content": {...}, "isError": false,
+       "freshness": {"status": "stale", "max_age": 1210.5, "sources": {"meetup_search": "stale"}}}
+      (freshness.status: fresh | miss | stale | stale_error | error)
+    """
+    return await _dispatch_mcp_call(payload)
+
+
+async def _dispatch_mcp_call(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """함수명: _dispatch_mcp_call
+    기능: 도구 이름으로 핸들러를 찾아 실행하고 MCP 응답 형식으로 감쌉니다.
+      요청 형식 오류는 HTTPException으로, 도구 실행 오류는 isError 응답으로 반환합니다.
+    요청 파라미터(예시):
+      payload={"name": "recommend_meetup_restaurants", "arguments": {...}}
+    응답 파라미터(예시):
+      {"content": {...}, "isError": false, "freshness": {...}}
     """
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="호출은 객체여야 합니다")
     name = payload.get("name")
     arguments = payload.get("arguments") or {}
     if not name:
         raise HTTPException(status_code=400, detail="name은 필수입니다")
+    handler = _MCP_TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise HTTPException(status_code=404, detail=f"알 수 없는 도구: {name}")
     try:
-        if name == "recommend_meetup_restaurants":
-            content = _mcp_tool_recommend(arguments)
-        else:
-            raise HTTPException(status_code=404, detail=f"알 수 없는 도구: {name}")
-        return {"content": content, "isError": False}
+        with track_freshness() as freshness:
+            content = await handler(arguments)
+        return {"content": content, "isError": False, "freshness": freshness.summary()}
     except HTTPException:
         raise
     except Exception as e:
         return {"content": {"error": str(e)}, "isError": True}
 
 
+@app.post("/mcp/batch")
+async def mcp_batch_call(payload: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+    """함수명: mcp_batch_call
+    기능: 여러 MCP 도구 호출을 한 요청으로 받아 MCP_BATCH_MAX_CONCURRENCY개까지 동시에 실행합니다.
+      정규화했을 때 같은 호출(공백, 실수 자릿수, 키 순서만 다른 경우)은 한 번만 실행해 결과를 공유하고,
+      서로 다른 호출 사이의 공통 작업(같은 Kakao 검색, 같은 셀 역지오코딩)은 캐시 single-flight로 병합됩니다.
+      사용자 순서는 users와 user_distances 순서를 결정하므로 순서가 다른 호출은 별도 항목으로 실행합니다.
+      결과는 요청 순서대로 반환하며, 항목별 오류는 해당 항목의 isError/status로 표시합니다.
+    요청 파라미터(예시):
+      {
+        "calls": [
+          {"name": "recommend_meetup_restaurants", "arguments": {"users": [...], "radius": 1500}},
+          {"name": "recommend_meetup_restaurants", "arguments": {"users": [...], "cuisine": "일식"}}
+        ]
+      }
+    응답 파라미터(예시):
+      {"results": [{"content": {...}, "isError": false, "freshness": {...}},
+                   {"content": {"error": "users 또는 locations는 ..."}, "isError": true, "status": 400}],
+       "stats": {"calls": 2, "unique": 2}}
+    """
+    calls = payload.get("calls")
+    if not isinstance(calls, list) or not calls:
+        raise HTTPException(status_code=400, detail="calls는 1개 이상의 호출 배열이어야 합니다")
+    if len(calls) > config.MCP_BATCH_MAX_CALLS:
+        raise HTTPException(status_code=400, detail=f"calls는 최대 {config.MCP_BATCH_MAX_CALLS}개까지 가능합니다")
+
+    semaphore = asyncio.Semaphore(config.MCP_BATCH_MAX_CONCURRENCY)
+
+    async def run(call: Any) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await _dispatch_mcp_call(call)
+            except HTTPException as e:
+                return {"content": {"error": e.detail}, "isError": True, "status": e.status_code}
+
+    unique: Dict[str, "asyncio.Task"] = {}
+    order: List[str] = []
+    for call in calls:
+        # 사용자 목록은 정렬하지 않음 (순서가 다르면 응답의 users/user_distances 순서도 달라야 함)
+        key = json.dumps(canonicalize(call), ensure_ascii=False, sort_keys=True, default=str)
+        if key not in unique:
+            unique[key] = asyncio.ensure_future(run(call))
+        order.append(key)
+
+    await asyncio.gather(*unique.values())
+    return {
+        "results": [unique[key].result() for key in order],
+        "stats": {"calls": len(calls), "unique": len(unique)},
+    }
+
+
+def _format_stream_event(event: str, data: Dict[str, Any], sse: bool) -> str:
+    """스트림 이벤트 한 건을 SSE(event/data 블록) 또는 NDJSON(한 줄) 문자열로 변환"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    if sse:
+        return f"event: {event}\ndata: {payload}\n\n"
+    return json.dumps({"event": event, "data": data}, ensure_ascii=False, default=str) + "\n"
+
+
+@app.post("/mcp/stream")
+async def mcp_stream_tool(request: Request, payload: Dict[str, Any] = Body(...)) -> StreamingResponse:
+    """함수명: mcp_stream_tool
+    기능: recommend_meetup_restaurants를 단계별 이벤트로 스트리밍합니다.
+      Accept: text/event-stream이면 SSE, 그 외에는 NDJSON(한 줄에 이벤트 하나)으로 응답합니다.
+      이벤트 순서: midpoint/restaurants(완료 순, Kakao 결과 partial → 네이버 병합 최종) → image(이미지마다)
+      → done(/mcp/call과 같은 응답) 또는 error
+    요청 파라미터(예시):
+      {"name": "recommend_meetup_restaurants", "arguments": {"users": [...], "radius": 1500, "cuisine": "한식"}}
+    응답 파라미터(예시):
+      {"event": "restaurants", "data": {"restaurants": [...], "query": "한식 맛집", "total_found": 5, "partial": true}}
+      {"event": "midpoint", "data": {"lat": 37.4804, "lng": 127.04435, "address": "..."}}
+      {"event": "image", "data": {"index": 0, "place_id": "26410902", "image_url": "https://..."}}
+      {"event": "done", "data": {"content": {...}, "isError": false, "freshness": {...}}}
+    """
+    name = payload.get("name")
+    if name != "recommend_meetup_restaurants":
+        raise HTTPException(status_code=404, detail=f"스트리밍을 지원하지 않는 도구: {name}")
+    users, radius, cuisine, max_results, midpoint_mode, rank_by = _parse_recommend_arguments(payload.get("arguments") or {})
+    sse = "text/event-stream" in request.headers.get("accept", "")
+
+    async def events():
+        with track_freshness() as freshness:
+            try:
+                async for event, data in service.stream_meetup_restaurants(users, radius, cuisine, max_results,
+                                                                                midpoint_mode, rank_by):
+                    if event == "done":
+                        data = {"content": data, "isError": False, "freshness": freshness.summary()}
+                    yield _format_stream_event(event, data, sse)
+            except Exception as e:
+                logger.error(f"스트리밍 검색 오류: {e}")
+                yield _format_stream_event("error", {"content": {"error": str(e)}, "isError": True}, sse)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # =============================================================================
 # BASIC ENDPOINTS
 # =============================================================================
@@ -497,6 +1205,16 @@ async def root():
             "health": "GET /health",
             "mcp_list_tools": "GET /mcp/tools",
             "mcp_call_tool": "POST /mcp/call",
+            "mcp_batch_call": "POST /mcp/batch",
+            "mcp_stream_tool": "POST /mcp/stream",
+            "http_stats": "GET /http/stats",
+            "geocode_stats": "GET /geocode/stats",
+            "routing_stats": "GET /routing/stats",
+            "catalog_stats": "GET /catalog/stats",
+            "images": "GET /images?place_ids=...",
+            "image_stats": "GET /images/stats",
+            "cache_warm_stats": "GET /cache/warm/stats",
+            "metrics": "GET /metrics",
         }
     }
 
@@ -522,10 +1240,114 @@ async def cache_stats():
     응답 파라미터(예시):
       {"connected": true, "keys": 150, "memory": "2.5MB", "hits": 1000, "misses": 200}
     """
-    stats = cache_manager.get_stats()
+    stats = await cache_manager.get_stats()
     return {"cache": stats}
 
 
+@app.get("/cache/warm/stats")
+async def cache_warm_stats():
+    """함수명: cache_warm_stats
+    기능: 캐시 예열 설정과 마지막 예열 보고서(호출 커버리지, 새로 채운/이미 예열된 조합 수)를 반환합니다.
+    요청 파라미터(예시):
+      - 없음 (GET /cache/warm/stats)
+    응답 파라미터(예시):
+      {"warm": {"running": false, "runs": 1, "last_report": {"coverage": {"cell_coverage": 0.71, ...},
+                "warm": {"warmed": 37, "already_warm": 12, ...}}}}
+    """
+    return {"warm": cache_warmer.get_stats()}
+
+
+@app.get("/http/stats")
+async def http_stats():
+    """함수명: http_stats
+    기능: 외부 API용 HTTP 커넥션 풀 통계와 호출 속도 제한 상태를 반환합니다.
+    요청 파라미터(예시):
+      - 없음 (GET /http/stats)
+    응답 파라미터(예시):
+      {"http": {"active": true, "open": 5, "in_use": 2, "idle": 3, "waiting": 0, ...},
+       "rate_limits": {"kakao": {"rate": 10.0, "burst": 20, "tokens": 17.5, "acquired": 120, "waited": 8, ...}}}
+    """
+    return {"http": http_client.get_stats(), "rate_limits": {"kakao": kakao_rate_limiter.get_stats()}}
+
+
+@app.get("/geocode/stats")
+async def geocode_stats():
+    """함수명: geocode_stats
+    기능: 역지오코딩 제공자별 지연 시간과 승리(채택) 횟수를 반환합니다.
+    요청 파라미터(예시):
+      - 없음 (GET /geocode/stats)
+    응답 파라미터(예시):
+      {"geocode": {"mode": "hedged", "providers": {"kakao": {"calls": 10, "wins": 9, "avg_latency_ms": 42.1}, ...}}}
+    """
+    return {"geocode": geocoding_service.get_stats()}
+
+
+@app.get("/routing/stats")
+async def routing_stats():
+    """함수명: routing_stats
+    기능: 이동 시간 그래프 로드 상태와 travel_time 중간 지점 계산 통계를 반환합니다.
+    요청 파라미터(예시):
+      - 없음 (GET /routing/stats)
+    응답 파라미터(예시):
+      {"routing": {"enabled": true, "loaded": true, "nodes": 90000, "edges": 358676, "backend": "scipy", ...}}
+    """
+    return {"routing": travel_router.get_stats()}
+
+
+@app.get("/catalog/stats")
+async def catalog_stats():
+    """함수명: catalog_stats
+    기능: 로컬 장소 카탈로그의 모드, 장소/셀 수, 검색 시간과 기록(write-through) 통계를 반환합니다.
+    요청 파라미터(예시):
+      - 없음 (GET /catalog/stats)
+    응답 파라미터(예시):
+      {"catalog": {"mode": "gap_fill", "places": 12840, "cells": 2210, "avg_query_ms": 0.21, ...}}
+    """
+    return {"catalog": place_catalog.get_stats()}
+
+
+@app.get("/images")
+async def get_images(place_ids: str = Query(..., description="쉼표로 구분한 place_id 목록 (images_pending 값)")):
+    """함수명: get_images
+    기능: 백그라운드로 조회한 식당 이미지를 place_id별로 반환합니다. (응답의 images_pending을 나중에 채울 때 사용)
+      이미지가 없다고 확인된 장소는 빈 문자열, 아직 조회 중인 장소는 pending에 포함됩니다.
+    요청 파라미터(예시):
+      GET /images?place_ids=26410902,8130556,1879186093
+    응답 파라미터(예시):
+      {"images": {"26410902": "https://...jpg", "8130556": ""}, "pending": ["1879186093"]}
+    """
+    ids = [p for p in dict.fromkeys(place_ids.split(",")) if p]
+    images = await image_store.get_many(ids)
+    return {"images": images, "pending": [p for p in ids if p not in images and image_worker.is_pending(p)]}
+
+
+@app.get("/images/stats")
+async def image_stats():
+    """함수명: image_stats
+    기능: 이미지 보강 작업자(대기열/처리 수)와 place_id 이미지 저장소 적중 통계를 반환합니다.
+    요청 파라미터(예시):
+      - 없음 (GET /images/stats)
+    응답 파라미터(예시):
+      {"images": {"running": true, "queued": 0, "inflight": 2, "found": 97, "store": {"hit_rate": 0.81, ...}}}
+    """
+    return {"images": image_worker.get_stats()}
+
+
+@app.get("/metrics")
+async def metrics():
+    """함수명: metrics
+    기능: Prometheus 텍스트 형식으로 파이프라인 단계/외부 API 지연 히스토그램, 오류 수,
+      캐시 결과 수, 처리 중 요청 수, 이벤트 루프 지연을 반환합니다.
+    요청 파라미터(예시):
+      - 없음 (GET /metrics)
+    응답 파라미터(예시):
+      # TYPE meetup_stage_duration_seconds histogram
+      meetup_stage_duration_seconds_bucket{stage="kakao_search",le="0.1"} 42
+      ...
+    """
+    return Response(content=metrics_registry.render(), media_type=metrics_registry.CONTENT_TYPE)
+
+
 @app.post("/cache/clear")
 async def clear_cache(pattern: str = "*"):
     """함수명: clear_cache
@@ -535,10 +1357,28 @@ async def clear_cache(pattern: str = "*"):
     응답 파라미터(예시):
       {"deleted": 150, "pattern": "*"}
     """
-    deleted_count = cache_manager.delete_pattern(pattern)
+    deleted_count = await cache_manager.delete_pattern(pattern)
     return {"deleted": deleted_count, "pattern": pattern}
 
 
+@app.post("/cache/purge")
+async def purge_cache(tag: Optional[str] = None, lat: Optional[float] = None, lng: Optional[float] = None):
+    """함수명: purge_cache
+    기능: 태그 집합에 등록된 캐시만 삭제합니다. (패턴 스캔 없음)
+      lat/lng를 주면 해당 좌표가 속한 지역 태그(region:<geohash>)를 삭제합니다.
+    요청 파라미터(예시):
+      tag="provider:kakao" 또는 lat=37.4979&lng=127.0276
+    응답 파라미터(예시):
+      {"deleted": 42, "tag": "provider:kakao"}
+    """
+    if tag is None:
+        if lat is None or lng is None:
+            raise HTTPException(status_code=400, detail="tag 또는 lat/lng가 필요합니다")
+        tag = region_tag(lat, lng)
+    deleted_count = await cache_manager.purge_tag(tag)
+    return {"deleted": deleted_count, "tag": tag}
+
+
 if __name__ == "__main__":
     # API 키 상태 확인
     api_status = config.validate_api_keys()
@@ -0,0 +1,13 @@
+"""
+pytest 공통 설정
+서버 코드와 같은 방식(backend, backend/common 평면 import)으로 모듈을 불러올 수 있도록 경로를 추가합니다.
+"""
+
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for path in (BACKEND_DIR, os.path.join(BACKEND_DIR, "common")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
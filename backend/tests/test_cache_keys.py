@@ -0,0 +1,124 @@
+"""
+캐시 키 정규화 / 사용자 순서 정렬 테스트
+build_cache_key, canonicalize, align_users처럼 Redis나 외부 API 없이 동작하는 순수 함수만 검사합니다.
+"""
+
+import inspect
+import os
+import subprocess
+import sys
+
+from cache_manager import build_cache_key, canonicalize
+from config import config
+from server import PlaceSearchService
+
+GANGNAM = {"lat": 37.4979, "lng": 127.0276}
+SEOUL = {"lat": 37.5665, "lng": 126.9780}
+PANGYO = {"lat": 37.3943, "lng": 127.1107}
+
+
+def search(self, lat, lng, radius=1000, query="맛집"):
+    """키 생성용 시그니처"""
+
+
+def meetup(self, users, radius=1000):
+    """키 생성용 시그니처"""
+
+
+SEARCH_SIGNATURE = inspect.signature(search)
+MEETUP_SIGNATURE = inspect.signature(meetup)
+
+
+def test_key_ignores_self():
+    first = build_cache_key("kakao_search", SEARCH_SIGNATURE, (object(), 37.4979, 127.0276, 1000), {})
+    second = build_cache_key("kakao_search", SEARCH_SIGNATURE, (object(), 37.4979, 127.0276, 1000), {})
+    assert first == second
+
+
+def test_key_binds_defaults_and_keywords():
+    positional = build_cache_key("kakao_search", SEARCH_SIGNATURE, (None, 37.4979, 127.0276), {})
+    keyword = build_cache_key("kakao_search", SEARCH_SIGNATURE, (None,),
+                              {"lng": 127.0276, "lat": 37.4979, "query": " 맛집 ", "radius": 1000})
+    assert positional == keyword
+
+
+def test_key_stable_across_workers():
+    """해시 시드가 다른 프로세스(워커)에서도 같은 키"""
+    script = (
+        "import inspect\n"
+        "from cache_manager import build_cache_key\n"
+        "def search(self, lat, lng, radius=1000, query='맛집'): pass\n"
+        "print(build_cache_key('kakao_search', inspect.signature(search), (object(), 37.4979, 127.0276, 1500), {}))\n"
+    )
+    keys = set()
+    for seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": os.pathsep.join(sys.path)}
+        output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+        keys.add(output.stdout.strip().splitlines()[-1])
+    keys.add(build_cache_key("kakao_search", SEARCH_SIGNATURE, (None, 37.4979, 127.0276, 1500), {}))
+    assert len(keys) == 1
+
+
+def test_lists_keep_order_by_default():
+    assert canonicalize([SEOUL, PANGYO], "users") == [SEOUL, PANGYO]
+    forward = build_cache_key("route", MEETUP_SIGNATURE, (None, [SEOUL, PANGYO]), {})
+    backward = build_cache_key("route", MEETUP_SIGNATURE, (None, [PANGYO, SEOUL]), {})
+    assert forward != backward
+
+
+def test_order_insensitive_lists_are_sorted():
+    assert canonicalize([SEOUL, PANGYO], "users", unordered=("users",)) == [PANGYO, SEOUL]
+    forward = build_cache_key("meetup_search", MEETUP_SIGNATURE, (None, [SEOUL, PANGYO]), {}, unordered=("users",))
+    backward = build_cache_key("meetup_search", MEETUP_SIGNATURE, (None, [PANGYO, SEOUL]), {}, unordered=("users",))
+    assert forward == backward
+
+
+def test_unordered_applies_only_to_named_argument():
+    assert canonicalize([SEOUL, PANGYO], "stops", unordered=("users",)) == [SEOUL, PANGYO]
+
+
+def test_grid_quantization_merges_nearby_coordinates():
+    grid = 0.001
+    near = build_cache_key("kakao_search", SEARCH_SIGNATURE, (None, 37.49791, 127.02761), {}, grid=grid)
+    same_cell = build_cache_key("kakao_search", SEARCH_SIGNATURE, (None, 37.49788, 127.02758), {}, grid=grid)
+    other_cell = build_cache_key("kakao_search", SEARCH_SIGNATURE, (None, 37.4990, 127.0276), {}, grid=grid)
+    assert near == same_cell
+    assert near != other_cell
+
+
+def test_quantization_only_touches_coordinate_fields():
+    canonical = canonicalize({"lat": 37.49791, "lng": 127.02761, "radius": 1000.1234567}, grid=0.001)
+    assert canonical == {"lat": 37.498, "lng": 127.028, "radius": 1000.123457}
+
+
+def test_without_grid_coordinates_round_to_six_places():
+    assert canonicalize({"lat": 37.49790001, "lng": 127.0276}) == {"lat": 37.4979, "lng": 127.0276}
+
+
+def test_align_users_permutes_user_distances():
+    cached = {
+        "users": [PANGYO, SEOUL, GANGNAM],
+        "restaurants": [
+            {"place_name": "A", "user_distances": [3, 1, 2]},
+            {"place_name": "B", "user_distances": [30, 10, 20]},
+        ],
+    }
+    aligned = PlaceSearchService.align_users(cached, [SEOUL, GANGNAM, PANGYO])
+    assert aligned["users"] == [SEOUL, GANGNAM, PANGYO]
+    assert [r["user_distances"] for r in aligned["restaurants"]] == [[1, 2, 3], [10, 20, 30]]
+    # 캐시에 저장된 원본은 바뀌지 않음
+    assert cached["restaurants"][0]["user_distances"] == [3, 1, 2]
+
+
+def test_align_users_matches_within_grid_cell():
+    offset = config.CACHE_KEY_COORD_GRID / 10
+    nearby_seoul = {"lat": SEOUL["lat"] + offset, "lng": SEOUL["lng"]}
+    cached = {"users": [PANGYO, SEOUL], "restaurants": [{"user_distances": [200, 100]}]}
+    aligned = PlaceSearchService.align_users(cached, [nearby_seoul, PANGYO])
+    assert aligned["users"] == [nearby_seoul, PANGYO]
+    assert aligned["restaurants"][0]["user_distances"] == [100, 200]
+
+
+def test_align_users_leaves_mismatched_result_alone():
+    cached = {"users": [SEOUL], "restaurants": [{"user_distances": [1]}]}
+    assert PlaceSearchService.align_users(cached, [SEOUL, PANGYO]) is cached
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+캐시 키 적중률 비교
+요청 로그를 재생하며 기존 키(prefix + str(arg), self 포함)와 정규화 키(build_cache_key)의
+meetup_search 적중률을 비교합니다. 여러 워커에 라운드로빈으로 분산된다고 가정하며,
+TTL 만료는 로그 타임스탬프 기준으로 적용합니다.
+
+실행:
+  cd backend
+  python tools/bench_cache_keys.py --log ./logs/meetup_server.log --workers 4 --grid 0.0005
+  python tools/bench_cache_keys.py --synthetic 5000        # 로그 없이 합성 요청으로 비교
+"""
+
+import argparse
+import inspect
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "common"))
+
+from cache_manager import build_cache_key
+from request_log import iter_logged_calls
+from validation import extract_search_parameters, validate_users
+
+HOTSPOTS = [(37.4979, 127.0276), (37.5563, 126.9236), (37.5133, 127.1001), (37.5704, 126.9921)]
+
+
+class _Worker:
+    """기존 키에 포함되던 self repr(메모리 주소)을 흉내내는 워커 객체"""
+
+
+def search_signature(self, users, radius=1000, cuisine=None, max_results=15):
+    """PlaceSearchService.search_meetup_cached와 같은 시그니처"""
+
+
+SIGNATURE = inspect.signature(search_signature)
+
+
+def synthetic_calls(count: int, groups: int = 300, seed: int = 7) -> Iterable[Dict[str, Any]]:
+    """인기 지역 주변 고정 그룹들이 순서를 바꾸거나 GPS 오차를 섞어 반복 검색하는 합성 요청"""
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(groups):
+        lat, lng = rng.choice(HOTSPOTS)
+        users = [{"lat": lat + rng.uniform(-0.03, 0.03), "lng": lng + rng.uniform(-0.03, 0.03)}
+                 for _ in range(rng.randint(2, 4))]
+        pool.append((users, rng.choice([1000, 1500]), rng.choice(["한식", "일식", None])))
+
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    for i in range(count):
+        users, radius, cuisine = rng.choice(pool)
+        users = [dict(u) for u in users]
+        if rng.random() < 0.3:  # 위치 재측정으로 수 미터 오차
+            for u in users:
+                u["lat"] += rng.uniform(-2e-5, 2e-5)
+                u["lng"] += rng.uniform(-2e-5, 2e-5)
+        rng.shuffle(users)
+        yield {
+            "timestamp": start + timedelta(seconds=i),
+            "name": "recommend_meetup_restaurants",
+            "arguments": {"users": users, "radius": radius, "cuisine": cuisine},
+        }
+
+
+def replay(calls: List[Dict[str, Any]], workers: int, ttl: int, grid: float) -> Dict[str, float]:
+    """두 키 방식으로 같은 요청열을 재생해 적중률 계산"""
+    instances = [_Worker() for _ in range(workers)]
+    stores: Dict[str, Dict[str, datetime]] = {"legacy": {}, "canonical": {}}
+    hits = {"legacy": 0, "canonical": 0}
+
+    for i, call in enumerate(calls):
+        worker = instances[i % workers]
+        try:
+            users = validate_users(call["arguments"].get("users") or call["arguments"].get("locations"))
+            radius, cuisine, max_results = extract_search_parameters(call["arguments"])
+        except Exception:
+            continue
+        args = (worker, users, radius, cuisine, max_results)
+        keys = {
+            "legacy": ":".join(["meetup_search"] + [str(a) for a in args]),
+            "canonical": build_cache_key("meetup_search", SIGNATURE, args, {}, grid, ("users",)),
+        }
+        now = call["timestamp"]
+        for scheme, key in keys.items():
+            expires = stores[scheme].get(key)
+            if expires and expires > now:
+                hits[scheme] += 1
+            else:
+                stores[scheme][key] = now + timedelta(seconds=ttl)
+
+    total = len(calls) or 1
+    return {scheme: hits[scheme] / total for scheme in hits}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--log", help="요청 로그 파일 경로")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 요청 개수 (로그 대신 사용)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--ttl", type=int, default=900, help="meetup_search TTL (초)")
+    parser.add_argument("--grid", type=float, default=0.0005, help="좌표 양자화 격자 (도)")
+    args = parser.parse_args()
+
+    if args.log:
+        calls = list(iter_logged_calls(args.log, "recommend_meetup_restaurants"))
+    else:
+        calls = list(synthetic_calls(args.synthetic or 5000))
+    if not calls:
+        print("재생할 요청이 없습니다.")
+        return
+
+    print(f"requests={len(calls)} workers={args.workers} ttl={args.ttl}s")
+    for label, grid in (("no quantization", 0.0), (f"grid={args.grid}", args.grid)):
+        rates = replay(calls, args.workers, args.ttl, grid)
+        print(f"{label:<16} legacy={rates['legacy']:.1%}  canonical={rates['canonical']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
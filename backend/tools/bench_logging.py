@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+요청 로깅 미들웨어 오버헤드 벤치마크
+같은 엔드포인트를 미들웨어 없이 / 기존 방식(본문 전체 버퍼링 + 동기 FileHandler) /
+RequestLoggingMiddleware(QueueHandler, 샘플링 비율별)로 호출해 요청당 추가 지연을 비교합니다.
+
+실행:
+  cd backend
+  python tools/bench_logging.py --requests 2000 --body-kb 8
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "common"))
+
+import httpx
+from fastapi import Body, FastAPI, Request
+from fastapi.responses import Response
+
+from request_logging import RequestLoggingMiddleware, setup_logging
+
+
+def build_app(payload: bytes) -> FastAPI:
+    """요청 본문을 받아 고정 크기 JSON을 돌려주는 최소 엔드포인트"""
+    app = FastAPI()
+
+    @app.post("/mcp/call")
+    async def call(body: Dict = Body(...)):
+        return Response(content=payload, media_type="application/json")
+
+    return app
+
+
+def add_legacy_middleware(app: FastAPI, log: logging.Logger) -> None:
+    """기존 server.py의 log_requests와 같은 방식 (본문 버퍼링 + 응답 재구성)"""
+
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        body_bytes = await request.body()
+        log.info(f"[REQ] {request.method} {request.url.path} body={body_bytes.decode('utf-8')}")
+        response = await call_next(request)
+        content = b""
+        async for chunk in response.body_iterator:
+            content += chunk
+        sample = content.decode("utf-8", errors="ignore")
+        if len(sample) > 1000:
+            sample = sample[:1000] + "... [truncated]"
+        log.info(f"[RES] {request.method} {request.url.path} {response.status_code} body={sample}")
+        return Response(content=content, status_code=response.status_code,
+                        headers=dict(response.headers), media_type=response.media_type)
+
+
+async def measure(app, body: bytes, requests: int) -> float:
+    """순차 요청의 평균 지연(마이크로초)"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        headers = {"content-type": "application/json"}
+        for _ in range(50):
+            await client.post("/mcp/call", content=body, headers=headers)
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.post("/mcp/call", content=body, headers=headers)
+        return (time.perf_counter() - start) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--body-kb", type=int, default=8, help="응답 본문 크기 (KB)")
+    args = parser.parse_args()
+
+    request_body = b'{"name": "recommend_meetup_restaurants", "arguments": {"users": [{"lat": 37.5665, "lng": 126.978}, {"lat": 37.3943, "lng": 127.1107}]}}'
+    payload = b'{"content": "' + b"x" * (args.body_kb * 1024) + b'"}'
+    log_dir = tempfile.mkdtemp(prefix="bench_logging_")
+
+    # 기존 방식: 이벤트 루프에서 직접 파일에 기록
+    legacy_log = logging.getLogger("bench.legacy")
+    legacy_log.propagate = False
+    legacy_log.setLevel(logging.INFO)
+    legacy_log.addHandler(logging.FileHandler(os.path.join(log_dir, "legacy.log")))
+
+    variants: Dict[str, Callable[[], FastAPI]] = {}
+    variants["no middleware"] = lambda: build_app(payload)
+
+    def legacy():
+        app = build_app(payload)
+        add_legacy_middleware(app, legacy_log)
+        return app
+    variants["legacy buffered"] = legacy
+
+    for rate in (1.0, 0.1, 0.0):
+        def queued(rate=rate):
+            app = build_app(payload)
+            app.add_middleware(RequestLoggingMiddleware, sample_rate=rate, max_body_bytes=4096)
+            return app
+        variants[f"queued rate={rate}"] = queued
+
+    # 새 방식: 루트 로거 → 큐 → 백그라운드 스레드 (콘솔 출력은 벤치마크에서 제외)
+    listener = setup_logging("INFO", log_dir, "queued.log")
+    listener.handlers = tuple(h for h in listener.handlers if type(h) is not logging.StreamHandler)
+
+    print(f"requests={args.requests} response={args.body_kb}KB log_dir={log_dir}")
+    baseline = None
+    for name, factory in variants.items():
+        avg = asyncio.run(measure(factory(), request_body, args.requests))
+        baseline = baseline if baseline is not None else avg
+        print(f"{name:<20} {avg:8.1f} µs/req  (+{avg - baseline:6.1f} µs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+POST /mcp/call 동시성 벤치마크
+기존 방식(동기 라우트 + 요청마다 새 이벤트 루프)과 현재 비동기 라우트의 처리량을 비교합니다.
+두 앱에는 같은 미들웨어가 등록되므로 차이는 라우트 처리 방식에서만 나옵니다.
+외부 API 호출은 고정 지연(--latency)을 갖는 가짜 검색으로 대체합니다.
+
+실행 (httpx 필요, requirements.txt 참고):
+  cd backend
+  python tools/bench_mcp_call.py --requests 400 --concurrency 200 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "common"))
+os.chdir(BACKEND_DIR)
+
+import httpx
+from fastapi import Body, FastAPI
+
+import server
+
+PAYLOAD = {
+    "name": "recommend_meetup_restaurants",
+    "arguments": {
+        "users": [{"lat": 37.5665, "lng": 126.9780}, {"lat": 37.3943, "lng": 127.1107}],
+        "radius": 1500,
+        "cuisine": "한식",
+        "max_results": 5,
+    },
+}
+
+
+def build_legacy_app() -> FastAPI:
+    """기존 구현과 같은 동기 라우트(스레드풀 + 요청별 이벤트 루프)를 가진 앱
+
+    라우트 처리 방식만 비교하도록 server.app과 같은 미들웨어(CORS, 메트릭, 요청 로깅)를 그대로 등록합니다.
+    """
+    legacy = FastAPI()
+    legacy.user_middleware = list(server.app.user_middleware)
+
+    @legacy.post("/mcp/call")
+    def mcp_call_tool(payload: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+        arguments = payload.get("arguments") or {}
+        users = server.validate_users(arguments.get("users"), "users")
+        radius, cuisine, max_results = server.extract_search_parameters(arguments)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            content = loop.run_until_complete(
+                server.service.search_meetup_restaurants(users, radius, cuisine, max_results)
+            )
+        finally:
+            loop.close()
+        return {"content": content, "isError": False}
+
+    return legacy
+
+
+async def run_load(app: FastAPI, total: int, concurrency: int) -> Dict[str, float]:
+    """동시 요청을 보내고 처리량/지연 시간 통계를 계산"""
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one() -> None:
+            nonlocal errors
+            async with semaphore:
+                started = time.perf_counter()
+                resp = await client.post("/mcp/call", json=PAYLOAD)
+                latencies.append(time.perf_counter() - started)
+                if resp.status_code != 200 or resp.json().get("isError"):
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 외부 API 지연 (초)")
+    args = parser.parse_args()
+
+    async def fake_search(users, radius=1000, cuisine=None, max_results=15, *_):
+        await asyncio.sleep(args.latency)
+        return {"midpoint": server.PlaceSearchService.compute_midpoint(users), "restaurants": []}
+
+    server.service.search_meetup_restaurants = fake_search
+
+    for label, app in (("legacy (sync + new loop)", build_legacy_app()), ("async", server.app)):
+        result = asyncio.run(run_load(app, args.requests, args.concurrency))
+        print(
+            f"{label:<26} rps={result['rps']:8.1f}  p50={result['p50_ms']:7.1f}ms  "
+            f"p99={result['p99_ms']:7.1f}ms  errors={result['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
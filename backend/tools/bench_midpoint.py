@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+중간 지점 계산 벤치마크
+합성 그룹(서울 근교 무작위 분포, 한 명만 멀리 떨어진 그룹)에 대해 모드별(centroid/median/minimax)
+계산 시간과 공정성 지표(이동 거리 합/최대/표준편차)를 비교합니다.
+
+실행:
+  cd backend
+  python tools/bench_midpoint.py --groups 200 --sizes 2,5,20,100,500
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "common"))
+
+from midpoint import GEOMETRIC_MODES, compute_midpoint, fairness
+
+SEOUL = (37.5665, 126.9780)
+
+
+def make_groups(size: int, count: int, outlier: bool, seed: int = 7) -> List[List[Dict[str, float]]]:
+    """서울 중심 반경 약 10km 안의 무작위 그룹 (outlier=True면 한 명을 30~60km 밖으로 이동)"""
+    rng = np.random.default_rng(seed + size * 2 + int(outlier))
+    groups = []
+    for _ in range(count):
+        lats = SEOUL[0] + rng.normal(0, 0.05, size)
+        lngs = SEOUL[1] + rng.normal(0, 0.06, size)
+        if outlier:
+            angle = rng.uniform(0, 2 * np.pi)
+            dist_deg = rng.uniform(0.3, 0.55)
+            lats[0] = SEOUL[0] + dist_deg * np.sin(angle)
+            lngs[0] = SEOUL[1] + dist_deg * np.cos(angle)
+        groups.append([{"lat": float(a), "lng": float(b)} for a, b in zip(lats, lngs)])
+    return groups
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=200, help="크기별 그룹 수")
+    parser.add_argument("--sizes", default="2,5,20,100,500", help="그룹 인원 수 목록 (쉼표 구분)")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    print(f"groups={args.groups} per size, distances in km (mean over groups)")
+    print(f"{'scenario':<14}{'mode':<10}{'ms/group':>10}{'total':>10}{'max':>9}{'std':>9}")
+    for outlier in (False, True):
+        for size in sizes:
+            groups = make_groups(size, args.groups, outlier)
+            scenario = f"{size}p{' +outlier' if outlier else ''}"
+            for mode in GEOMETRIC_MODES:
+                start = time.perf_counter()
+                midpoints = [compute_midpoint(users, mode) for users in groups]
+                elapsed_ms = (time.perf_counter() - start) / len(groups) * 1000
+                stats = [fairness(users, mp) for users, mp in zip(groups, midpoints)]
+                total = np.mean([s["total_m"] for s in stats]) / 1000
+                worst = np.mean([s["max_m"] for s in stats]) / 1000
+                std = np.mean([s["std_m"] for s in stats]) / 1000
+                print(f"{scenario:<14}{mode:<10}{elapsed_ms:>10.3f}{total:>10.2f}{worst:>9.2f}{std:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
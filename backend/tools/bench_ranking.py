@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+식당 후보 순위 벤치마크
+무작위 참가자/후보에 대해 NumPy 거리 행렬 + argpartition 순위(rank_places)와
+후보마다 Python 루프로 하버사인을 계산해 전체 정렬하는 방식의 시간을 비교합니다.
+
+실행:
+  cd backend
+  python tools/bench_ranking.py --users 2,10,50 --candidates 45,300,1000 --k 15
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "common"))
+
+from ranking import rank_places
+from spatial import haversine_m
+
+SEOUL = (37.5665, 126.9780)
+
+
+def make_case(users: int, candidates: int, seed: int = 17):
+    rng = random.Random(seed + users * 1000 + candidates)
+    people = [{"lat": SEOUL[0] + rng.gauss(0, 0.05), "lng": SEOUL[1] + rng.gauss(0, 0.06)} for _ in range(users)]
+    places = [{"place_id": str(i), "place_y": SEOUL[0] + rng.uniform(-0.03, 0.03),
+               "place_x": SEOUL[1] + rng.uniform(-0.03, 0.03)} for i in range(candidates)]
+    return people, places
+
+
+def rank_loop(users: List[Dict[str, float]], places: List[Dict[str, Any]], k: int) -> List[Dict[str, Any]]:
+    """비교용: 후보 × 참가자 이중 루프 + 전체 정렬 (rank_by="total", 제공자 순위 미반영)"""
+    scored = []
+    for place in places:
+        distances = [round(haversine_m(u["lat"], u["lng"], place["place_y"], place["place_x"])) for u in users]
+        scored.append((sum(distances), {**place, "user_distances": distances}))
+    scored.sort(key=lambda item: item[0])
+    return [place for _, place in scored[:k]]
+
+
+def timeit(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", default="2,10,50", help="참가자 수 목록 (쉼표 구분)")
+    parser.add_argument("--candidates", default="45,300,1000", help="후보 수 목록 (쉼표 구분)")
+    parser.add_argument("--k", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"k={args.k}, ms per ranking (mean over {args.repeat})")
+    print(f"{'users':>6}{'candidates':>12}{'loop+sort':>12}" + "".join(f"{o:>10}" for o in ("total", "max", "variance")))
+    for users in (int(u) for u in args.users.split(",") if u):
+        for candidates in (int(c) for c in args.candidates.split(",") if c):
+            people, places = make_case(users, candidates)
+            loop_ms = timeit(lambda: rank_loop(people, places, args.k), max(args.repeat // 10, 1))
+            numpy_ms = [timeit(lambda: rank_places(people, places, objective, args.k), args.repeat)
+                        for objective in ("total", "max", "variance")]
+            print(f"{users:>6}{candidates:>12}{loop_ms:>12.2f}" + "".join(f"{ms:>10.2f}" for ms in numpy_ms))
+
+
+if __name__ == "__main__":
+    main()
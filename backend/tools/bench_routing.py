@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+이동 시간 라우팅 벤치마크
+도시 규모의 합성 그래프(격자 도로 + 다리가 적은 강 + 빠른 지하철 노선)를 만들고, 무작위 그룹에 대해
+만남 노드 계산 시간(scipy / 순수 Python 동시 진행 Dijkstra)과 좌표 평균(centroid) 대비 이동 시간 공정성을 비교합니다.
+
+실행:
+  cd backend
+  python tools/bench_routing.py --grid 300 --people 10 --queries 20
+  python tools/bench_routing.py --grid 300 --backends scipy,heapq                # 순수 Python 대체 경로 포함
+  python tools/bench_routing.py --grid 300 --save ./data/synthetic_graph.npz   # ROUTING_GRAPH_FILE용 예시 파일
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "common"))
+
+from midpoint import compute_midpoint
+from routing import SCIPY_AVAILABLE, TravelGraph, lockstep_meeting_node, travel_fields
+from spatial import METERS_PER_DEG_LAT
+
+ORIGIN = (37.45, 126.85)  # 격자 남서쪽 모서리
+
+
+def make_city_graph(size: int, spacing_m: float = 100.0, seed: int = 11) -> TravelGraph:
+    """size x size 격자 도로 그래프
+    - 도로: 시속 15~40km 무작위 (양방향)
+    - 강: 가운데 행 사이 간선은 bridge_every 열마다 하나만 남김
+    - 지하철: 가로/세로 4개 노선, 10칸마다 역 (시속 60km, 역 간 간선)
+    """
+    rng = np.random.default_rng(seed)
+    lat_step = spacing_m / METERS_PER_DEG_LAT
+    lng_step = spacing_m / (METERS_PER_DEG_LAT * np.cos(np.radians(ORIGIN[0])))
+    rows, cols = np.divmod(np.arange(size * size), size)
+    node_lat = ORIGIN[0] + rows * lat_step
+    node_lng = ORIGIN[1] + cols * lng_step
+    node = np.arange(size * size).reshape(size, size)
+
+    src, dst = [], []
+    src.append(node[:, :-1].ravel())
+    dst.append(node[:, 1:].ravel())
+    river_row = size // 2
+    bridge_every = max(size // 6, 1)
+    vertical_src = node[:-1, :]
+    vertical_dst = node[1:, :]
+    keep = np.ones_like(vertical_src, dtype=bool)
+    keep[river_row, :] = (np.arange(size) % bridge_every) == bridge_every // 2
+    src.append(vertical_src[keep])
+    dst.append(vertical_dst[keep])
+    src = np.concatenate(src)
+    dst = np.concatenate(dst)
+    speed_ms = rng.uniform(15, 40, len(src)) / 3.6
+    times = [spacing_m / speed_ms]
+
+    # 지하철 노선 (강을 건너는 세로 노선 포함)
+    station_gap = 10
+    subway_src, subway_dst = [], []
+    for line in np.linspace(size // 8, size - size // 8, 4).astype(int):
+        stations = np.arange(0, size, station_gap)
+        subway_src += [node[line, stations[:-1]], node[stations[:-1], line]]
+        subway_dst += [node[line, stations[1:]], node[stations[1:], line]]
+    subway_src = np.concatenate(subway_src)
+    subway_dst = np.concatenate(subway_dst)
+    times.append(np.full(len(subway_src), station_gap * spacing_m / (60 / 3.6) + 30))  # 정차 30초
+
+    return TravelGraph(node_lat, node_lng, np.concatenate((src, subway_src)), np.concatenate((dst, subway_dst)),
+                       np.concatenate(times), bidirectional=True)
+
+
+def random_group(graph: TravelGraph, people: int, rng: np.random.Generator) -> List[Dict[str, float]]:
+    picks = rng.choice(graph.node_count, people, replace=False)
+    return [{"lat": float(graph.node_lat[i]), "lng": float(graph.node_lng[i])} for i in picks]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--grid", type=int, default=300, help="격자 한 변 노드 수 (300 → 9만 노드, 30km)")
+    parser.add_argument("--people", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--backends", default="scipy" if SCIPY_AVAILABLE else "heapq",
+                        help="비교할 탐색 방식 (scipy, heapq 쉼표 구분)")
+    parser.add_argument("--save", help="생성한 그래프를 .npz로 저장할 경로")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    graph = make_city_graph(args.grid)
+    print(f"graph: {graph.node_count:,} nodes, {graph.edge_count:,} edges "
+          f"(build {(time.perf_counter() - started) * 1000:.0f}ms)")
+    if args.save:
+        graph.save(args.save)
+        started = time.perf_counter()
+        TravelGraph.load(args.save)
+        print(f"saved {args.save} ({os.path.getsize(args.save) / 1e6:.1f}MB, load {(time.perf_counter() - started) * 1000:.0f}ms)")
+
+    rng = np.random.default_rng(5)
+    groups = [random_group(graph, args.people, rng) for _ in range(args.queries)]
+    backends = [b for b in args.backends.split(",") if b and (b != "scipy" or SCIPY_AVAILABLE)]
+    for objective in ("max", "total"):
+        print(f"\nobjective={objective} people={args.people} queries={args.queries}")
+        print(f"{'backend':<8}{'ms/query':>10}{'p95 ms':>9}{'max min':>10}{'total min':>11}"
+              f"{'centroid max':>14}{'centroid total':>16}")
+        for backend in backends:
+            elapsed, worst, total, c_worst, c_total = [], [], [], [], []
+            for users in groups:
+                sources, snap = graph.nearest_nodes([u["lat"] for u in users], [u["lng"] for u in users])
+                offsets = snap / 1.2
+                t0 = time.perf_counter()
+                if backend == "scipy":
+                    fields = travel_fields(graph, sources, offsets)
+                    score = fields.max(axis=0) if objective == "max" else fields.sum(axis=0)
+                    times = fields[:, int(score.argmin())]
+                else:
+                    fields = None
+                    _, times = lockstep_meeting_node(graph, sources, offsets, objective)
+                elapsed.append((time.perf_counter() - t0) * 1000)
+                worst.append(max(times) / 60)
+                total.append(sum(times) / 60)
+
+                # 비교: 좌표 평균 지점에서 가장 가까운 노드까지의 이동 시간
+                center = compute_midpoint(users, "centroid")
+                (center_node,), _ = graph.nearest_nodes([center["lat"]], [center["lng"]])
+                if fields is None and SCIPY_AVAILABLE:
+                    fields = travel_fields(graph, sources, offsets)
+                if fields is not None:
+                    c_worst.append(fields[:, center_node].max() / 60)
+                    c_total.append(fields[:, center_node].sum() / 60)
+            centroid = (f"{np.mean(c_worst):>14.1f}{np.mean(c_total):>16.1f}" if c_worst else f"{'-':>14}{'-':>16}")
+            print(f"{backend:<8}{np.mean(elapsed):>10.1f}{np.percentile(elapsed, 95):>9.1f}"
+                  f"{np.mean(worst):>10.1f}{np.mean(total):>11.1f}{centroid}")
+
+
+if __name__ == "__main__":
+    main()
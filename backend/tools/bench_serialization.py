@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+캐시 직렬화 벤치마크
+meetup_search 결과와 같은 모양의 값을 기존 방식(json.dumps 텍스트)과 Serializer 조합들로
+저장했을 때의 바이트 수와 인코딩/디코딩 시간을 비교합니다.
+
+실행:
+  cd backend
+  python tools/bench_serialization.py --restaurants 15 --iterations 2000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "common"))
+
+from serialization import MSGPACK_AVAILABLE, ZSTD_AVAILABLE, Serializer
+
+NAMES = ["설마중", "봉피양", "을지면옥", "우래옥", "하동관", "진진", "명동교자", "토속촌삼계탕"]
+CATEGORIES = ["음식점 > 한식 > 냉면", "음식점 > 한식 > 육류,고기", "음식점 > 중식 > 중화요리",
+              "음식점 > 일식 > 초밥,롤", "음식점 > 한식 > 해물,생선"]
+ROADS = ["서울 강남구 테헤란로", "서울 서초구 서초대로", "서울 중구 을지로", "서울 마포구 양화로"]
+
+
+def sample_result(count: int, seed: int = 3) -> Dict[str, Any]:
+    """search_meetup_restaurants 반환값과 같은 구조의 예시 데이터"""
+    rng = random.Random(seed)
+    restaurants = []
+    for i in range(count):
+        place_id = str(rng.randint(10_000_000, 99_999_999))
+        road = rng.choice(ROADS)
+        restaurants.append({
+            "place_id": place_id,
+            "place_name": f"{rng.choice(NAMES)} {i + 1}호점",
+            "place_url": f"http://place.map.kakao.com/{place_id}",
+            "place_phone": f"02-{rng.randint(100, 9999)}-{rng.randint(1000, 9999)}",
+            "place_address": f"{road.replace('로', '동')} {rng.randint(1, 999)}-{rng.randint(1, 99)}",
+            "place_road_address": f"{road} {rng.randint(1, 500)}",
+            "place_category": rng.choice(CATEGORIES),
+            "place_x": 127.0 + rng.random() / 10,
+            "place_y": 37.5 + rng.random() / 10,
+            "distance": str(rng.randint(50, 1500)),
+            "image_url": f"https://search.pstatic.net/common/?src=http%3A%2F%2Fblogfiles.naver.net%2F{place_id}.jpg",
+            "source": "kakao",
+        })
+    return {
+        "midpoint": {"lat": 37.4804, "lng": 127.04435, "address": "서울특별시 서초구 양재동 12-3",
+                     "road_address": "서울특별시 서초구 강남대로 201", "jibun_address": "서울특별시 서초구 양재동 12-3",
+                     "region1": "서울특별시", "region2": "서초구", "region3": "양재동"},
+        "users": [{"lat": 37.5665, "lng": 126.978}, {"lat": 37.3943, "lng": 127.1107}],
+        "restaurants": restaurants,
+        "source_stats": {"kakao": count, "naver": 0, "total": count},
+        "query": "한식 맛집",
+        "total_found": count,
+    }
+
+
+def codecs() -> List[Tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]]:
+    """비교할 (이름, 인코더, 디코더) 목록"""
+    result = [(
+        "legacy json text",
+        lambda v: json.dumps(v, ensure_ascii=False, default=str).encode("utf-8"),
+        lambda b: json.loads(b),
+    )]
+    combos = [("json", "none"), ("json", "zlib")]
+    if MSGPACK_AVAILABLE:
+        combos += [("msgpack", "none"), ("msgpack", "zlib")]
+        if ZSTD_AVAILABLE:
+            combos.append(("msgpack", "zstd"))
+    for fmt, compression in combos:
+        s = Serializer(fmt, compression, threshold=0)
+        result.append((f"{fmt}+{compression}", s.dumps, s.loads))
+    return result
+
+
+def measure(fn: Callable, arg: Any, iterations: int) -> float:
+    """호출당 평균 시간(마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(arg)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--restaurants", type=int, default=15)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    value = sample_result(args.restaurants)
+    print(f"restaurants={args.restaurants} iterations={args.iterations}"
+          f" (msgpack={'yes' if MSGPACK_AVAILABLE else 'no'}, zstd={'yes' if ZSTD_AVAILABLE else 'no'})")
+    print(f"{'codec':<18}{'bytes':>8}{'ratio':>8}{'encode µs':>12}{'decode µs':>12}")
+    baseline = None
+    for name, encode, decode in codecs():
+        data = encode(value)
+        assert decode(data) == json.loads(json.dumps(value, ensure_ascii=False))
+        baseline = baseline or len(data)
+        print(f"{name:<18}{len(data):>8}{len(data) / baseline:>8.2f}"
+              f"{measure(encode, value, args.iterations):>12.1f}{measure(decode, data, args.iterations):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+캐시 예열 도구
+요청 로그(meetup_server.log, 회전 파일 포함)나 검색 목록에서 자주 쓰인 중간 지점/요리/반경 조합을 골라
+Kakao 검색, 역지오코딩, 이미지 조회를 호출 예산 안에서 미리 실행하고 커버리지를 보고합니다.
+서버와 같은 Redis/환경변수(KAKAO_API_KEY, NAVER_CLIENT_ID 등)를 사용합니다.
+
+실행:
+  cd backend
+  python tools/warm_cache.py --dry-run                                  # 커버리지만 계산 (API 호출 없음)
+  python tools/warm_cache.py --log "./logs/meetup_server.log*" --top 50 --rate 2
+  python tools/warm_cache.py --queries ./data/warm_queries.jsonl --top 20
+  python tools/warm_cache.py --interval 3600                            # 1시간마다 반복
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "common"))
+
+from config import config
+from cache_warmer import CacheWarmer, hot_targets, load_calls
+
+
+def print_coverage(targets, coverage, limit: int) -> None:
+    print(f"calls={coverage['calls']} parsed={coverage['parsed']} combos={coverage['combos']} "
+          f"selected={coverage['selected']} cell_coverage={coverage['cell_coverage']:.1%} "
+          f"key_coverage={coverage['key_coverage']:.1%}")
+    print(f"{'count':>7}  {'lat':>10} {'lng':>11} {'radius':>7} {'max':>4} {'rank_by':>9}  cuisine")
+    for t in targets[:limit]:
+        print(f"{t['count']:>7}  {t['lat']:>10.5f} {t['lng']:>11.5f} {t['radius']:>7} {t['max_results']:>4} "
+              f"{t['rank_by']:>9}  {t['cuisine'] or '-'}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    # 서버 모듈(서비스, 캐시, HTTP 풀)은 실제 예열할 때만 불러옴
+    from server import service
+    from cache_manager import cache_manager
+    from http_client import http_client
+    from image_store import image_worker
+
+    warmer = CacheWarmer(args.log, args.queries, args.top, args.grid, args.rate, args.concurrency,
+                         args.interval, args.image_wait)
+    await http_client.start()
+    await cache_manager.connect()
+    if service.naver_headers:
+        image_worker.start(service.fetch_place_image)
+    try:
+        while True:
+            report = await warmer.run_once(service)
+            print(json.dumps(report, ensure_ascii=False))
+            if args.interval <= 0:
+                break
+            await asyncio.sleep(args.interval)
+    finally:
+        await image_worker.stop()
+        await cache_manager.close()
+        await http_client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--log", default=config.CACHE_WARM_LOG, help="요청 로그 glob 패턴")
+    parser.add_argument("--queries", default=config.CACHE_WARM_QUERIES, help="검색 목록 (JSON 배열 또는 JSON Lines)")
+    parser.add_argument("--top", type=int, default=config.CACHE_WARM_TOP, help="예열할 조합 수")
+    parser.add_argument("--grid", type=float, default=config.CACHE_WARM_GRID, help="조합을 묶을 격자 (도)")
+    parser.add_argument("--rate", type=float, default=config.CACHE_WARM_RATE, help="초당 예열 조합 수")
+    parser.add_argument("--concurrency", type=int, default=config.CACHE_WARM_CONCURRENCY)
+    parser.add_argument("--image-wait", type=float, default=config.CACHE_WARM_IMAGE_WAIT, help="조합당 이미지 조회 대기 (초)")
+    parser.add_argument("--interval", type=float, default=0, help="반복 주기 (초, 0이면 한 번)")
+    parser.add_argument("--dry-run", action="store_true", help="커버리지만 계산하고 예열하지 않음")
+    parser.add_argument("--show", type=int, default=20, help="--dry-run에서 출력할 조합 수")
+    args = parser.parse_args()
+
+    if args.dry_run:
+        targets, coverage = hot_targets(load_calls(args.log, args.queries), args.top, args.grid, config.MIDPOINT_MODE)
+        print_coverage(targets, coverage, args.show)
+        return
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()